@@ -39,3 +39,37 @@ class AbstractBag(AbstractCollection):
     def __str__(self):
         """Return string representation of self."""
         return '{' + ", ".join(map(str, self)) + '}'
+
+    # Mutators
+    def discard_many(self, items):
+        """
+        Remove one instance of each item in items that is in self, skipping
+        the others, and return the number of items removed. Each item is
+        removed on its own.
+        """
+        removed = 0
+        for item in items:
+            if item in self:
+                self.remove(item)
+                removed += 1
+        return removed
+
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true and return the
+        number of items removed. The kept items are gathered in one pass and
+        reloaded with add_all.
+        """
+        kept = [item for item in self if not pred(item)]
+        removed = len(self) - len(kept)
+        if removed:
+            self.clear()
+            self.add_all(kept)
+        return removed
+
+    def retain_if(self, pred):
+        """
+        Keep only the items in self for which pred(item) is true and return
+        the number of items removed.
+        """
+        return self.remove_if(lambda item: not pred(item))
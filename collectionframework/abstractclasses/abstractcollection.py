@@ -18,8 +18,15 @@ class AbstractCollection(object):
         """Initialize self, optionally including items in source_collection."""
         self.length = 0
         if source_collection:
-            for item in source_collection:
-                self.add(item)
+            self.add_all(source_collection)
+
+    @classmethod
+    def from_iterable(cls, iterable):
+        """
+        Return a new collection of type cls holding each item in iterable,
+        loaded through add_all.
+        """
+        return cls(iterable)
 
     # Accessors
     def __add__(self, other):
@@ -33,8 +40,7 @@ class AbstractCollection(object):
             raise TypeError("cannot concatenate bag with different type")
         # Instantiate new object of type self
         out = type(self)(self)
-        for item in other:
-            out.add(item)
+        out.add_all(other)
         return out
 
     def copy(self):
@@ -84,3 +90,12 @@ class AbstractCollection(object):
     def __str__(self):
         """Return the string representation of self."""
         return '[' + ", ".join(map(str, self)) + ']'
+
+    # Mutators
+    def add_all(self, iterable):
+        """
+        Add each item in iterable to self. Concrete classes override this
+        with a bulk load where one is cheaper than an add per item.
+        """
+        for item in iterable:
+            self.add(item)
@@ -13,12 +13,12 @@ from abstractclasses.abstractcollection import AbstractCollection
 
 class Entry:
     """Contain key-value pairs."""
+    __slots__ = ("key", "value")
 
     # Constructor
-    def __init__(self, key, value, probe_length = None):
+    def __init__(self, key, value):
         self.key = key
         self.value = value
-        self.probe_length = probe_length
 
     # Accessors
     def __repr__(self):
@@ -48,6 +48,19 @@ class AbstractDict(AbstractCollection):
                     value = next(value_iter)
                     self[key] = value
 
+    @classmethod
+    def from_iterable(cls, pairs):
+        """
+        Return a new dictionary of type cls holding each key-value pair in
+        pairs, an iterable of 2-tuples.
+        """
+        keys = []
+        values = []
+        for key, value in pairs:
+            keys.append(key)
+            values.append(value)
+        return cls(keys, values)
+
     # Accessors
     def __add__(self, other):
         """
@@ -136,3 +149,22 @@ class AbstractDict(AbstractCollection):
         """Return an iterator on the values in self."""
         return map(lambda key: self[key], self)
     
+
+    # Mutators
+    def remove_if(self, pred):
+        """
+        Remove every key in self for which pred(key, value) is true and
+        return the number of keys removed. The keys are gathered in one pass
+        and popped afterwards, so pred never sees self mid-change.
+        """
+        victims = [key for key in self if pred(key, self[key])]
+        for key in victims:
+            self.pop(key)
+        return len(victims)
+
+    def retain_if(self, pred):
+        """
+        Keep only the keys in self for which pred(key, value) is true and
+        return the number of keys removed.
+        """
+        return self.remove_if(lambda key, value: not pred(key, value))
@@ -49,6 +49,10 @@ class AbstractList(AbstractCollection):
         """Append item to self, increment length."""
         self.append(item)
 
+    def add_all(self, iterable):
+        """Append each item in iterable to self through extend."""
+        self.extend(iterable)
+
     def append(self, item):
         """Place item at end of self, increment length."""
         self.insert(len(self), item)
@@ -68,4 +72,25 @@ class AbstractList(AbstractCollection):
             raise KeyError("Cannot remove item that is not in list.")
         else:
             self.pop(index)
+
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true, keeping the
+        others in order, and return the number of items removed.
+        The kept items are gathered in one pass and extend reloads self with
+        them, which is O(n) for any list that appends in O(1).
+        """
+        kept = [item for item in self if not pred(item)]
+        removed = len(self) - len(kept)
+        if removed:
+            self.clear()
+            self.extend(kept)
+        return removed
+
+    def retain_if(self, pred):
+        """
+        Keep only the items in self for which pred(item) is true and return
+        the number of items removed.
+        """
+        return self.remove_if(lambda item: not pred(item))
     
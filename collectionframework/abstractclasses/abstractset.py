@@ -8,7 +8,14 @@ Exports:
 """
 
 class AbstractSet:
-    """Store code for implementation-agnostic set methods."""
+    """
+    Store code for implementation-agnostic set methods.
+
+    The set operations make one membership test per item of one operand, so
+    they take O(n + m) time for sets with O(1) membership, such as HashSet.
+    Intersection probes from the smaller operand, and results are loaded
+    with add_distinct, which skips the duplicate check of add.
+    """
 
     # Accessors
     def __and__(self, other):
@@ -21,10 +28,11 @@ class AbstractSet:
             msg = "Cannot take intersection of objects with different types."
             raise TypeError(msg)
         else:
+            smaller, larger = (self, other) if len(self) <= len(other) \
+                              else (other, self)
             intersection = type(self)()
-            for item in self:
-                if item in other:
-                    intersection.add(item)
+            intersection.add_distinct([item for item in smaller
+                                       if item in larger])
             return intersection
 
     def __eq__(self, other):
@@ -40,7 +48,7 @@ class AbstractSet:
                 if not item in other:
                     return False
             return True
-        
+
     def is_subset(self, other):
         """
         Return True if self is a subset of other.
@@ -50,6 +58,8 @@ class AbstractSet:
         if type(self) != type(other):
             msg = "Cannot check if self is subset of object with different type."
             raise TypeError(msg)
+        elif len(self) > len(other):
+            return False
         else:
             for item in self:
                 if not item in other:
@@ -66,7 +76,10 @@ class AbstractSet:
             msg = "Cannot take union of objects with different types."
             raise TypeError(msg)
         else:
-            return self + other
+            # The copy of self is a bulk load; only other's items are checked
+            union = self.copy()
+            union.add_all(other)
+            return union
 
     def __sub__(self, other):
         """
@@ -79,7 +92,45 @@ class AbstractSet:
             raise TypeError(msg)
         else:
             difference = type(self)()
-            for item in self:
-                if not item in other:
-                    difference.add(item)
+            difference.add_distinct([item for item in self
+                                     if not item in other])
+            return difference
+
+    def __xor__(self, other):
+        """
+        Return symmetric difference of self and other. Items in exactly one
+        of self and other.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take symmetric difference of objects with different types."
+            raise TypeError(msg)
+        else:
+            # The two differences share no items
+            difference = self - other
+            difference.add_distinct(other - self)
             return difference
+
+    # Mutators
+    def add_all(self, iterable):
+        """
+        Add each item in iterable to self one at a time, so that add drops
+        the duplicates, rather than through the bulk load of a bag. An empty
+        self copying a set of its own type, whose items are already distinct,
+        takes the bulk load instead.
+        """
+        if self.is_empty() and type(iterable) == type(self):
+            self.add_distinct(iterable)
+        else:
+            for item in iterable:
+                self.add(item)
+
+    def add_distinct(self, items):
+        """
+        Add items to self through the add_all of the bag class self is built
+        on, skipping the duplicate check of add.
+        Precondition: items are distinct from each other and from every item
+                      in self.
+        """
+        super(AbstractSet, self).add_all(items)
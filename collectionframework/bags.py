@@ -7,36 +7,63 @@ Exports:
     ArrayBag: Bag ADT implementation using an array.
     
     ArraySortedBag: Sorted bag ADT implementation using an array.
+
+    HashBag: Bag ADT implementation using a hash table of item counts.
     
     LinkedBag: Bag ADT implementation using a linked list.
 """
 
+from operator import lt as less_than
 from abstractclasses.abstractbag import AbstractBag
+from dicts import HashDict
 from dynamicarray import Array
+from heaps import ArrayHeap
 from lists import DoublyLinkedList
+from sorting import gallop_left, gallop_right, sort_sequence
 
 class ArrayBag(AbstractBag):
-    """Implement bag ADT using an array."""
+    """
+    Implement bag ADT using an array.
+
+    By default remove shifts every later item left, so the items stay in
+    the order they were added. A bag made with ordered False fills the gap
+    with its last item instead, which makes removal O(1) after the search
+    for the item, at the cost of that order.
+    """
     default_capacity = 10
 
-    def __init__(self, source_collection = None):
-        """Initialize self, optionally including items in source_collection."""
-        self.items = Array(ArrayBag.default_capacity)
+    def __init__(self, source_collection = None, typecode = None,
+                 policy = None, storage = None, ordered = True):
+        """
+        Initialize self, optionally including items in source_collection.
+        Pass typecode to store items in a typed, compact array and policy to
+        control how it resizes. Pass storage, such as a SegmentedArray, to
+        keep items in that array instead. Pass ordered False to let removals
+        reorder the items.
+        Precondition: storage must be empty.
+        Raises: ValueError
+        """
+        if storage is None:
+            storage = Array(ArrayBag.default_capacity, typecode = typecode,
+                            policy = policy)
+        elif storage.size() != 0:
+            raise ValueError(f"{type(self).__name__} storage must be empty.")
+        self.items = storage
         self.position = -1
+        self.ordered = ordered
         AbstractBag.__init__(self, source_collection)
         
     # Accessors
     def __contains__(self, item):
         """
         Return True if item in self, set self.position to index.
-        Else return False.
+        Else return False. Scans the underlying array with its own iterator.
         """
         self.position = -1
-        for obj in self:
-            self.position += 1
+        for index, obj in enumerate(self.items):
             if item == obj:
+                self.position = index
                 return True
-        self.position = -1
         return False
     
     def __iter__(self):
@@ -51,7 +78,7 @@ class ArrayBag(AbstractBag):
         """Empty self, reset length to 0 and position tracker to -1."""
         self.length = 0
         self.position = -1
-        self.items = Array(ArrayBag.default_capacity)
+        self.items.clear()
 
     def add(self, item):
         """
@@ -63,6 +90,43 @@ class ArrayBag(AbstractBag):
         self.items[self.items.size()] = item
         self.length += 1
 
+    def add_all(self, iterable):
+        """
+        Add each item in iterable to self with one bulk fill of the underlying
+        array, which grows at most once.
+        """
+        self.items.extend(iterable)
+        self.length = self.items.size()
+
+    def discard_many(self, items):
+        """
+        Remove one instance of each item in items that is in self, skipping
+        the others, and return the number of items removed. The items to
+        remove are counted in a HashBag and the kept items gathered in one
+        O(n) pass before self is rewritten, keeping their order. If an item
+        in items or in self is unhashable, self is left untouched by that
+        pass and each item is removed on its own instead.
+        """
+        items = list(items)
+        try:
+            victims = HashBag(items)
+            kept = []
+            for item in self.items:
+                if item in victims:
+                    victims.remove(item)
+                else:
+                    kept.append(item)
+        except TypeError:
+            return AbstractBag.discard_many(self, items)
+        removed = len(self) - len(kept)
+        if removed:
+            for index, item in enumerate(kept):
+                self.items[index] = item
+            self.items.truncate(len(kept))
+            self.length = len(kept)
+            self.position = -1
+        return removed
+
     def remove(self, item):
         """
         Remove item from self, decrement length.
@@ -76,9 +140,14 @@ class ArrayBag(AbstractBag):
         
         # Remove target item
         i = self.position + 1
-        while i < self.items.size():
-            self.items[i - 1] = self.items[i]
-            i += 1
+        if self.ordered:
+            while i < self.items.size():
+                self.items[i - 1] = self.items[i]
+                i += 1
+        else:
+            # Move the last item into the gap instead of shifting the rest
+            i = self.items.size()
+            self.items[self.position] = self.items[i - 1]
         # i is now self.items.size()
         self.items[i - 1] = self.items.fill_value
 
@@ -89,10 +158,84 @@ class ArrayBag(AbstractBag):
         # Decrement length
         self.length -= 1
 
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true, keeping the
+        others in order, in O(n) time that moves each kept item at most once.
+        Return the number of items removed. pred is called on every item
+        before any is moved, so self is unchanged if it raises.
+        """
+        items = self.items
+        doomed = [pred(item) for item in items]
+        kept = 0
+        for index, victim in enumerate(doomed):
+            if not victim:
+                items[kept] = items[index]
+                kept += 1
+        removed = len(self) - kept
+        items.truncate(kept)
+        self.length = kept
+        self.position = -1
+        return removed
+
+    def reserve(self, capacity):
+        """Reserve room for capacity items, as in Array.reserve."""
+        self.items.reserve(capacity)
+
+    def shrink_to_fit(self):
+        """Release unused capacity, as in Array.shrink_to_fit."""
+        self.items.shrink_to_fit()
+
 
 class ArraySortedBag(ArrayBag):
-    
+    """
+    Implement sorted bag ADT using an array, inheriting from ArrayBag.
+
+    The multiset operations walk both sorted arrays in one merge. Each step
+    gallops over a whole block of items found in only one operand, or over
+    a run of equal items, so a merge costs O(k log(n / k)) comparisons for
+    operands of sizes k <= n, plus the time to copy the result in bulk.
+    """
+
+    def __init__(self, source_collection = None, typecode = None,
+                 policy = None, storage = None):
+        """
+        Initialize self as an ArrayBag whose removals always keep the items
+        in sorted order.
+        """
+        ArrayBag.__init__(self, source_collection, typecode, policy, storage)
+
     # Accessors
+    def __and__(self, other):
+        """
+        Return the intersection of self and other, holding each item as many
+        times as the smaller of its counts in self and other.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take intersection of objects with different types."
+            raise TypeError(msg)
+        return self.merge(other, min)
+
+    def check_comparable(self, item):
+        """
+        Raise TypeError unless item can be compared with itself and with the
+        items already in self.
+        """
+        try:
+            item < item
+        except TypeError:
+            msg = f"{type(self).__name__} must only contain items that support comparison."
+            raise TypeError(msg)
+
+        if not self.is_empty():
+            try:
+                item < self.items[0]
+            except TypeError:
+                msg = f"{item} does not support comparison with bag element: {self.items[0]}."
+                raise TypeError(msg)
+
     def __contains__(self, item):
         """
         Determine if self contains item.
@@ -132,6 +275,104 @@ class ArraySortedBag(ArrayBag):
                     return False
         return True
 
+    def is_subset(self, other):
+        """
+        Return True if every item of self is in other at least as many times,
+        else return False.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot check if self is subset of object with different type."
+            raise TypeError(msg)
+        elif len(self) > len(other):
+            return False
+        for i, i_end, j, j_end in self.merge_blocks(other):
+            if i_end - i > j_end - j:
+                return False
+        return True
+
+    def merge(self, other, keep):
+        """
+        Return a bag of the type of self holding each item keep(a, b) times,
+        where a and b are its counts in self and other, loaded in bulk from
+        one merge of the two sorted arrays. Copies are taken from self first.
+        """
+        merged = []
+        for i, i_end, j, j_end in self.merge_blocks(other):
+            count = keep(i_end - i, j_end - j)
+            if count > 0:
+                taken = min(count, i_end - i)
+                merged.extend(self.items[i:i + taken])
+                merged.extend(other.items[j:j + count - taken])
+        out = type(self)()
+        ArrayBag.add_all(out, merged)
+        return out
+
+    def merge_blocks(self, other):
+        """
+        Yield (i, i_end, j, j_end) for consecutive blocks of the merge of self
+        and other, where self.items[i:i_end] and other.items[j:j_end] are
+        either a run of items equal to each other or, with one range empty,
+        the items of one operand that come before the next item of the other.
+        Each block is found by galloping from its start.
+        """
+        a, b = self.items, other.items
+        n, m = len(self), len(other)
+        i = j = 0
+        while i < n and j < m:
+            if a[i] < b[j]:
+                i_end = gallop_left(b[j], a, i, n, less_than)
+                yield i, i_end, j, j
+                i = i_end
+            elif b[j] < a[i]:
+                j_end = gallop_left(a[i], b, j, m, less_than)
+                yield i, i, j, j_end
+                j = j_end
+            else:
+                i_end = gallop_right(a[i], a, i, n, less_than)
+                j_end = gallop_right(a[i], b, j, m, less_than)
+                yield i, i_end, j, j_end
+                i, j = i_end, j_end
+        if i < n or j < m:
+            yield i, n, j, m
+
+    def __or__(self, other):
+        """
+        Return the union of self and other, holding each item as many times
+        as the larger of its counts in self and other.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take union of objects with different types."
+            raise TypeError(msg)
+        return self.merge(other, max)
+
+    def __sub__(self, other):
+        """
+        Return the difference of self and other, holding each item as many
+        times as its count in self exceeds its count in other.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take difference of objects with different types."
+            raise TypeError(msg)
+        return self.merge(other, lambda a, b: a - b)
+
+    def __xor__(self, other):
+        """
+        Return the symmetric difference of self and other, holding each item
+        as many times as its counts in self and other differ.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take symmetric difference of objects with different types."
+            raise TypeError(msg)
+        return self.merge(other, lambda a, b: abs(a - b))
+
     # Mutators  
     def add(self, item):
         """
@@ -141,21 +382,8 @@ class ArraySortedBag(ArrayBag):
         Postcondition: self is sorted.
         """
 
-        # Check comparable item
-        try:
-            item < item
-        except TypeError:
-            msg = f"{type(self).__name__} must only contain items that support comparison."
-            raise TypeError(msg)
+        self.check_comparable(item)
 
-        # Check item comparable with items in bag already
-        if not self.is_empty():
-            try:
-                item < self.items[0]
-            except TypeError:
-                msg = f"{item} does not support comparison with bag element: {self.items[0]}."
-                raise TypeError(msg)
-        
         # Binary search for index position
         left = 0
         right = len(self) - 1
@@ -189,6 +417,206 @@ class ArraySortedBag(ArrayBag):
         self.items[insert_index] = item
         self.length += 1
 
+    def add_all(self, iterable):
+        """
+        Add each item in iterable to self. The new items are sorted on their
+        own, appended and merged with the old ones in one O(n log n) pass,
+        instead of one O(n) insertion per item.
+        Raises: TypeError if the items cannot be compared.
+        Postcondition: self is sorted.
+        """
+        new_items = list(iterable)
+        if not new_items:
+            return
+
+        # Sorting first raises any TypeError before self is changed
+        sort_sequence(new_items, len(new_items))
+        self.check_comparable(new_items[0])
+
+        ArrayBag.add_all(self, new_items)
+        sort_sequence(self.items, len(self))
+
+class HashBag(AbstractBag):
+    """
+    Implement bag ADT using a HashDict that maps each distinct item to the
+    number of times it is in self.
+
+    add, remove, count and membership are O(1) on average, and equality and
+    the multiset operations take time in the number of distinct items rather
+    than the number of items. Copies of an item are iterated together, in
+    no particular order. Items must be hashable.
+    """
+
+    def __init__(self, source_collection = None):
+        """Initialize self, optionally including items in source_collection."""
+        self.counts = HashDict()
+        AbstractBag.__init__(self, source_collection)
+
+    # Accessors
+    def __and__(self, other):
+        """
+        Return the intersection of self and other, holding each item as many
+        times as the smaller of its counts in self and other.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take intersection of objects with different types."
+            raise TypeError(msg)
+        # Only the items of the smaller bag can be in both
+        if len(other.counts) < len(self.counts):
+            self, other = other, self
+        out = type(self)()
+        for entry in self.counts.entries():
+            out.set_count(entry.key, min(entry.value, other.count(entry.key)))
+        return out
+
+    def __contains__(self, item):
+        """Return True if item in self, else return False."""
+        return item in self.counts
+
+    def copy(self):
+        """
+        Return a copy of self, made one distinct item at a time into a table
+        reserved up front.
+        """
+        out = type(self)()
+        out.counts.reserve(len(self.counts))
+        for entry in self.counts.entries():
+            out.set_count(entry.key, entry.value)
+        return out
+
+    def count(self, item):
+        """Return number of instances of item in self."""
+        return self.counts.get(item, 0)
+
+    def __eq__(self, other):
+        """
+        Return True if self and other are of same type and hold each item the
+        same number of times, else return False.
+        """
+        if self is other:
+            return True
+        elif type(self) != type(other):
+            return False
+        elif len(self) != len(other) or len(self.counts) != len(other.counts):
+            return False
+        else:
+            for entry in self.counts.entries():
+                if other.count(entry.key) != entry.value:
+                    return False
+            return True
+
+    def __iter__(self):
+        """Support iteration over self, visiting each copy of an item."""
+        for entry in self.counts.entries():
+            for _ in range(entry.value):
+                yield entry.key
+
+    def most_common(self, k = None):
+        """
+        Return a list of (item, count) pairs for the k items in self with
+        the highest counts, or for every item if k is None, highest first.
+        A heap of the best k seen so far makes this O(d log k) for d distinct
+        items. Items with equal counts come in iteration order.
+        """
+        entries = list(self.counts.entries())
+        if k is None:
+            k = len(entries)
+
+        # Heap entries are (count, -position), so the root is the weakest
+        # candidate and items themselves are never compared
+        heap = ArrayHeap()
+        for position, entry in enumerate(entries):
+            heap.add((entry.value, -position))
+            if len(heap) > k:
+                heap.pop()
+
+        out = []
+        while not heap.is_empty():
+            count, position = heap.pop()
+            out.append((entries[-position].key, count))
+        out.reverse()
+        return out
+
+    def __or__(self, other):
+        """
+        Return the union of self and other, holding each item as many times
+        as the larger of its counts in self and other.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take union of objects with different types."
+            raise TypeError(msg)
+        out = self.copy()
+        for entry in other.counts.entries():
+            if entry.value > out.count(entry.key):
+                out.set_count(entry.key, entry.value)
+        return out
+
+    def __sub__(self, other):
+        """
+        Return the difference of self and other, holding each item as many
+        times as its count in self exceeds its count in other.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take difference of objects with different types."
+            raise TypeError(msg)
+        out = type(self)()
+        for entry in self.counts.entries():
+            out.set_count(entry.key, entry.value - other.count(entry.key))
+        return out
+
+    # Mutators
+    def add(self, item):
+        """Add item to self, increment length."""
+        self.counts[item] = self.counts.get(item, 0) + 1
+        self.length += 1
+
+    def clear(self):
+        """Empty self, reset length to 0."""
+        self.counts = HashDict()
+        self.length = 0
+
+    def remove(self, item):
+        """
+        Remove one instance of item from self, decrement length.
+        Precondition: Item is in self.
+        Raises: ValueError if item is not in self.
+        Postcondition: self holds one fewer instance of item.
+        """
+        count = self.count(item)
+        if count == 0:
+            raise ValueError("HashBag.remove(x): x not in HashBag")
+        self.set_count(item, count - 1)
+
+    def remove_if(self, pred):
+        """
+        Remove every instance of each item in self for which pred(item) is
+        true, calling pred once per distinct item. Return the number of items
+        removed.
+        """
+        before = len(self)
+        self.counts.remove_if(lambda item, count: pred(item))
+        self.length = sum(self.counts.values())
+        return before - len(self)
+
+    def set_count(self, item, count):
+        """
+        Make self hold item exactly count times, or not at all if count is 0
+        or less, adjusting length to match.
+        """
+        old_count = self.count(item)
+        if count > 0:
+            self.counts[item] = count
+        elif old_count:
+            self.counts.pop(item)
+        self.length += max(count, 0) - old_count
+
+
 class LinkedBag(AbstractBag):
     """Implement bag ADT using a linked list."""
 
@@ -249,4 +677,14 @@ class LinkedBag(AbstractBag):
         self.items.pop(self.position)
 
         # Decrement length
-        self.length -= 1
\ No newline at end of file
+        self.length -= 1
+
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true in one pass
+        over the underlying list. Return the number of items removed.
+        """
+        removed = self.items.remove_if(pred)
+        self.length -= removed
+        self.position = -1
+        return removed
@@ -10,13 +10,22 @@ from abstractclasses.abstractcollection import AbstractCollection
 from queues import DoublyLinkedQueue
 from stacks import DoublyLinkedStack
 from nodes import BSTNode
+from sorting import sort_sequence
 
 class LinkedBST(AbstractCollection):
     """Implement the BST ADT according to BST interface using linked nodes."""
 
     # Constructor
-    def __init__(self, source_collection = None):
-        """Initialize self, optionally add items from source_collection."""
+    def __init__(self, source_collection = None, pool = None):
+        """
+        Initialize self, optionally add items from source_collection.
+        Pass a NodePool of BSTNodes to recycle nodes between adds and removes.
+        Precondition: pool must hold nodes of type BSTNode.
+        Raises: TypeError
+        """
+        if pool is not None and pool.node_type is not BSTNode:
+            raise TypeError("LinkedBST needs a pool of BSTNode.")
+        self.pool = pool
         self.root = None
         AbstractCollection.__init__(self, source_collection)
 
@@ -215,19 +224,19 @@ class LinkedBST(AbstractCollection):
         def recurse(node):
             if item < node.data:
                 if node.left == None:
-                    node.left = BSTNode(item)
+                    node.left = self.new_node(item)
                 else:
                     return recurse(node.left)
             elif item > node.data:
                 if node.right == None:
-                    node.right = BSTNode(item)
+                    node.right = self.new_node(item)
                 else:
                     return recurse(node.right)
             else:
                 return False
 
         if self.is_empty():
-            self.root = BSTNode(item)
+            self.root = self.new_node(item)
             self.length += 1
         else:
             insertion_made = recurse(self.root)
@@ -236,11 +245,99 @@ class LinkedBST(AbstractCollection):
                 
             
 
+    def add_all(self, iterable):
+        """
+        Add each item in iterable to self. A batch at least as large as self
+        is merged with the items of self and rebuilt as a balanced tree in
+        O(n log n), rather than added one item at a time, which degrades to
+        a linked list when the items arrive sorted. A smaller batch is added
+        an item at a time in O(k log n), middle items first so that the new
+        items do not form a long chain. Duplicates are dropped as in add.
+        Precondition: Items must be comparable with each other and with the
+                      items in self.
+        Raises: TypeError
+        """
+        new_items = list(iterable)
+        if not new_items:
+            return
+
+        # Sorting first raises any TypeError before self is changed
+        try:
+            sort_sequence(new_items, len(new_items))
+            new_items[0] < new_items[0]
+            if not self.is_empty():
+                new_items[0] < self.root.data
+        except TypeError:
+            raise TypeError("Cannot add non-comparable objects to BST")
+
+        if len(new_items) < len(self):
+            self.add_middle_first(new_items, 0, len(new_items))
+            return
+
+        # Merge with the items already in self, which form a sorted run
+        items = list(self.inorder()) + new_items
+        sort_sequence(items, len(items))
+        unique = [items[0]]
+        for item in items:
+            if item != unique[-1]:
+                unique.append(item)
+
+        self.clear()
+        self.root = self.build(unique, 0, len(unique))
+        self.length = len(unique)
+
+    def add_middle_first(self, items, low, high):
+        """
+        Add items[low:high] to self one at a time, the middle item first and
+        then each half the same way, so that sorted items spread out as they
+        would in a balanced tree.
+        Precondition: items is sorted.
+        """
+        if low >= high:
+            return
+        mid = (low + high) // 2
+        self.add(items[mid])
+        self.add_middle_first(items, low, mid)
+        self.add_middle_first(items, mid + 1, high)
+
+    def build(self, items, low, high):
+        """
+        Return the root of a balanced subtree holding items[low:high], each
+        subtree rooted at its middle item.
+        Precondition: items is sorted with no duplicates.
+        """
+        if low >= high:
+            return None
+        mid = (low + high) // 2
+        node = self.new_node(items[mid])
+        node.left = self.build(items, low, mid)
+        node.right = self.build(items, mid + 1, high)
+        return node
+
     def clear(self):
         """Remove all items from self, set length to 0."""
+        if self.pool is not None:
+            node_stack = [self.root]
+            while node_stack:
+                node = node_stack.pop()
+                if node:
+                    node_stack.append(node.left)
+                    node_stack.append(node.right)
+                    self.free_node(node)
         self.length = 0
         self.root = None
 
+    def free_node(self, node):
+        """Hand a node unlinked from self back to self's pool, if any."""
+        if self.pool is not None:
+            self.pool.release(node)
+
+    def new_node(self, item):
+        """Return a node holding item, taken from self's pool if any."""
+        if self.pool is not None:
+            return self.pool.acquire(item)
+        return BSTNode(item)
+
     def remove(self, item):
         """
         Remove item from self, decrement length.
@@ -265,7 +362,8 @@ class LinkedBST(AbstractCollection):
 
         # If target node has two children, replace with the largest value in the left
         # subtree and delete that value from the left subtree
-        if node.left and node.right:
+        two_children = node.left is not None and node.right is not None
+        if two_children:
             lmax_node = node.left
             lmax_parent = node
             while lmax_node.right:
@@ -282,10 +380,13 @@ class LinkedBST(AbstractCollection):
             # Therefore make max node's parent's right point to max node's left. 
             elif lmax_node.left and lmax_node is not node.left:
                 lmax_parent.right = lmax_node.left
-            # There is no left to take max node's place, so parent's right points to
-            # None
+            # There is no left to take max node's place, so the link to max node
+            # points to None
+            elif lmax_node is node.left:
+                node.left = None
             else:
                 lmax_parent.right = None
+            self.free_node(lmax_node)
                 
         # If target node only has left child, point parent's old connection toward
         # node's left child.
@@ -319,5 +420,30 @@ class LinkedBST(AbstractCollection):
             else:
                 self.root = None
 
+        # Two-child targets keep their node and free the max node instead
+        if not two_children:
+            self.free_node(node)
+
         # Decrement length
         self.length -= 1
+
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true and rebuild the
+        rest as a balanced tree, O(n) in all. Return the number of items
+        removed.
+        """
+        kept = [item for item in self.inorder() if not pred(item)]
+        removed = len(self) - len(kept)
+        if removed:
+            self.clear()
+            self.root = self.build(kept, 0, len(kept))
+            self.length = len(kept)
+        return removed
+
+    def retain_if(self, pred):
+        """
+        Keep only the items in self for which pred(item) is true and return
+        the number of items removed.
+        """
+        return self.remove_if(lambda item: not pred(item))
@@ -6,9 +6,11 @@ Exports:
     ArrayDict: Array implementation of dictionary.
 
     HashDict: Hash table implementation of dictionary.
+
+    HashEntry: Entry that also records its probe length for HashDict.
 """
 
-from dynamicarray import Array
+from dynamicarray import Array, GrowthPolicy
 from abstractclasses.abstractdict import Entry, AbstractDict
 
 class ArrayDict(AbstractDict):
@@ -80,6 +82,25 @@ class ArrayDict(AbstractDict):
 
         return return_val
 
+    def remove_if(self, pred):
+        """
+        Remove every key in self for which pred(key, value) is true, keeping
+        the other entries in order, in O(n) time that moves each kept entry
+        at most once. Return the number of keys removed. pred is called on
+        every entry before any is moved, so self is unchanged if it raises.
+        """
+        items = self.items
+        doomed = [pred(entry.key, entry.value) for entry in items]
+        kept = 0
+        for index, victim in enumerate(doomed):
+            if not victim:
+                items[kept] = items[index]
+                kept += 1
+        removed = len(self) - kept
+        items.truncate(kept)
+        self.length = kept
+        return removed
+
     def __setitem__(self, key, new_value):
         """
         If key is in self, replace its value with the argument passed, else
@@ -102,15 +123,27 @@ class ArrayDict(AbstractDict):
             # Increment length
             self.length += 1
 
+class HashEntry(Entry):
+    """Contain a key-value pair and its distance from its home index."""
+    __slots__ = ("probe_length",)
+
+    # Constructor
+    def __init__(self, key, value, probe_length = 0):
+        Entry.__init__(self, key, value)
+        self.probe_length = probe_length
+
 class HashDict(AbstractDict):
     """Implement dictionary using a hash table."""
     default_capacity = 13
+    load_factor = 0.9
     
     # Constructor
-    def __init__(self, keys = None, values = None, capacity = None):
+    def __init__(self, keys = None, values = None, capacity = None,
+                 policy = None):
         """
         Instantiate self and initialize with keys and values from constructor
-        arguments, if present.
+        arguments, if present. policy is a GrowthPolicy whose factor sets how
+        much the table grows on each rehash.
         Precondition: keys and values must be iterables with same length
         Raises: ValueError
         """
@@ -121,20 +154,33 @@ class HashDict(AbstractDict):
             self.capacity = capacity
         else:
             self.capacity = HashDict.default_capacity
+        self.policy = policy if policy is not None else GrowthPolicy()
         self.items = Array(capacity = self.capacity)
+        # Size the table for every key up front instead of rehashing as it fills
+        if keys and values:
+            self.reserve(len(keys))
         AbstractDict.__init__(self, keys, values)
 
     # Accessors
+    def capacity_for(self, count):
+        """Return the smallest table capacity holding count keys under the load factor."""
+        return int(count / HashDict.load_factor) + 1
+
     def __contains__(self, key):
         """Return True if key is in self, else return False."""
         self.position = -1
         index = abs(hash(key)) % self.items.capacity
         i = 0
         while (self.items[index + i] is not None and i < self.items.capacity):
-            if self.items[index + i] != "_del_":
-                if self.items[index + i].key == key:
+            entry = self.items[index + i]
+            if entry != "_del_":
+                if entry.key == key:
                     self.position = index + i
                     return True
+                # Robin Hood insertion would have put key ahead of any entry
+                # closer to its home, so key cannot be further along
+                elif entry.probe_length < i:
+                    return False
             i += 1
             
             # Wrap around to first item in array, keep i value for stop cond.
@@ -156,16 +202,32 @@ class HashDict(AbstractDict):
             # Containment search cached position of found object
             return self.items[self.position].value
         
+    def entries(self):
+        """
+        Return an iterator on copies of the entries in self, read straight
+        from the table rather than looked up key by key.
+        """
+        for entry in self.items:
+            if entry is not None and entry != "_del_":
+                yield Entry(entry.key, entry.value)
+
     def __iter__(self):
         """Return an iterator on the keys in self."""
         for entry in self.items:
             if entry is not None and entry != "_del_":
                 yield entry.key
 
+    def values(self):
+        """Return an iterator on the values in self, read from the table."""
+        for entry in self.items:
+            if entry is not None and entry != "_del_":
+                yield entry.value
+
     # Mutators
     def clear(self):
         """Remove every item in self and set length to 0."""
-        self.items = Array(capacity = 13)
+        self.capacity = HashDict.default_capacity
+        self.items = Array(capacity = self.capacity)
         self.length = 0
 
     def pop(self, key, default_value = None):
@@ -178,22 +240,73 @@ class HashDict(AbstractDict):
         else:
             # Containment search cached position of found object
             return_val = self.items[self.position].value
-            # Reserved placeholder value so that __contains__ knows to keep looking after _del_
-            self.items[self.position] = "_del_"
+
+            # Shift the displaced entries that follow back one slot each, so
+            # no placeholder is left to break the Robin Hood order that lets
+            # __contains__ stop early
+            capacity = self.items.capacity
+            hole = self.position
+            following = (hole + 1) % capacity
+            while (self.items[following] is not None and
+                   self.items[following].probe_length > 0):
+                entry = self.items[following]
+                entry.probe_length -= 1
+                self.items[hole] = entry
+                hole = following
+                following = (following + 1) % capacity
+            self.items[hole] = None
             self.length -= 1
-            
+
         return return_val
 
-    def rehash(self):
+    def rehash(self, capacity = None):
         """
-        Copy contents of self.items into a larger array and rehash contents
-        based on the new, larger capacity.
+        Copy contents of self.items into an array with the given capacity and
+        rehash contents based on the new capacity. By default the capacity
+        grows by the factor of self's growth policy.
         """
-        temp = HashDict(capacity = self.capacity * 2)
+        if capacity is None:
+            capacity = self.policy.grown_capacity(self.capacity,
+                                                  self.capacity + 1)
+        temp = HashDict(capacity = capacity, policy = self.policy)
         for key in self:
             temp[key] = self[key]
         self.items = temp.items
-        self.capacity = self.capacity * 2
+        self.capacity = capacity
+        self.max_probe_length = temp.max_probe_length
+
+    def remove_if(self, pred):
+        """
+        Remove every key in self for which pred(key, value) is true, then
+        rehash once to clear out the placeholders left behind. Return the
+        number of keys removed. pred is called on every entry before any is
+        marked, so self is unchanged if it raises.
+        """
+        items = self.items
+        victims = [index for index, entry in enumerate(items)
+                   if entry is not None and entry != "_del_" and
+                   pred(entry.key, entry.value)]
+        for index in victims:
+            items[index] = "_del_"
+        removed = len(victims)
+        if removed:
+            self.length -= removed
+            self.rehash(self.capacity)
+        return removed
+
+    def reserve(self, count):
+        """
+        Rehash once so that count keys fit in self without further rehashing.
+        """
+        capacity = self.capacity_for(count)
+        if capacity > self.capacity:
+            self.rehash(capacity)
+
+    def shrink_to_fit(self):
+        """
+        Rehash into the smallest table that holds the keys in self.
+        """
+        self.rehash(self.capacity_for(len(self)))
 
     def __setitem__(self, key, new_value):
         """
@@ -205,13 +318,13 @@ class HashDict(AbstractDict):
             self.items[self.position].value = new_value
         else:
             # Grow array capacity and rehash table for load factors over 0.9
-            if len(self) + 1 > (0.9 * self.items.capacity):
+            if len(self) + 1 > (HashDict.load_factor * self.items.capacity):
                 self.rehash()
 
             # Add element at available spot closest to home index
             home_index = abs(hash(key)) % self.items.capacity
             index = home_index
-            new_entry = Entry(key, new_value, 0)
+            new_entry = HashEntry(key, new_value, 0)
             i = 0
             while (self.items[index + i] is not None and
               self.items[index + i] != "_del_"):
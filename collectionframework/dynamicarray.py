@@ -4,31 +4,230 @@ Purpose: Implement a basic array object.
 
 Exports:
     Array: Array that mimics functionality of explicity-memory-allocated arrays.
+           Optionally backed by a typed, contiguous buffer.
+
+    ArrayView: Zero-copy window onto a range of an Array, returned by slicing.
+
+    CircularArray: Ring buffer with O(1) push and pop at both ends.
+
+    GrowthPolicy: Rules deciding when and by how much an Array resizes.
+
+    MappedArray: Typed Array stored in a memory-mapped file.
+
+    RecordArray: Contiguous buffer of fixed-width records packed with struct.
+
+    SegmentedArray: Array made of fixed-size chunks that grows without ever
+                    copying its items.
 """
 
+from array import array, typecodes
 from copy import deepcopy
+from itertools import chain, islice
+from mmap import mmap, ACCESS_READ, ACCESS_WRITE
+from os import path as os_path
+from struct import Struct, error as StructError
+
+
+class RecordArray:
+    """
+    Represent a contiguous buffer of fixed-width records.
+    Each record is packed into a bytearray with a struct format string and
+    is read back as a tuple.
+    """
+
+    def __init__(self, record_format, count = 0, fill_value = None,
+                 buffer = None):
+        """
+        Instantiate a buffer holding count copies of fill_value, or wrap an
+        existing writable buffer (such as a memoryview of a file) if given.
+        Precondition: record_format must be a valid struct format.
+        Raises: ValueError
+        """
+        try:
+            self.record = Struct(record_format)
+        except StructError:
+            raise ValueError(f"invalid record format: {record_format!r}")
+        if self.record.size == 0:
+            raise ValueError("record format must describe at least one byte")
+        self.typecode = record_format
+        if buffer is not None:
+            self.buffer = buffer
+        else:
+            if fill_value is None:
+                fill = bytes(self.record.size)
+            else:
+                fill = self.record.pack(*fill_value)
+            self.buffer = bytearray(fill * count)
+
+    # Accessors
+    def __getitem__(self, index):
+        """
+        Return the record at index as a tuple, or a RecordArray copy of a
+        contiguous slice.
+        """
+        if isinstance(index, slice):
+            start, stop = self.check_slice(index)
+            size = self.record.size
+            return RecordArray(self.typecode,
+                               buffer = bytearray(self.buffer[start * size:stop * size]))
+        index = self.check_index(index)
+        return self.record.unpack_from(self.buffer, index * self.record.size)
+
+    def __iter__(self):
+        """Support iteration over every record in self."""
+        return self.record.iter_unpack(self.buffer)
+
+    def __len__(self):
+        """Return the number of records in self."""
+        return len(self.buffer) // self.record.size
+
+    def check_index(self, index):
+        """
+        Return index as a nonnegative position in self.
+        Raises: IndexError
+        """
+        if index < 0:
+            index += len(self)
+        if index < 0 or index >= len(self):
+            raise IndexError("record index out of range")
+        return index
+
+    def check_slice(self, index):
+        """
+        Return the start and stop of index, a slice with step 1.
+        Raises: TypeError
+        """
+        if index.step not in (None, 1):
+            raise TypeError("RecordArray only supports contiguous slices")
+        start, stop, _ = index.indices(len(self))
+        return start, max(start, stop)
+
+    # Mutators
+    def __delitem__(self, index):
+        """
+        Delete a contiguous run of records.
+        Precondition: index must be a slice with step 1.
+        Raises: TypeError
+        """
+        if not isinstance(index, slice):
+            raise TypeError("RecordArray only supports deleting contiguous slices")
+        start, stop = self.check_slice(index)
+        size = self.record.size
+        del self.buffer[start * size:stop * size]
+
+    def extend(self, other):
+        """Append every record in other, a RecordArray of the same format."""
+        self.buffer += other.buffer
+
+    def __setitem__(self, index, value):
+        """
+        Pack the tuple value into the record at index. If index is a
+        contiguous slice, value must be a RecordArray with the same number
+        of records.
+        """
+        if isinstance(index, slice):
+            start, stop = self.check_slice(index)
+            size = self.record.size
+            self.buffer[start * size:stop * size] = value.buffer
+            return
+        index = self.check_index(index)
+        self.record.pack_into(self.buffer, index * self.record.size, *value)
+
+
+class GrowthPolicy:
+    """
+    Decide when and by how much an Array changes capacity.
+
+    Arrays grow by factor when full and shrink by factor once their load drops
+    to shrink_load. Keeping shrink_load below 1 / factor leaves a hysteresis
+    band between the two thresholds, so a collection hovering around a
+    capacity boundary does not reallocate on every add and remove.
+    """
+
+    def __init__(self, factor = 2, shrink_load = 0.25, min_capacity = None):
+        """
+        Instantiate a policy. min_capacity of None means an array never shrinks
+        below the capacity it was created with.
+        Precondition: factor > 1, 0 <= shrink_load < 1 / factor,
+                      min_capacity is None or at least 1.
+        Raises: ValueError
+        """
+        if factor <= 1:
+            raise ValueError("Growth factor must be greater than 1.")
+        if shrink_load < 0 or shrink_load >= 1 / factor:
+            raise ValueError("shrink_load must be in range(0, 1 / factor).")
+        if min_capacity is not None and min_capacity < 1:
+            raise ValueError("Minimum capacity must be 1 or more.")
+        self.factor = factor
+        self.shrink_load = shrink_load
+        self.min_capacity = min_capacity
+
+    def __repr__(self):
+        """Return the unique string representation of self."""
+        return (f"GrowthPolicy({self.factor}, {self.shrink_load}, "
+                f"{self.min_capacity})")
+
+    def grown_capacity(self, capacity, needed):
+        """Return capacity multiplied by factor until it can hold needed items."""
+        while capacity < needed:
+            capacity = max(capacity + 1, int(capacity * self.factor))
+        return capacity
+
+    def shrunk_capacity(self, capacity, size, floor):
+        """
+        Return the capacity an array holding size items should shrink to,
+        or capacity itself if it should not shrink. floor is used as the
+        minimum capacity when the policy does not set one.
+        """
+        minimum = floor if self.min_capacity is None else self.min_capacity
+        if size <= capacity * self.shrink_load:
+            return max(minimum, size, min(capacity, int(capacity / self.factor)))
+        return capacity
 
 
 class Array:
-    """Represent an array."""
+    """
+    Represent an array.
+
+    By default each slot holds an arbitrary Python object. Passing a typecode
+    stores items in a typed, contiguous buffer instead: a single array-module
+    typecode ('i', 'd', ...) stores machine numbers, while any longer struct
+    format ('if', '<qd', ...) stores fixed-width records as tuples.
+    """
     default_capacity = 10
 
-    def __init__(self, capacity = 10, fill_value = None):
+    def __init__(self, capacity = 10, fill_value = None, typecode = None,
+                 policy = None):
         """
         Initialize array and fill each position with fill_value.
         deepcopy fill_value in case its mutable.
+        Typed arrays default fill_value to zero.
+        policy is a GrowthPolicy, defaulting to doubling and halving.
+        Precondition: typecode must be an array typecode or struct format.
+        Raises: ValueError
         """
         if capacity <= 0:
             raise ValueError("Array must have capacity of 1 or more.")
-        self.items = []
+        self.typecode = typecode
+        if typecode is not None and fill_value is None:
+            fill_value = self.zero_value()
         self.logical_size = 0
         self.capacity = capacity
         self.default_capacity = capacity
         self.fill_value = fill_value
-        for _ in range(capacity):
-            self.items.append(deepcopy(fill_value))
+        self.policy = policy if policy is not None else GrowthPolicy()
+        self.items = self.allocate(capacity)
 
     # Accessors
+    def allocate(self, count):
+        """Return a new buffer of count slots, each holding fill_value."""
+        if self.typecode is None:
+            return [deepcopy(self.fill_value) for _ in range(count)]
+        elif self.is_record_typed():
+            return RecordArray(self.typecode, count, self.fill_value)
+        else:
+            return array(self.typecode, [self.fill_value]) * count
+
     def __eq__(self, other):
         """Return True if other is an array of same logical size and contents."""
         if self is other:
@@ -44,28 +243,36 @@ class Array:
                     return False
                 i += 1
             return True
-            
+
     def __getitem__(self, index):
         """
-        Return item at index in array.
+        Return item at index in array. If index is a slice, return an
+        ArrayView of that range of the logical items, sharing storage.
         Precondition: Index in range(0, self.capacity)
         Raises: IndexError
         """
+        if isinstance(index, slice):
+            return ArrayView(self, *index.indices(self.size()))
         if index < 0 or index >= len(self):
             raise IndexError("array index out of range")
         return self.items[index]
 
+    def is_record_typed(self):
+        """Return True if self stores struct records rather than plain values."""
+        return self.typecode is not None and (len(self.typecode) != 1 or
+                                              self.typecode not in typecodes)
+
     def __iter__(self):
         """Support traversal with for loop."""
-        return iter(self.items[:self.size()])
-    
+        return islice(self.items, self.size())
+
     def __len__(self):
         """Get capacity of array."""
         return self.capacity
 
     def __repr__(self):
         """Get representation of the array object."""
-        return repr(self.items[:self.size()])
+        return '[' + ", ".join(map(repr, self)) + ']'
 
     def size(self):
         """Get logical size of array."""
@@ -73,22 +280,68 @@ class Array:
 
     def __str__(self):
         """Get string representation of the array object."""
-        return str(self.items[:self.size()])
-        
+        return repr(self)
+
+    def zero_value(self):
+        """Return the zero fill value for a typed array."""
+        if self.is_record_typed():
+            try:
+                record = Struct(self.typecode)
+            except StructError:
+                raise ValueError(f"invalid typecode: {self.typecode!r}")
+            return record.unpack(bytes(record.size))
+        try:
+            return array(self.typecode, [0])[0]
+        except TypeError:
+            # Character arrays ('u') cannot hold integers
+            return array(self.typecode, '\0')[0]
+
     # Mutators
+    def clear(self):
+        """Reset self to its original capacity with no items in it."""
+        self.items = self.allocate(self.default_capacity)
+        self.capacity = self.default_capacity
+        self.logical_size = 0
+
+    def extend(self, iterable):
+        """
+        Write each item in iterable after the logical end of self, reserving
+        room for all of them in a single step.
+        """
+        new_items = list(iterable)
+        start = self.size()
+        self.reserve(start + len(new_items))
+        for offset, item in enumerate(new_items):
+            self[start + offset] = item
+
     def grow(self):
-        """Double capacity of array if logical size equals capacity."""
+        """Grow capacity of array by the policy's factor if logical size equals capacity."""
         if self.size() == len(self):
-            # Double physical size
-            temp = Array(len(self)*2)
-
-            # Copy over items
-            for i in range(self.size()):
-                temp.items[i] = self.items[i]
-                
-            self.capacity = len(self)*2
-            self.items = temp.items
-    
+            self.resize(self.policy.grown_capacity(len(self), len(self) + 1))
+
+    def reserve(self, capacity):
+        """
+        Grow capacity of array to at least capacity in a single step, so that
+        a bulk load of a known size does not reallocate repeatedly. The
+        collections built on Array expose this as their own reserve.
+        """
+        if capacity > len(self):
+            self.resize(capacity)
+
+    def resize(self, capacity):
+        """
+        Set capacity of array, appending fill values or truncating the buffer.
+        Precondition: capacity must be at least 1 and at least logical size.
+        Raises: ValueError
+        """
+        if capacity < 1 or capacity < self.size():
+            raise ValueError("Array capacity cannot drop below its logical size.")
+        if capacity > len(self):
+            self.items.extend(self.allocate(capacity - len(self)))
+        elif capacity < len(self):
+            del self.items[capacity:]
+        self.capacity = capacity
+
     def __setitem__(self, index, value):
         """
         Set value at index in array.
@@ -103,15 +356,561 @@ class Array:
 
     def shrink(self):
         """
-        Halve capacity of array if logical size is less than or equal to a fourth of capacity
-        and capacity is twice the default capacity.
+        Shrink capacity of array by the policy's factor if its load has dropped
+        to the policy's shrink_load, never going below the default capacity
+        unless the policy sets its own minimum.
+        """
+        capacity = self.policy.shrunk_capacity(len(self), self.size(),
+                                               self.default_capacity)
+        if capacity < len(self):
+            self.resize(capacity)
+
+    def shrink_to_fit(self):
+        """
+        Release every unused slot so that capacity equals logical size. The
+        collections built on Array expose this as their own shrink_to_fit.
+        """
+        self.resize(max(self.size(), 1))
+
+    def truncate(self, size):
+        """
+        Drop every item from index size on, refilling their slots with
+        fill_value, then shrink for as long as the policy allows.
+        Precondition: size in range(0, self.size() + 1).
+        Raises: ValueError
+        """
+        if size < 0 or size > self.size():
+            raise ValueError("Array cannot be truncated past its logical size.")
+        for index in range(size, self.size()):
+            self[index] = self.fill_value
+        self.logical_size = size
+        capacity = None
+        while capacity != len(self):
+            capacity = len(self)
+            self.shrink()
+
+
+class ArrayView:
+    """
+    Represent a window onto positions start, start + step, ... (up to but not
+    including stop) of an Array. The view shares the array's storage, so no
+    items are copied and writes through the view change the array.
+
+    A view reads the array's buffer on every access, so it stays valid while
+    the array grows or shrinks, but indices past the array's new capacity
+    raise IndexError.
+    """
+
+    def __init__(self, source, start = 0, stop = None, step = 1):
+        """Instantiate a view of source, an Array."""
+        if stop is None:
+            stop = source.size()
+        self.source = source
+        self.positions = range(start, stop, step)
+
+    # Accessors
+    def __eq__(self, other):
+        """Return True if other is a view holding the same items in order."""
+        if self is other:
+            return True
+        elif type(self) != type(other):
+            return False
+        elif len(self) != len(other):
+            return False
+        else:
+            for item1, item2 in zip(self, other):
+                if item1 != item2:
+                    return False
+            return True
+
+    def __getitem__(self, index):
+        """
+        Return item at index in self, or a narrower view if index is a slice.
+        Raises: IndexError
         """
-        if self.size() <= (len(self) // 4) and len(self) >= (2 * self.default_capacity):
-            # Halve physical size
-            temp = Array(len(self) // 2)
-            self.capacity = len(self) // 2
+        if isinstance(index, slice):
+            positions = self.positions[index]
+            return ArrayView(self.source, positions.start, positions.stop,
+                             positions.step)
+        return self.source[self.positions[index]]
+
+    def __iter__(self):
+        """Support iteration over every item in self."""
+        source = self.source
+        for position in self.positions:
+            yield source[position]
+
+    def __len__(self):
+        """Return the number of items in self."""
+        return len(self.positions)
+
+    def memoryview(self):
+        """
+        Return a memoryview over the items in self without copying them.
+        Typed arrays expose their buffer directly; record arrays expose raw
+        bytes and only for views with a step of 1. An array cannot grow or
+        shrink while a memoryview of it is alive, so release it when done.
+        Precondition: the source array must be typed.
+        Raises: TypeError, ValueError
+        """
+        if self.source.typecode is None or isinstance(self.source, SegmentedArray):
+            raise TypeError("Only contiguous typed arrays support the buffer protocol.")
+        start = self.positions.start
+        stop = self.positions.stop
+        if self.source.is_record_typed():
+            if self.positions.step != 1:
+                raise ValueError("Record views must have a step of 1.")
+            size = self.source.items.record.size
+            stop = max(start, stop)
+            return memoryview(self.source.items.buffer)[start * size:stop * size]
+        if stop < 0:
+            # A negative step that runs through index 0 ends before the buffer
+            stop = None
+        return memoryview(self.source.items)[start:stop:self.positions.step]
+
+    def __repr__(self):
+        """Return the unique string representation of self."""
+        return "ArrayView([" + ", ".join(map(repr, self)) + "])"
+
+    def __str__(self):
+        """Return the string representation of self."""
+        return '[' + ", ".join(map(repr, self)) + ']'
+
+    def tolist(self):
+        """Return a list copy of the items in self."""
+        return list(self)
+
+    # Mutators
+    def __setitem__(self, index, value):
+        """
+        Set item at index in self, and so in the source array, to value.
+        Raises: IndexError
+        """
+        self.source[self.positions[index]] = value
+
+
+class MappedArray(Array):
+    """
+    Represent a typed array whose items live in a memory-mapped file.
+
+    The file starts with a small header recording the typecode and logical
+    size, followed by the raw item buffer, so reopening the file restores the
+    array with no load step and pages items in only as they are touched.
+    Growing or shrinking the array resizes the file. Unused slots are always
+    zero-filled.
+
+    Other processes may open the same file with readonly = True. A reader sees
+    the writer's updates to existing slots and to the logical size, but not
+    capacity added after it opened the file.
+
+    Call close() (or use the array as a context manager) to flush and release
+    the mapping. Memoryviews taken through ArrayView.memoryview() must be
+    released before the array resizes or closes.
+    """
+    header = Struct("<8sQ48s")
+    magic = b"CFARRAY1"
+
+    def __init__(self, file_path, typecode = None, capacity = 10,
+                 readonly = False, policy = None):
+        """
+        Open the array stored at file_path, creating it with capacity slots
+        if the file does not exist or is empty. A reopened array ignores
+        capacity and treats the file's current capacity as its original one.
+        Precondition: a new file needs a typecode; an existing file must hold
+                      a MappedArray of the same typecode; capacity must be
+                      at least 1.
+        Raises: ValueError
+        """
+        if capacity <= 0:
+            raise ValueError("Array must have capacity of 1 or more.")
+        exists = os_path.exists(file_path) and os_path.getsize(file_path) > 0
+        if not exists and readonly:
+            raise ValueError(f"Cannot open missing array {file_path} read-only.")
+
+        self.file_path = file_path
+        self.readonly = readonly
+        self.file = open(file_path, "rb" if readonly else ("r+b" if exists else "w+b"))
+        if exists:
+            typecode = self.read_header(typecode)
+        elif typecode is None:
+            raise ValueError("A new MappedArray needs a typecode.")
+        elif len(typecode.encode()) > 48:
+            raise ValueError("MappedArray typecodes are limited to 48 bytes.")
+
+        self.typecode = typecode
+        self.fill_value = self.zero_value()
+        self.itemsize = self.item_format().size
+        self.policy = policy if policy is not None else GrowthPolicy()
+        self.map = None
+        self.items = None
+        if exists:
+            self.map_file()
+            self.default_capacity = self.capacity
+        else:
+            self.default_capacity = capacity
+            self.file.write(MappedArray.header.pack(MappedArray.magic, 0,
+                                                    typecode.encode()))
+            self.file.truncate(MappedArray.header.size + capacity * self.itemsize)
+            self.map_file()
 
-            # Copy over items
-            for i in range(self.size()):
-                temp.items[i] = self.items[i]
-            self.items = temp.items
+    # Accessors
+    def __enter__(self):
+        """Support use of self in a with statement."""
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close self at the end of a with statement."""
+        self.close()
+
+    def item_format(self):
+        """
+        Return a Struct describing one item in self.
+        Raises: ValueError
+        """
+        try:
+            return Struct(self.typecode)
+        except StructError:
+            raise ValueError(f"invalid typecode: {self.typecode!r}")
+
+    def read_header(self, typecode):
+        """
+        Check the header of the open file and return its typecode.
+        Raises: ValueError
+        """
+        raw = self.file.read(MappedArray.header.size)
+        if len(raw) < MappedArray.header.size:
+            raise ValueError(f"{self.file_path} is not a MappedArray file.")
+        magic, _, stored = MappedArray.header.unpack(raw)
+        stored = stored.rstrip(b"\0").decode()
+        if magic != MappedArray.magic:
+            raise ValueError(f"{self.file_path} is not a MappedArray file.")
+        if typecode is not None and typecode != stored:
+            msg = f"{self.file_path} holds typecode {stored!r}, not {typecode!r}."
+            raise ValueError(msg)
+        return stored
+
+    @property
+    def logical_size(self):
+        """Get logical size of array from the file header."""
+        return MappedArray.header.unpack_from(self.map, 0)[1]
+
+    @logical_size.setter
+    def logical_size(self, value):
+        """Record logical size of array in the file header."""
+        MappedArray.header.pack_into(self.map, 0, MappedArray.magic, value,
+                                     self.typecode.encode())
+
+    # Mutators
+    def clear(self):
+        """Reset self to its original capacity with no items in it."""
+        self.logical_size = 0
+        self.resize(self.default_capacity)
+        # Slots kept by resize may hold stale items
+        self.map[MappedArray.header.size:] = bytes(len(self) * self.itemsize)
+
+    def close(self):
+        """Flush self to disk and release the mapping and file."""
+        if self.map is not None:
+            self.unmap_file()
+        self.file.close()
+
+    def flush(self):
+        """Write any changes in the mapping back to the file."""
+        if not self.readonly:
+            self.map.flush()
+
+    def map_file(self):
+        """Map the open file into memory and expose its items."""
+        access = ACCESS_READ if self.readonly else ACCESS_WRITE
+        self.map = mmap(self.file.fileno(), 0, access = access)
+        self.capacity = (len(self.map) - MappedArray.header.size) // self.itemsize
+        data = memoryview(self.map)[MappedArray.header.size:
+                                    MappedArray.header.size + self.capacity * self.itemsize]
+        if self.is_record_typed():
+            self.items = RecordArray(self.typecode, buffer = data)
+        else:
+            self.items = data.cast(self.typecode)
+
+    def resize(self, capacity):
+        """
+        Set capacity of array by resizing the file.
+        Precondition: self is writable, capacity must be at least 1 and at
+                      least logical size.
+        Raises: TypeError, ValueError
+        """
+        if self.readonly:
+            raise TypeError("Cannot resize a read-only MappedArray.")
+        if capacity < 1 or capacity < self.size():
+            raise ValueError("Array capacity cannot drop below its logical size.")
+        if capacity != len(self):
+            self.unmap_file()
+            self.file.truncate(MappedArray.header.size + capacity * self.itemsize)
+            self.map_file()
+
+    def unmap_file(self):
+        """Release the item view and the mapping."""
+        if self.is_record_typed():
+            self.items.buffer.release()
+        else:
+            self.items.release()
+        self.items = None
+        self.flush()
+        self.map.close()
+        self.map = None
+
+
+class CircularArray(Array):
+    """
+    Represent an array used as a ring buffer.
+
+    Items occupy logical positions 0 through size() - 1 starting at physical
+    slot front and wrapping around the end of the buffer, so items can be
+    pushed and popped at either end in O(1) time. When the ring grows or
+    shrinks it is unwrapped into the new buffer with at most two bulk copies.
+    """
+
+    def __init__(self, capacity = 10, fill_value = None, typecode = None,
+                 policy = None):
+        """Initialize an empty ring. See Array for the arguments."""
+        Array.__init__(self, capacity, fill_value, typecode, policy)
+        self.front = 0
+
+    # Accessors
+    def __eq__(self, other):
+        """Return True if other is a ring holding the same items in order."""
+        if self is other:
+            return True
+        elif type(other) != type(self):
+            return False
+        elif other.size() != self.size():
+            return False
+        else:
+            for item1, item2 in zip(self, other):
+                if item1 != item2:
+                    return False
+            return True
+
+    def __getitem__(self, index):
+        """
+        Return item at logical index in self.
+        Precondition: index in range(0, self.size())
+        Raises: IndexError, TypeError
+        """
+        return self.items[self.slot(index)]
+
+    def __iter__(self):
+        """Support iteration over every item in self from front to back."""
+        end = self.front + self.size()
+        if end <= len(self):
+            return islice(self.items, self.front, end)
+        return chain(islice(self.items, self.front, len(self)),
+                     islice(self.items, 0, end - len(self)))
+
+    def slot(self, index):
+        """
+        Return the physical slot holding logical index.
+        Raises: IndexError, TypeError
+        """
+        if isinstance(index, slice):
+            raise TypeError("CircularArray does not support slicing.")
+        if index < 0 or index >= self.size():
+            raise IndexError("circular array index out of range")
+        return (self.front + index) % len(self)
+
+    # Mutators
+    def clear(self):
+        """Reset self to its original capacity with no items in it."""
+        Array.clear(self)
+        self.front = 0
+
+    def extend(self, iterable):
+        """
+        Push each item in iterable onto the back of self, reserving room for
+        all of them in a single step.
+        """
+        new_items = list(iterable)
+        self.reserve(self.size() + len(new_items))
+        for item in new_items:
+            self.push_back(item)
+
+    def pop_back(self):
+        """
+        Remove and return the item at the back of self.
+        Precondition: self is not empty.
+        Raises: IndexError
+        """
+        if self.size() == 0:
+            raise IndexError("pop from empty circular array")
+        slot = self.slot(self.size() - 1)
+        out = self.items[slot]
+        self.items[slot] = self.fill_value
+        self.logical_size -= 1
+        self.shrink()
+        return out
+
+    def pop_front(self):
+        """
+        Remove and return the item at the front of self.
+        Precondition: self is not empty.
+        Raises: IndexError
+        """
+        if self.size() == 0:
+            raise IndexError("pop from empty circular array")
+        out = self.items[self.front]
+        self.items[self.front] = self.fill_value
+        self.front = (self.front + 1) % len(self)
+        self.logical_size -= 1
+        self.shrink()
+        return out
+
+    def push_back(self, item):
+        """Add item at the back of self, growing if necessary."""
+        self.grow()
+        self.items[(self.front + self.size()) % len(self)] = item
+        self.logical_size += 1
+
+    def push_front(self, item):
+        """Add item at the front of self, growing if necessary."""
+        self.grow()
+        self.front = (self.front - 1) % len(self)
+        self.items[self.front] = item
+        self.logical_size += 1
+
+    def resize(self, capacity):
+        """
+        Set capacity of self, moving items to the start of a new buffer.
+        Precondition: capacity must be at least 1 and at least logical size.
+        Raises: ValueError
+        """
+        if capacity < 1 or capacity < self.size():
+            raise ValueError("Array capacity cannot drop below its logical size.")
+        items = self.allocate(capacity)
+        # The run from front to the end of the buffer, then the wrapped run
+        first = min(self.size(), len(self) - self.front)
+        items[0:first] = self.items[self.front:self.front + first]
+        items[first:self.size()] = self.items[0:self.size() - first]
+        self.items = items
+        self.capacity = capacity
+        self.front = 0
+
+    def __setitem__(self, index, value):
+        """
+        Set item at logical index in self to value.
+        Precondition: index in range(0, self.size())
+        Raises: IndexError
+        """
+        self.items[self.slot(index)] = value
+
+
+class SegmentedArray(Array):
+    """
+    Represent an array stored as a directory of fixed-size chunks.
+
+    Growing adds one chunk and shrinking drops one, so items are never copied
+    and no operation needs more than one chunk of extra memory. Appending is
+    O(1) in the worst case apart from the directory itself, a list of chunk
+    references that is a chunk_size-th the length of the array.
+
+    Because the buffer is not contiguous, a SegmentedArray has no memoryview.
+    """
+
+    def __init__(self, chunk_size = 1024, fill_value = None, typecode = None,
+                 policy = None):
+        """
+        Initialize self with one empty chunk. See Array for the other arguments.
+        Precondition: chunk_size must be a power of two.
+        Raises: ValueError
+        """
+        if chunk_size < 1 or chunk_size & (chunk_size - 1):
+            raise ValueError("Chunk size must be a power of two.")
+        self.chunk_size = chunk_size
+        self.shift = chunk_size.bit_length() - 1
+        self.mask = chunk_size - 1
+        Array.__init__(self, chunk_size, fill_value, typecode, policy)
+        # The directory of chunks takes the place of a flat buffer
+        self.items = [self.items]
+
+    # Accessors
+    def __eq__(self, other):
+        """Return True if other is an array of same logical size and contents."""
+        if self is other:
+            return True
+        elif type(other) != type(self):
+            return False
+        elif other.size() != self.size():
+            return False
+        else:
+            for item1, item2 in zip(self, other):
+                if item1 != item2:
+                    return False
+            return True
+
+    def __getitem__(self, index):
+        """
+        Return item at index in array. If index is a slice, return an
+        ArrayView of that range of the logical items.
+        Precondition: Index in range(0, self.capacity)
+        Raises: IndexError
+        """
+        if isinstance(index, slice):
+            return ArrayView(self, *index.indices(self.size()))
+        if index < 0 or index >= len(self):
+            raise IndexError("array index out of range")
+        return self.items[index >> self.shift][index & self.mask]
+
+    def __iter__(self):
+        """Support traversal with for loop."""
+        full_chunks, remainder = divmod(self.size(), self.chunk_size)
+        chunks = self.items[:full_chunks]
+        if remainder:
+            chunks.append(islice(self.items[full_chunks], remainder))
+        return chain.from_iterable(chunks)
+
+    # Mutators
+    def clear(self):
+        """Reset self to one empty chunk."""
+        self.items = [self.allocate(self.chunk_size)]
+        self.capacity = self.chunk_size
+        self.logical_size = 0
+
+    def grow(self):
+        """Add a chunk to self if logical size equals capacity."""
+        if self.size() == len(self):
+            self.items.append(self.allocate(self.chunk_size))
+            self.capacity += self.chunk_size
+
+    def resize(self, capacity):
+        """
+        Add or drop chunks so that self has the fewest chunks holding capacity
+        slots.
+        Precondition: capacity must be at least 1 and at least logical size.
+        Raises: ValueError
+        """
+        if capacity < 1 or capacity < self.size():
+            raise ValueError("Array capacity cannot drop below its logical size.")
+        chunk_count = -(-capacity // self.chunk_size)
+        while len(self.items) < chunk_count:
+            self.items.append(self.allocate(self.chunk_size))
+        del self.items[chunk_count:]
+        self.capacity = chunk_count * self.chunk_size
+
+    def __setitem__(self, index, value):
+        """
+        Set value at index in array.
+        Precondition: Index in range(0, self.capacity)
+        Raises: IndexError
+        """
+        if index < 0 or index >= len(self):
+            raise IndexError("array index out of range")
+        self.items[index >> self.shift][index & self.mask] = value
+        if index >= self.size():
+            self.logical_size = index + 1
+
+    def shrink(self):
+        """
+        Drop the last chunk once two whole chunks are unused, keeping one
+        spare chunk so that alternating adds and removes never reallocate.
+        """
+        if len(self.items) > 1 and len(self) - self.size() >= 2 * self.chunk_size:
+            self.items.pop()
+            self.capacity -= self.chunk_size
@@ -14,10 +14,21 @@ class ArrayHeap(AbstractCollection):
     """Implement the heap ADT according to the heap interface using an array."""
 
     # Constructor
-    def __init__(self, source_collection = None):
-        """Initialize self, optionally add items from source_collection."""
-        self.items = Array()
-        AbstractCollection.__init__(self, source_collection)
+    def __init__(self, source_collection = None, typecode = None,
+                 policy = None, storage = None):
+        """
+        Initialize self, optionally add items from source_collection.
+        Pass typecode to store items in a typed, compact array and policy to
+        control how it resizes. Pass storage, such as a MappedArray, to keep
+        items in that array instead; any items already in it must form a heap.
+        """
+        if storage is None:
+            storage = Array(typecode = typecode, policy = policy)
+        self.items = storage
+        AbstractCollection.__init__(self)
+        self.length = self.items.size()
+        if source_collection:
+            self.add_all(source_collection)
 
     # Accessors
     def __eq__(self, other):
@@ -121,9 +132,41 @@ class ArrayHeap(AbstractCollection):
 
         self.length += 1
 
+    def add_all(self, iterable):
+        """
+        Add each item in iterable to self. A batch at least as large as self
+        is appended and heapified bottom-up in O(n); a smaller one is added an
+        item at a time in O(k log n).
+        Precondition: Items must be comparable with each other and with the
+                      elements in self.
+        Raises: TypeError
+        """
+        new_items = list(iterable)
+        if not new_items:
+            return
+        elif len(new_items) < len(self):
+            for item in new_items:
+                self.add(item)
+            return
+
+        # Check preconditions before self is changed
+        try:
+            least = min(new_items)
+            least < least
+            if not self.is_empty():
+                least < self.peek()
+        except TypeError:
+            raise TypeError("heap.add_all(items): items must be comparable.")
+
+        # Sift down every parent, from the last one up to the root
+        self.items.extend(new_items)
+        self.length = self.items.size()
+        for index in range(len(self) // 2 - 1, -1, -1):
+            self.sift_down(index)
+
     def clear(self):
         """Remove all items in self and reset length to 0."""
-        self.items = Array()
+        self.items.clear()
         self.length = 0
 
     def pop(self):
@@ -139,9 +182,6 @@ class ArrayHeap(AbstractCollection):
         # Save return and move bottom element to top
         return_val = self.items[0]
         self.items[0] = self.items[len(self) - 1]
-        parent_index = 0
-        left_index = (parent_index * 2) + 1
-        right_index = (parent_index * 2) + 2
 
         # Decrement length, if heap is now empty, return
         self.length -= 1
@@ -149,35 +189,37 @@ class ArrayHeap(AbstractCollection):
         if self.is_empty():
             return return_val
 
-        # Move down heap, swapping large value at top with smallest child
-        # If children larger than value at any point, stop!
-        while True:
-            no_r = False
-            if left_index >= len(self):
-                break
-            if right_index >= len(self):
-                no_r = True
-
-            if self.items[left_index] >= self.items[parent_index] and \
-               (no_r or self.items[right_index] >= self.items[parent_index]):
-                break
-            
-            temp = self.items[parent_index]
-            # no_r will trigger conditional before IndexError
-            if no_r or (self.items[left_index] <= self.items[right_index]):
-                self.items[parent_index] = self.items[left_index]
-                self.items[left_index] = temp
-                parent_index = left_index
-            else:
-                self.items[parent_index] = self.items[right_index]
-                self.items[right_index] = temp
-                parent_index = right_index
-                
-            # Recalculate indices
-            left_index = (2 * parent_index) + 1
-            right_index = (2 * parent_index) + 2
+        # Move large value at top down the heap
+        self.sift_down(0)
 
         # Shrink underlying array if necessary
         self.items.shrink()
         return return_val
+
+    def reserve(self, capacity):
+        """Reserve room for capacity items, as in Array.reserve."""
+        self.items.reserve(capacity)
+
+    def sift_down(self, index):
+        """
+        Move the item at index down self, swapping it with its smaller child,
+        until neither child is smaller than it.
+        """
+        items = self.items
+        item = items[index]
+        while True:
+            child = 2 * index + 1
+            if child >= len(self):
+                break
+            if child + 1 < len(self) and items[child + 1] < items[child]:
+                child += 1
+            if not items[child] < item:
+                break
+            items[index] = items[child]
+            index = child
+        items[index] = item
+
+    def shrink_to_fit(self):
+        """Release unused capacity, as in Array.shrink_to_fit."""
+        self.items.shrink_to_fit()
         
@@ -70,6 +70,27 @@ class BagInterface:
         """
         pass
 
+    def discard_many(self, items):
+        """
+        Remove one instance of each item in items that is in self, skipping
+        the others, and return the number of items removed.
+        """
+        return 0
+
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true in a single
+        pass and return the number of items removed.
+        """
+        return 0
+
+    def retain_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is false in a single
+        pass and return the number of items removed.
+        """
+        return 0
+
 
 
 
@@ -122,5 +122,19 @@ class BSTInterface:
         """
         pass
 
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true in a single
+        pass and return the number of items removed.
+        """
+        return 0
+
+    def retain_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is false in a single
+        pass and return the number of items removed.
+        """
+        return 0
+
     
     
@@ -95,6 +95,20 @@ class DictInterface:
         return default_value.
         """
         return None
+
+    def remove_if(self, pred):
+        """
+        Remove every key in self for which pred(key, value) is true in a
+        single pass and return the number of keys removed.
+        """
+        return 0
+
+    def retain_if(self, pred):
+        """
+        Remove every key in self for which pred(key, value) is false in a
+        single pass and return the number of keys removed.
+        """
+        return 0
     
     def __setitem__(self, key, new_value):
         """
@@ -121,10 +121,24 @@ class ListInterface:
         """
         pass
 
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true in a single
+        pass and return the number of items removed.
+        """
+        return 0
+
     def reverse(self, item):
         """Reverse contents of self in place."""
         pass
 
+    def retain_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is false in a single
+        pass and return the number of items removed.
+        """
+        return 0
+
     def __setitem__(self, index, value):
         """
         Set item at index to value.
@@ -133,7 +147,10 @@ class ListInterface:
         """
         pass
 
-    def sort(self, reverse = False):
-        """Use mergesort to sort contents of self."""
+    def sort(self, key = None, reverse = False):
+        """
+        Sort contents of self stably, ordering items by key(item) if key is
+        given and in descending order if reverse is True.
+        """
         pass
     
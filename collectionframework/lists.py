@@ -1,35 +1,79 @@
 """
 Author:  Russell Gerhard
 Purpose: Provide classes implementing the list ADT using a dynamic array, singly
-         linked list, and doubly linked list.
+         linked list, doubly linked list, and array-backed linked list.
 
 Exports:
     ArrayList: List implementation based on an array.
 
+    CursorLinkedList: Doubly linked list whose nodes live in parallel arrays
+                      and link to each other by index.
+
     LinkedList: List implementation based on singly-linked nodes.
 
     LinkedAdjacencyList: 
     
     DoublyLinkedList: Linked list with tail pointer whose nodes have pointers
                       to previous nodes.
+
+    UnrolledLinkedList: Linked list whose nodes each hold a block of items in
+                        an array.
+
+    LinkedListCursor: Bidirectional cursor that edits a LinkedList in place.
+
+    DoublyLinkedListCursor: Bidirectional cursor that edits a DoublyLinkedList
+                            in place.
 """
 
 from dynamicarray import Array
-from nodes import Node, TwoWayNode, LinkedEdge
+from nodes import Node, TwoWayNode, LinkedEdge, UnrolledNode
 from abstractclasses.abstractlist import AbstractList
+from sorting import merge_sort_nodes, sort_sequence
 
 class ArrayList(AbstractList):
     """Represent a dymanic-array-based list."""
-    def __init__(self, source_collection = None):
+    def __init__(self, source_collection = None, typecode = None,
+                 policy = None, storage = None):
         """
         Instantiate and initialize self, optionally appending each item in
-        source_collection to self.
+        source_collection to self. Pass typecode to store items in a typed,
+        compact array and policy to control how it resizes (see dynamicarray).
+        Pass storage, such as a MappedArray, to keep items in that array
+        instead; any items already in it become the start of self.
         """
-        self.items = Array()
-        AbstractList.__init__(self, source_collection)
+        if storage is None:
+            storage = Array(typecode = typecode, policy = policy)
+        self.items = storage
+        AbstractList.__init__(self)
+        self.length = self.items.size()
+        if source_collection:
+            self.extend(source_collection)
 
         
     # Accessors
+    def __getitem__(self, index):
+        """
+        Return item at index in self. If index is a slice, return an
+        ArrayView of that range that shares self's storage.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        if isinstance(index, slice):
+            return self.items[index]
+        elif index < 0:
+            raise IndexError("ArrayList index cannot be negative.")
+        elif index >= len(self):
+            raise IndexError("ArrayList index out of range.")
+        return self.items[index]
+
+    def index(self, item):
+        """Return first index of value in self, else return -1."""
+        items = self.items
+        for i in range(len(self)):
+            if items[i] == item:
+                return i
+        return -1
+
     def __iter__(self):
         """Support iteration over all items in self."""
         for item in self.items:
@@ -38,13 +82,16 @@ class ArrayList(AbstractList):
     # Mutators
     def clear(self):
         """Remove all items from self, set length to 0."""
-        self.items = Array()
+        self.items.clear()
         self.length = 0
 
     def extend(self, iterable):
-        """Extend self by appending each item in iterable."""
-        for item in iterable:
-            self.append(item)
+        """
+        Extend self by appending each item in iterable with one bulk fill of
+        the underlying array, which grows at most once.
+        """
+        self.items.extend(iterable)
+        self.length = self.items.size()
 
     def insert(self, index, item):
         """Insert item in self before index, increment length."""
@@ -91,13 +138,38 @@ class ArrayList(AbstractList):
             self.length -= 1
             return out
 
+    def reserve(self, capacity):
+        """Reserve room for capacity items, as in Array.reserve."""
+        self.items.reserve(capacity)
+
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true, keeping the
+        others in order, in O(n) time that moves each kept item at most once.
+        Return the number of items removed. pred is called on every item
+        before any is moved, so self is unchanged if it raises.
+        """
+        items = self.items
+        doomed = [pred(item) for item in items]
+        kept = 0
+        for index, victim in enumerate(doomed):
+            if not victim:
+                items[kept] = items[index]
+                kept += 1
+        removed = len(self) - kept
+        items.truncate(kept)
+        self.length = kept
+        return removed
+
     def reverse(self):
         """Reverse contents of self in place."""
-        if self.length > 1:
-            for i in range(self.length // 2):
-                temp = self[i]
-                self[i] = self[len(self) - (i + 1)]
-                self[len(self) - (i + 1)] = temp
+        items = self.items
+        left = 0
+        right = len(self) - 1
+        while left < right:
+            items[left], items[right] = items[right], items[left]
+            left += 1
+            right -= 1
 
     def __setitem__(self, index, value):
         """
@@ -113,66 +185,47 @@ class ArrayList(AbstractList):
         else:
             self.items[index] = value
 
-    def sort(self, reverse = False):
-        """Use quicksort to sort contents of self."""
-        self.sort_helper(0, len(self) - 1)
-
-        if reverse:
-            self.reverse()
-
-    def sort_helper(self, left, right):
-        """Help sort method by hiding arguments needed for recursion."""
-        if left < right:
-            partition = self.partition(left, right)
-            self.sort_helper(left, partition - 1)
-            self.sort_helper(partition + 1, right)
-
-    def partition(self, left, right):
-        """
-        Partition the part of self between left and right indices
-        into parts whose elements are either less than or greater than
-        the item at the middle of left and right, aka the pivot. Return the
-        new position of the pivot, aka the border between the partitions.
-        """
-        # Establish pivot
-        mid = (left + right) // 2
-        pivot = self[mid]
-        # Swap pivot with end
-        temp = self[right]
-        self[right] = pivot
-        self[mid] = temp
-        
-        # Border of items less than pivot starts at left
-        border = left
-        for i in range(left, right):
-            if self[i] < pivot:
-                # Swap border item with small item, increase border
-                temp = self[i]
-                self[i] = self[border]
-                self[border] = temp
-                border += 1
-            
-        # Swap pivot and border item
-        self[right] = self[border]
-        self[border] = pivot
-
-        return border
+    def shrink_to_fit(self):
+        """Release unused capacity, as in Array.shrink_to_fit."""
+        self.items.shrink_to_fit()
+
+    def sort(self, key = None, reverse = False, stable = True):
+        """
+        Sort contents of self with the adaptive merge sort in sorting, which
+        runs in close to linear time on partly sorted input. Pass stable =
+        False to use introsort instead. See sort_sequence.
+        """
+        sort_sequence(self.items, len(self), key, reverse, stable)
 
 
 class LinkedList(AbstractList):
-    """Represent a singly-linked list."""
-    def __init__(self, source_collection = None):
+    """Represent a singly-linked list with a tail pointer."""
+    node_type = Node
+
+    def __init__(self, source_collection = None, pool = None):
         """
         Instantiate and initialize self, optionally appending each item in
-        source_collection to self.
-
-        Appending here to conform to interface, prepend would be better.
-        For efficient construction, use DoublyLinkedList or change this class!
+        source_collection to self. Pass a NodePool of self's node type to
+        recycle nodes between inserts and pops.
+        Precondition: pool must hold nodes of type self.node_type.
+        Raises: TypeError
         """
+        if pool is not None and pool.node_type is not self.node_type:
+            msg = f"{type(self).__name__} needs a pool of {self.node_type.__name__}."
+            raise TypeError(msg)
+        self.pool = pool
         self.head = None
+        self.tail = None
         AbstractList.__init__(self, source_collection)
 
     # Accessors
+    def cursor(self):
+        """
+        Return a LinkedListCursor positioned before the head of self. See
+        LinkedListCursor for when it stays valid.
+        """
+        return LinkedListCursor(self)
+
     def __iter__(self):
         """Support iteration over all items in self."""
         probe = self.head
@@ -183,30 +236,63 @@ class LinkedList(AbstractList):
     # Mutators
     def clear(self):
         """Remove all items from self, set length to 0."""
+        if self.pool is not None:
+            while self.head is not None:
+                node = self.head
+                self.head = node.next
+                self.free_node(node)
         self.head = None
+        self.tail = None
         self.length = 0
 
     def extend(self, iterable):
-        """Extend self by appending each item in iterable."""
-        self.reverse()
-        for item in iterable:
-            self.prepend(item)
-        self.reverse()
+        """
+        Extend self by appending each item in iterable, O(1) per item. The
+        items are copied first, so self can be extended by itself.
+        """
+        for item in list(iterable):
+            node = self.link_node(item, None)
+            if self.tail is None:
+                self.head = node
+            else:
+                self.tail.next = node
+            self.tail = node
+            self.length += 1
 
     def insert(self, index, item):
         """Insert item in self before index, increment length."""
         # Insert at head or self is empty
         if index <= 0 or self.is_empty():
-            self.head = Node(item, self.head)
-            self.length += 1
+            self.head = self.new_node(item, self.head)
+            if self.tail is None:
+                self.tail = self.head
+        # Insert at end of self
+        elif index >= len(self):
+            self.tail.next = self.new_node(item, None)
+            self.tail = self.tail.next
         # Insert elsewhere in self
         else:
             probe = self.head
-            while index > 1 and probe.next is not None:
+            while index > 1:
                 probe = probe.next
                 index -= 1
-            probe.next = Node(item, probe.next)
-            self.length += 1
+            probe.next = self.new_node(item, probe.next)
+        self.length += 1
+
+    def free_node(self, node):
+        """Hand a node unlinked from self back to self's pool, if any."""
+        if self.pool is not None:
+            self.pool.release(node)
+
+    def link_node(self, item, following):
+        """Return a new node holding item whose next node is following."""
+        return self.new_node(item, following)
+
+    def new_node(self, *args):
+        """Return a node built from args, taken from self's pool if any."""
+        if self.pool is not None:
+            return self.pool.acquire(*args)
+        return self.node_type(*args)
 
     def pop(self, index = 0):
         """
@@ -222,8 +308,12 @@ class LinkedList(AbstractList):
         else:
             # Remove from head
             if index == 0: 
-                out = self.head.data
-                self.head = self.head.next
+                node = self.head
+                out = node.data
+                self.head = node.next
+                if self.head is None:
+                    self.tail = None
+                self.free_node(node)
                 self.length -= 1
                 return out
 
@@ -233,13 +323,45 @@ class LinkedList(AbstractList):
                 while index > 1 and probe.next.next is not None:
                     probe = probe.next
                     index -= 1
-                out = probe.next.data
-                probe.next = probe.next.next
+                node = probe.next
+                out = node.data
+                probe.next = node.next
+                if node is self.tail:
+                    self.tail = probe
+                self.free_node(node)
                 self.length -= 1
                 return out
 
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true by unlinking
+        its node in O(n). Return the number of items removed. pred is called
+        on every item before any node is unlinked, so self is unchanged if it
+        raises.
+        """
+        doomed = [pred(item) for item in self]
+        removed = 0
+        previous = None
+        probe = self.head
+        for victim in doomed:
+            following = probe.next
+            if victim:
+                if previous is None:
+                    self.head = following
+                else:
+                    previous.next = following
+                self.free_node(probe)
+                removed += 1
+            else:
+                previous = probe
+            probe = following
+        self.tail = previous
+        self.length -= removed
+        return removed
+
     def reverse(self):
         """Reverse contents of self in place."""
+        self.tail = self.head
         if self.length > 1:
             probe1 = self.head
             probe2 = self.head.next
@@ -272,57 +394,47 @@ class LinkedList(AbstractList):
         else:
             raise IndexError("LinkedList index out of range.")
 
-    def sort(self, reverse = False):
-        """Use mergesort to sort contents of self."""
-        self.sort_helper(0, self.length - 1)
-
-        # List actually finishes in descending order
-        # We have to reverse it to get a normal, ascending sort
-        if not reverse:
-            self.reverse()
-
-    # Helper functions not designed to be called by user
-    def sort_helper(self, left, right):
-        """Help with merge sort."""
-        if left < right:
-            mid = (left + right) // 2
-            self.sort_helper(left, mid)
-            self.sort_helper(mid + 1, right)
-            self.merge(left, mid, right)
-
-    def merge(self, left, mid, right):
-        """Merge two sorted lists together."""
-        index1 = left
-        index2 = mid + 1
-        copy_buffer = LinkedList()
-
-        # Use copy_buffer to keep track of merged order
-        for i in range(left, right + 1):
-            if index1 > mid:
-                copy_buffer.prepend(self[index2])
-                index2 += 1
-            elif index2 > right:
-                copy_buffer.prepend(self[index1])
-                index1 += 1
-            # Prepending larger item to copy_buffer
-            elif self[index1] > self[index2]:
-                copy_buffer.prepend(self[index1])
-                index1 += 1
-            else:
-                copy_buffer.prepend(self[index2])
-                index2 += 1
+    def sort(self, key = None, reverse = False):
+        """
+        Use a stable merge sort to sort contents of self, relinking nodes
+        rather than moving items. See merge_sort_nodes. If key or a
+        comparison raises, self keeps all of its items in some order.
+        """
+        try:
+            self.head, self.tail = merge_sort_nodes(self.head, key, reverse)
+        except Exception:
+            # Every node is still linked after self.head; find the tail again
+            probe = self.head
+            while probe is not None and probe.next is not None:
+                probe = probe.next
+            self.tail = probe
+            raise
 
-        # Keep reverse order in copy buffer so that next merge's prepends work
-        copy_buffer.reverse()
-                
-        # Copy values over to self
-        cb_ind = 0
-        for i in range(left, right + 1):
-            self[i] = copy_buffer[cb_ind]
-            cb_ind += 1
+    def splice(self, other):
+        """
+        Move all of other's nodes onto the end of self in O(1), leaving other
+        empty.
+        Precondition: other is a LinkedList of the same type as self.
+        Raises: TypeError
+        """
+        if type(other) != type(self):
+            msg = f"cannot splice {type(other).__name__} onto {type(self).__name__}"
+            raise TypeError(msg)
+        if other is self or other.is_empty():
+            return
+        if self.tail is None:
+            self.head = other.head
+        else:
+            self.tail.next = other.head
+        self.tail = other.tail
+        self.length += other.length
+        other.head = None
+        other.tail = None
+        other.length = 0
 
 
 class LinkedAdjacencyList(LinkedList):
+    node_type = LinkedEdge
 
     # Accessors
     def iter_node(self):
@@ -359,36 +471,81 @@ class LinkedAdjacencyList(LinkedList):
         """Prepend item to self."""
         self.insert(0, vertex, weight)
 
+    def link_node(self, vertex, following):
+        """
+        Return a new edge to vertex with the default weight whose next edge is
+        following.
+        """
+        return self.new_node(vertex, 1, following)
+
     def insert(self, index, vertex, weight = 1):
         """Insert item in self before index, increment length."""
         # Insert at head or self is empty
         if index <= 0 or self.is_empty():
-            self.head = LinkedEdge(vertex, weight, self.head)
+            self.head = self.new_node(vertex, weight, self.head)
+            if self.tail is None:
+                self.tail = self.head
+        # Insert at end of self
+        elif index >= len(self):
+            self.tail.next = self.new_node(vertex, weight, None)
+            self.tail = self.tail.next
         # Insert elsewhere in self
         else:
             probe = self.head
-            while index > 1 and probe.next is not None:
+            while index > 1:
                 probe = probe.next
                 index -= 1
-            probe.next = LinkedEdge(vertex, weight, probe.next)
+            probe.next = self.new_node(vertex, weight, probe.next)
 
         # Increment length
         self.length += 1
     
 
 class DoublyLinkedList(AbstractList):
-    """Represent a doubly-linked list."""
+    """
+    Represent a doubly-linked list.
+
+    Positional operations walk from the head, the tail or the finger, a cached
+    node from the last positional access, whichever is closest. A loop over
+    consecutive indices therefore takes O(1) steps per index. Mutators keep
+    the finger pointing at a live node or drop it.
+    """
+    node_type = TwoWayNode
 
-    def __init__(self, source_collection = None):
+    def __init__(self, source_collection = None, pool = None):
         """
         Instantiate and initialize self, optionally appending each item in
-        source_collection to self.
+        source_collection to self. Pass a NodePool of TwoWayNodes to recycle
+        nodes between inserts and pops.
+        Precondition: pool must hold nodes of type TwoWayNode.
+        Raises: TypeError
         """
+        if pool is not None and pool.node_type is not self.node_type:
+            msg = f"{type(self).__name__} needs a pool of {self.node_type.__name__}."
+            raise TypeError(msg)
+        self.pool = pool
         self.head = None
         self.tail = None
+        self.finger = None
+        self.finger_index = -1
         AbstractList.__init__(self, source_collection)
 
     # Accessors
+    def __getitem__(self, index):
+        """
+        Return item at index in self.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        return self.node_at(index).data
+
+    def cursor(self):
+        """
+        Return a DoublyLinkedListCursor positioned before the head of self.
+        See LinkedListCursor for when it stays valid.
+        """
+        return DoublyLinkedListCursor(self)
+
     def __iter__(self):
         """Support iteration over all items in self."""
         probe = self.head
@@ -396,47 +553,91 @@ class DoublyLinkedList(AbstractList):
             yield(probe.data)
             probe = probe.next
 
+    def node_at(self, index):
+        """
+        Return the node at index, walking from whichever of the head, tail and
+        finger is closest, and leave the finger on it.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        if index < 0:
+            raise IndexError("DoublyLinkedList index cannot be negative.")
+        elif index >= len(self):
+            raise IndexError("DoublyLinkedList index out of range.")
+
+        # Start at the closest known position
+        probe, position = self.head, 0
+        if len(self) - 1 - index < index:
+            probe, position = self.tail, len(self) - 1
+        if (self.finger is not None and
+                abs(self.finger_index - index) < abs(position - index)):
+            probe, position = self.finger, self.finger_index
+
+        while position < index:
+            probe = probe.next
+            position += 1
+        while position > index:
+            probe = probe.prev
+            position -= 1
+        self.finger = probe
+        self.finger_index = index
+        return probe
+
     # Mutators
     def clear(self):
         """Remove all items from self, set length to 0."""
+        if self.pool is not None:
+            while self.head is not None:
+                node = self.head
+                self.head = node.next
+                self.free_node(node)
         self.head = None
         self.tail = None
+        self.finger = None
         self.length = 0
 
     def extend(self, iterable):
-        """Extend self by appending each item in iterable."""
-        for item in iterable:
+        """
+        Extend self by appending each item in iterable, copied first so that
+        self can be extended by itself.
+        """
+        for item in list(iterable):
             self.append(item)
 
     def insert(self, index, item):
         """Insert item in self before index, increment length."""
         # Insert at head or self is empty
         if self.is_empty():
-            self.head = TwoWayNode(item, None, None)
+            self.head = self.new_node(item, None, None)
             self.tail = self.head
         elif index <= 0:
-            self.head.prev = TwoWayNode(item, self.head, None)
+            self.head.prev = self.new_node(item, self.head, None)
             self.head = self.head.prev
+            self.finger_index += 1
         # Insert at end of self
         elif index >= len(self):
-            self.tail.next = TwoWayNode(item, None, self.tail)
+            self.tail.next = self.new_node(item, None, self.tail)
             self.tail = self.tail.next
-        # Insert elsewhere in self
+        # Insert elsewhere in self, leaving the finger on the new node
         else:
-            probe = self.head
-            while index > 1 and probe.next is not None:
-                probe = probe.next
-                index -= 1
-            # Link current node to new node, give new node links
-            probe.next = TwoWayNode(item, probe.next, probe)
-
-            # If insert in middle, update prev of the node after inserted node
-            if probe.next.next:
-                probe.next.next.prev = probe.next
-            else:
-                self.tail = probe.next
+            after = self.node_at(index)
+            node = self.new_node(item, after, after.prev)
+            after.prev.next = node
+            after.prev = node
+            self.finger = node
         self.length += 1
 
+    def free_node(self, node):
+        """Hand a node unlinked from self back to self's pool, if any."""
+        if self.pool is not None:
+            self.pool.release(node)
+
+    def new_node(self, *args):
+        """Return a node built from args, taken from self's pool if any."""
+        if self.pool is not None:
+            return self.pool.acquire(*args)
+        return self.node_type(*args)
+
     def pop(self, index = 0):
         """
         Remove and return item at index, decrement length.
@@ -448,63 +649,260 @@ class DoublyLinkedList(AbstractList):
             raise IndexError("cannot pop from an empty list")
         elif index < 0 or index >= len(self):
             raise IndexError("pop index out of range")
+
+        node = self.node_at(index)
+        # Unlink node, updating head or tail if it was at an end
+        if node.prev is None:
+            self.head = node.next
         else:
-            self.length -= 1
-            
-            # Remove from head
-            if index == 0:
-                out = self.head.data
-                self.head = self.head.next
-                if self.head:
-                    self.head.prev = None
-                return out
-            # Remove from elsewhere
-            else:
-                probe = self.head
-                while index > 1 and probe.next is not None:
-                    probe = probe.next
-                    index -= 1
-                out = probe.next.data
-                # Popped middle node, need to update a prev pointer
-                if probe.next.next:
-                    probe.next.next.prev = probe
-                # Popped tail node, no prev pointer to update
+            node.prev.next = node.next
+        if node.next is None:
+            self.tail = node.prev
+        else:
+            node.next.prev = node.prev
+
+        # The node after the popped one takes over its index
+        self.finger = node.next
+        self.length -= 1
+        out = node.data
+        self.free_node(node)
+        return out
+
+    def remove_if(self, pred):
+        """
+        Remove every item in self for which pred(item) is true by unlinking
+        its node in O(n). Return the number of items removed. pred is called
+        on every item before any node is unlinked, so self is unchanged if it
+        raises.
+        """
+        doomed = [pred(item) for item in self]
+        self.finger = None
+        removed = 0
+        probe = self.head
+        for victim in doomed:
+            following = probe.next
+            if victim:
+                if probe.prev is None:
+                    self.head = following
                 else:
-                    self.tail = probe
+                    probe.prev.next = following
+                if following is None:
+                    self.tail = probe.prev
+                else:
+                    following.prev = probe.prev
+                self.free_node(probe)
+                removed += 1
+            probe = following
+        self.length -= removed
+        return removed
 
-                # Update probe.next to skip the popped node
-                probe.next = probe.next.next
-                return out
-                    
     def reverse(self):
-        """Reverse contents of self in place."""
-        if self.length > 1:
-            self.tail = self.head
-            
-            # Initialize traversal helpers
-            probe1 = self.head
-            probe2 = self.head.next
+        """Reverse contents of self in place by swapping each node's links."""
+        self.finger = None
+        probe = self.head
+        while probe is not None:
+            probe.next, probe.prev = probe.prev, probe.next
+            probe = probe.prev
+        self.head, self.tail = self.tail, self.head
 
-            # Probe2 stores our next value; we can safely set self.head.next to None
-            probe1.next = None
+    def __setitem__(self, index, value):
+        """
+        Set item at index to value.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        self.node_at(index).data = value
 
-            # Until probe2 reaches the tail, apply this process
-            while probe2.next is not None:
-                # Move everything forward
-                last_node = probe1
-                probe1 = probe2
-                probe2 = probe2.next
+    def sort(self, key = None, reverse = False):
+        """
+        Use a stable merge sort to sort contents of self, relinking nodes
+        rather than moving items, then restore prev pointers and the tail in
+        one pass. See merge_sort_nodes. If key or a comparison raises, self
+        keeps all of its items in some order.
+        """
+        self.finger = None
+        try:
+            self.head = merge_sort_nodes(self.head, key, reverse)[0]
+        finally:
+            prev = None
+            probe = self.head
+            while probe is not None:
+                probe.prev = prev
+                prev = probe
+                probe = probe.next
+            self.tail = prev
 
-                # Update pointers
-                probe1.next = last_node
-                probe1.prev = probe2
-                last_node.prev = probe1
-                
-            # Probe2 has reached the old tail
-            # So it's next is the previous probe, it's prev is None, and it is the head!
-            probe2.next = probe1
-            probe2.prev = None
-            self.head = probe2
+
+class CursorLinkedList(AbstractList):
+    """
+    Represent a doubly-linked list whose nodes are slots in parallel arrays.
+
+    Slot i of self.data holds a node's item and slots i of self.next_index and
+    self.prev_index hold the slots of its neighbors, with -1 standing in for
+    None. Slots freed by pop are chained through next_index into a free list
+    and reused by later inserts. The links are typed integer arrays, so the
+    list occupies a few contiguous buffers rather than one object per node,
+    traverses with good locality and pickles without recursing down a chain.
+    """
+
+    def __init__(self, source_collection = None, typecode = None):
+        """
+        Instantiate and initialize self, optionally appending each item in
+        source_collection to self. Pass typecode to store items in a typed,
+        compact array.
+        """
+        self.data = Array(typecode = typecode)
+        self.next_index = Array(fill_value = -1, typecode = 'q')
+        self.prev_index = Array(fill_value = -1, typecode = 'q')
+        self.head = -1
+        self.tail = -1
+        self.free = -1
+        AbstractList.__init__(self, source_collection)
+
+    # Accessors
+    def __getitem__(self, index):
+        """
+        Return item at index in self.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        return self.data[self.slot_at(index)]
+
+    def __iter__(self):
+        """Support iteration over all items in self."""
+        slot = self.head
+        while slot != -1:
+            yield self.data[slot]
+            slot = self.next_index[slot]
+
+    def slot_at(self, index):
+        """
+        Return the slot of the node at index, walking from the nearer end.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        if index < 0:
+            raise IndexError("CursorLinkedList index cannot be negative.")
+        elif index >= len(self):
+            raise IndexError("CursorLinkedList index out of range.")
+        if index <= len(self) // 2:
+            slot = self.head
+            for _ in range(index):
+                slot = self.next_index[slot]
+        else:
+            slot = self.tail
+            for _ in range(len(self) - 1 - index):
+                slot = self.prev_index[slot]
+        return slot
+
+    # Mutators
+    def allocate_slot(self, item, next_slot, prev_slot):
+        """Return a slot holding a new node, reusing a free slot if possible."""
+        if self.free != -1:
+            slot = self.free
+            self.free = self.next_index[slot]
+        else:
+            # Arrays share a high-water mark, so they grow together
+            slot = self.data.size()
+            self.data.grow()
+            self.next_index.grow()
+            self.prev_index.grow()
+        self.data[slot] = item
+        self.next_index[slot] = next_slot
+        self.prev_index[slot] = prev_slot
+        return slot
+
+    def clear(self):
+        """Remove all items from self, set length to 0."""
+        self.data.clear()
+        self.next_index.clear()
+        self.prev_index.clear()
+        self.head = -1
+        self.tail = -1
+        self.free = -1
+        self.length = 0
+
+    def compact(self):
+        """
+        Move the nodes of self into slots 0 through len(self) - 1 in list
+        order and release the free slots, restoring sequential layout after
+        heavy inserting and popping.
+        """
+        items = list(self)
+        self.clear()
+        for item in items:
+            self.append(item)
+
+    def extend(self, iterable):
+        """
+        Extend self by appending each item in iterable, copied first so that
+        self can be extended by itself.
+        """
+        for item in list(iterable):
+            self.append(item)
+
+    def free_slot(self, slot):
+        """Put the slot of an unlinked node on the free list."""
+        self.data[slot] = self.data.fill_value
+        self.prev_index[slot] = -1
+        self.next_index[slot] = self.free
+        self.free = slot
+
+    def insert(self, index, item):
+        """Insert item in self before index, increment length."""
+        if self.is_empty():
+            self.head = self.tail = self.allocate_slot(item, -1, -1)
+        elif index <= 0:
+            slot = self.allocate_slot(item, self.head, -1)
+            self.prev_index[self.head] = slot
+            self.head = slot
+        elif index >= len(self):
+            slot = self.allocate_slot(item, -1, self.tail)
+            self.next_index[self.tail] = slot
+            self.tail = slot
+        else:
+            after = self.slot_at(index)
+            before = self.prev_index[after]
+            slot = self.allocate_slot(item, after, before)
+            self.next_index[before] = slot
+            self.prev_index[after] = slot
+        self.length += 1
+
+    def pop(self, index = 0):
+        """
+        Remove and return item at index, decrement length.
+        Precondition: self is not empty, index in range(0, len(self)).
+        Raises: IndexError
+        """
+        if self.is_empty():
+            raise IndexError("cannot pop from an empty list")
+        elif index < 0 or index >= len(self):
+            raise IndexError("pop index out of range")
+        slot = self.slot_at(index)
+        out = self.data[slot]
+        before = self.prev_index[slot]
+        after = self.next_index[slot]
+        if before == -1:
+            self.head = after
+        else:
+            self.next_index[before] = after
+        if after == -1:
+            self.tail = before
+        else:
+            self.prev_index[after] = before
+        self.free_slot(slot)
+        self.length -= 1
+        return out
+
+    def reverse(self):
+        """Reverse contents of self in place by swapping each node's links."""
+        slot = self.head
+        while slot != -1:
+            after = self.next_index[slot]
+            self.next_index[slot] = self.prev_index[slot]
+            self.prev_index[slot] = after
+            slot = after
+        self.head, self.tail = self.tail, self.head
 
     def __setitem__(self, index, value):
         """
@@ -512,60 +910,447 @@ class DoublyLinkedList(AbstractList):
         Precondition: index in range(0, len(self)).
         Raises: IndexError
         """
-        # Check precondition
+        self.data[self.slot_at(index)] = value
+
+    def sort(self, key = None, reverse = False):
+        """
+        Stably sort contents of self with the sort engine, then rewrite items
+        along the existing links. See sort_sequence.
+        """
+        items = list(self)
+        sort_sequence(items, len(items), key, reverse)
+        slot = self.head
+        for item in items:
+            self.data[slot] = item
+            slot = self.next_index[slot]
+
+
+class UnrolledLinkedList(AbstractList):
+    """
+    Represent a singly-linked list whose nodes each hold up to block_size
+    items in an Array.
+
+    Items in a block sit next to each other, so iteration and memory use are
+    close to an array's, while a positional insert or pop walks about
+    n / block_size nodes and shifts at most block_size items. A full block is
+    split in half before an insert, and a block is merged with the next one
+    when a pop lets them fit in one, so blocks stay mostly full.
+    """
+    default_block_size = 32
+
+    def __init__(self, source_collection = None, block_size = None,
+                 typecode = None):
+        """
+        Instantiate and initialize self, optionally appending each item in
+        source_collection to self. Pass block_size to set how many items a
+        node holds and typecode to store them in typed, compact arrays.
+        Precondition: block_size must be at least 2.
+        Raises: ValueError
+        """
+        if block_size is None:
+            block_size = UnrolledLinkedList.default_block_size
+        if block_size < 2:
+            raise ValueError("UnrolledLinkedList block size must be at least 2.")
+        self.block_size = block_size
+        self.typecode = typecode
+        self.head = None
+        self.tail = None
+        AbstractList.__init__(self, source_collection)
+
+    # Accessors
+    def __getitem__(self, index):
+        """
+        Return item at index in self.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        node, offset = self.locate(index)[1:]
+        return node.items[offset]
+
+    def __iter__(self):
+        """Support iteration over all items in self."""
+        probe = self.head
+        while probe is not None:
+            yield from probe.items
+            probe = probe.next
+
+    def locate(self, index):
+        """
+        Return the node before the one holding index (None for the head), the
+        node holding index and the offset of index in its block.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
         if index < 0:
-            raise IndexError("LinkedList index cannot be negative")
+            raise IndexError("UnrolledLinkedList index cannot be negative.")
         elif index >= len(self):
-            raise IndexError("LinkedList index out of range.")
+            raise IndexError("UnrolledLinkedList index out of range.")
+        previous = None
+        node = self.head
+        while index >= node.items.size():
+            index -= node.items.size()
+            previous = node
+            node = node.next
+        return previous, node, index
+
+    # Mutators
+    def append(self, item):
+        """Place item at end of self in O(1), increment length."""
+        if self.tail is None or self.tail.items.size() == self.block_size:
+            self.link_block(self.tail)
+        block = self.tail.items
+        block[block.size()] = item
+        self.length += 1
+
+    def clear(self):
+        """Remove all items from self, set length to 0."""
+        self.head = None
+        self.tail = None
+        self.length = 0
+
+    def extend(self, iterable):
+        """Extend self by appending each item in iterable."""
+        for item in iterable:
+            self.append(item)
 
-        # Traverse
+    def insert(self, index, item):
+        """Insert item in self before index, increment length."""
+        index = max(index, 0)
+        if index >= len(self):
+            self.append(item)
+            return
+        node, offset = self.locate(index)[1:]
+
+        # Split a full block, moving its second half into a new node
+        if node.items.size() == self.block_size:
+            half = self.block_size // 2
+            self.split_block(node, half)
+            if offset > half:
+                node = node.next
+                offset -= half
+
+        # Shift the rest of the block right and place item
+        block = node.items
+        i = block.size()
+        while i > offset:
+            block[i] = block[i - 1]
+            i -= 1
+        block[offset] = item
+        self.length += 1
+
+    def link_block(self, before):
+        """
+        Link a new node with an empty block in after before, or at the head
+        if before is None, and return it.
+        """
+        block = Array(self.block_size, typecode = self.typecode)
+        if before is None:
+            node = UnrolledNode(block, self.head)
+            self.head = node
+        else:
+            node = UnrolledNode(block, before.next)
+            before.next = node
+        if node.next is None:
+            self.tail = node
+        return node
+
+    def pop(self, index = 0):
+        """
+        Remove and return item at index, decrement length.
+        Precondition: self is not empty, index in range(0, len(self)).
+        Raises: IndexError
+        """
+        if self.is_empty():
+            raise IndexError("cannot pop from an empty list")
+        elif index < 0 or index >= len(self):
+            raise IndexError("pop index out of range")
+        previous, node, offset = self.locate(index)
+
+        # Shift the rest of the block left over the popped item
+        block = node.items
+        out = block[offset]
+        for i in range(offset + 1, block.size()):
+            block[i - 1] = block[i]
+        block[block.size() - 1] = block.fill_value
+        block.logical_size -= 1
+        self.length -= 1
+
+        # Merge the next block in if both fit in one, else drop an empty node
+        following = node.next
+        if following is not None and (block.size() + following.items.size()
+                                      <= self.block_size):
+            for item in following.items:
+                block[block.size()] = item
+            node.next = following.next
+            if following is self.tail:
+                self.tail = node
+        elif block.size() == 0:
+            if previous is None:
+                self.head = following
+            else:
+                previous.next = following
+            if node is self.tail:
+                self.tail = previous
+        return out
+
+    def reverse(self):
+        """Reverse contents of self in place, block by block."""
+        previous = None
         probe = self.head
-        while probe is not None and index != 0:
+        self.tail = probe
+        while probe is not None:
+            block = probe.items
+            left = 0
+            right = block.size() - 1
+            while left < right:
+                block[left], block[right] = block[right], block[left]
+                left += 1
+                right -= 1
+            following = probe.next
+            probe.next = previous
+            previous = probe
+            probe = following
+        self.head = previous
+
+    def __setitem__(self, index, value):
+        """
+        Set item at index to value.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        node, offset = self.locate(index)[1:]
+        node.items[offset] = value
+
+    def sort(self, key = None, reverse = False):
+        """
+        Stably sort contents of self with the sort engine, then repack the
+        items into full blocks. See sort_sequence.
+        """
+        items = list(self)
+        sort_sequence(items, len(items), key, reverse)
+        self.clear()
+        self.extend(items)
+
+    def split_block(self, node, keep):
+        """Move all but the first keep items of node's block into a new node."""
+        block = node.items
+        new_block = self.link_block(node).items
+        for i in range(keep, block.size()):
+            new_block[i - keep] = block[i]
+            block[i] = block.fill_value
+        block.logical_size = keep
+
+
+class LinkedListCursor:
+    """
+    Walk a LinkedList in either direction and edit it at the cursor.
+
+    A cursor is either on a node, the one its last next or prev call returned,
+    or in the gap between two nodes. A new cursor is in the gap before the
+    head, and removing a node leaves the cursor in the gap where it was.
+    next and prev move onto the node after or before the cursor. replace and
+    remove act on the cursor's node. insert_before and insert_after link a new
+    node on either side of it, or behind or ahead of the cursor in a gap.
+
+    Every operation is O(1), except prev on a singly-linked list, which walks
+    from the head to find the new previous node and is O(n).
+
+    Invalidation: a cursor stays valid while its list is changed only through
+    that cursor. Any other change to the list, including index-based
+    mutators, clear, sort, reverse and edits through another cursor, makes
+    the cursor's behavior undefined; make a new cursor instead.
+    """
+
+    def __init__(self, source):
+        """Position self in the gap before the head of source."""
+        self.source = source
+        self.previous = None
+        self.current = None
+
+    # Accessors
+    def check_current(self):
+        """
+        Return the cursor's node.
+        Precondition: the cursor is on a node rather than in a gap.
+        Raises: LookupError
+        """
+        if self.current is None:
+            raise LookupError("cursor is not on an item")
+        return self.current
+
+    def following(self):
+        """Return the node that next would move onto, or None at the end."""
+        if self.current is not None:
+            return self.current.next
+        elif self.previous is not None:
+            return self.previous.next
+        return self.source.head
+
+    def has_next(self):
+        """Return True if there is a node after the cursor."""
+        return self.following() is not None
+
+    def has_prev(self):
+        """Return True if there is a node before the cursor."""
+        return self.previous is not None
+
+    def __iter__(self):
+        """Support iteration with for loop, moving the cursor forward."""
+        return self
+
+    def predecessor(self, node):
+        """Return the node before node in source, or None if node is the head."""
+        probe = self.source.head
+        if probe is node:
+            return None
+        while probe.next is not node:
             probe = probe.next
-            index -= 1
-        probe.data = value
-
-    def sort(self, reverse = False):
-        """Use mergesort to sort contents of self."""
-        self.sort_helper(0, len(self) - 1)
-
-        if reverse:
-            self.reverse()
-
-    def sort_helper(self, left, right):
-        """Help with merge sort."""
-        if left < right:
-            mid = (left + right) // 2
-            self.sort_helper(left, mid)
-            self.sort_helper(mid + 1, right)
-            self.merge(left, mid, right)
-
-    def merge(self, left, mid, right):
-        """Merge two sorted lists together."""
-        index1 = left
-        index2 = mid + 1
-        copy_buffer = DoublyLinkedList()
-
-        # Use copy_buffer to track merged order
-        for i in range(left, right + 1):
-            # Run out of element in one list
-            if index1 > mid:
-                copy_buffer.append(self[index2])
-                index2 += 1
-            elif index2 > right:
-                copy_buffer.append(self[index1])
-                index1 += 1
-            # Appending smaller item to copy_buffer
-            elif self[index1] < self[index2]:
-                copy_buffer.append(self[index1])
-                index1 += 1
-            else:
-                copy_buffer.append(self[index2])
-                index2 += 1
-
-        # Copy ordered values in buffer to self
-        cb_ind = 0
-        for i in range(left, right + 1):
-            self[i] = copy_buffer[cb_ind]
-            cb_ind += 1
+        return probe
+
+    # Mutators
+    def insert_after(self, item):
+        """
+        Link a new node holding item after the cursor's node or, in a gap,
+        ahead of the cursor. Either way next returns it.
+        """
+        self.link(self.current if self.current is not None else self.previous,
+                  item)
+
+    def insert_before(self, item):
+        """
+        Link a new node holding item before the cursor's node or, in a gap,
+        behind the cursor. Either way prev returns it.
+        """
+        self.previous = self.link(self.previous, item)
+
+    def link(self, before, item):
+        """
+        Link a new node holding item in after before, or at the head if before
+        is None, and return it.
+        """
+        source = self.source
+        following = before.next if before is not None else source.head
+        node = source.link_node(item, following)
+        if before is None:
+            source.head = node
+        else:
+            before.next = node
+        if following is None:
+            source.tail = node
+        source.length += 1
+        return node
+
+    def next(self):
+        """
+        Move onto the node after the cursor and return its item.
+        Raises: StopIteration if there is no such node.
+        """
+        node = self.following()
+        if node is None:
+            raise StopIteration
+        if self.current is not None:
+            self.previous = self.current
+        self.current = node
+        return node.data
+
+    def __next__(self):
+        """Support iteration with for loop, moving the cursor forward."""
+        return self.next()
+
+    def prev(self):
+        """
+        Move onto the node before the cursor and return its item.
+        Raises: StopIteration if there is no such node.
+        """
+        if self.previous is None:
+            raise StopIteration
+        self.current = self.previous
+        self.previous = self.predecessor(self.current)
+        return self.current.data
+
+    def remove(self):
+        """
+        Unlink the cursor's node from source and return its item, leaving the
+        cursor in the gap.
+        Precondition: the cursor is on a node.
+        Raises: LookupError
+        """
+        node = self.check_current()
+        if self.previous is None:
+            self.source.head = node.next
+        else:
+            self.previous.next = node.next
+        if node.next is None:
+            self.source.tail = self.previous
+        self.source.length -= 1
+        self.current = None
+        out = node.data
+        self.source.free_node(node)
+        return out
+
+    def replace(self, item):
+        """
+        Replace the item in the cursor's node with item.
+        Precondition: the cursor is on a node.
+        Raises: LookupError
+        """
+        self.check_current().data = item
+
+
+class DoublyLinkedListCursor(LinkedListCursor):
+    """
+    Walk a DoublyLinkedList in either direction and edit it at the cursor.
+    Every operation is O(1). Edits drop the list's finger, since they shift
+    indices. See LinkedListCursor.
+    """
+
+    # Accessors
+    def predecessor(self, node):
+        """Return the node before node in source, or None if node is the head."""
+        return node.prev
+
+    # Mutators
+    def link(self, before, item):
+        """
+        Link a new node holding item in after before, or at the head if before
+        is None, and return it.
+        """
+        source = self.source
+        following = before.next if before is not None else source.head
+        node = source.new_node(item, following, before)
+        if before is None:
+            source.head = node
+        else:
+            before.next = node
+        if following is None:
+            source.tail = node
+        else:
+            following.prev = node
+        source.length += 1
+        source.finger = None
+        return node
+
+    def remove(self):
+        """
+        Unlink the cursor's node from source and return its item, leaving the
+        cursor in the gap.
+        Precondition: the cursor is on a node.
+        Raises: LookupError
+        """
+        node = self.check_current()
+        source = self.source
+        if node.prev is None:
+            source.head = node.next
+        else:
+            node.prev.next = node.next
+        if node.next is None:
+            source.tail = node.prev
+        else:
+            node.next.prev = node.prev
+        source.length -= 1
+        source.finger = None
+        self.current = None
+        out = node.data
+        source.free_node(node)
+        return out
 
@@ -9,12 +9,27 @@ Exports:
                 adjacency list.
     
     Node: Node with data and a single node link.
+
+    NodePool: Bounded free list that recycles released nodes of one type.
+
+    SkipNode: Node with data and a tower of forward links and their widths,
+              used in a skip list.
     
+    TrieNode: Node holding up to 32 children or items in a persistent vector.
+
     TwoWayNode: Node with data and two node links (next and previous).
+
+    UnrolledNode: Node holding a block of items in an Array and a single link,
+                  used in an unrolled linked list.
+
+Nodes declare __slots__ so that they carry no per-instance __dict__; linked
+structures allocate one node per item, so this keeps their overhead small.
 """
 
 class BSTNode:
     """Represent nodes in a binary search tree."""
+    __slots__ = ("data", "left", "right")
+
     def __init__(self, data, left = None, right = None):
         """Instantiate and initialize self."""
         self.data = data
@@ -24,6 +39,8 @@ class BSTNode:
 
 class Node:
     """Represent a singly-linked node."""
+    __slots__ = ("data", "next")
+
     def __init__(self, data, _next = None):
         """Instantiate a node."""
         self.data = data
@@ -38,6 +55,8 @@ class Node:
 
 class LinkedEdge(Node):
     """Represent vertices in an adjacency list for a graph representation."""
+    __slots__ = ("weight",)
+
     def __init__(self, data, weight = 1, _next = None):
         """Instantiate and initialize self."""
         Node.__init__(self, data, _next)
@@ -52,7 +71,119 @@ class LinkedEdge(Node):
 
 class TwoWayNode(Node):
     """Represent a doubly-linked node."""
+    __slots__ = ("prev",)
+
     def __init__(self, data, _next = None, prev = None):
         Node.__init__(self, data, _next)
         self.prev = prev
-        
+
+
+class NodePool:
+    """
+    Recycle released nodes of one type.
+
+    Linked collections given a pool take nodes from it when inserting and
+    hand unlinked nodes back when removing, so steady-state insert/remove
+    cycles reuse nodes instead of allocating them. A pool may be private to
+    one collection or shared by several; it keeps at most max_size free nodes.
+    hits counts nodes served from the pool and misses counts new allocations.
+    """
+
+    def __init__(self, node_type = Node, max_size = 1024):
+        """Instantiate an empty pool of node_type nodes."""
+        self.node_type = node_type
+        self.max_size = max_size
+        self.free = []
+        self.hits = 0
+        self.misses = 0
+
+    # Accessors
+    def __len__(self):
+        """Return the number of free nodes in self."""
+        return len(self.free)
+
+    def __repr__(self):
+        """Return the unique string representation of self."""
+        return (f"NodePool({self.node_type.__name__}, {len(self)} free, "
+                f"{self.hits} hits, {self.misses} misses)")
+
+    # Mutators
+    def acquire(self, *args):
+        """
+        Return a node initialized with args, reusing a free node if there is
+        one.
+        """
+        if self.free:
+            self.hits += 1
+            node = self.free.pop()
+            node.__init__(*args)
+            return node
+        self.misses += 1
+        return self.node_type(*args)
+
+    def release(self, node):
+        """
+        Take back a node that is no longer linked into any structure. Its
+        links and data are cleared so the pool keeps nothing else alive.
+        """
+        if len(self.free) < self.max_size:
+            node.__init__(None)
+            self.free.append(node)
+
+
+class SkipNode:
+    """
+    Represent a node in a width-augmented skip list. next[i] is the next node
+    on level i and width[i] is how many positions that link skips.
+    """
+    __slots__ = ("data", "next", "width")
+
+    def __init__(self, data, level = 1):
+        """Instantiate a node whose tower is level links high."""
+        self.data = data
+        self.next = [None] * level
+        self.width = [0] * level
+
+    def __repr__(self):
+        return f"SkipNode({self.data}, {len(self.next)})"
+
+    def __str__(self):
+        return f"{self.data}"
+
+
+class UnrolledNode:
+    """
+    Represent a node in an unrolled linked list. items is an Array whose
+    capacity is the list's block size and whose logical size is the number of
+    items in the node.
+    """
+    __slots__ = ("items", "next")
+
+    def __init__(self, items, _next = None):
+        """Instantiate a node holding the Array items."""
+        self.items = items
+        self.next = _next
+
+    def __repr__(self):
+        return f"UnrolledNode({self.items})"
+
+    def __str__(self):
+        return f"{self.items}"
+
+
+class TrieNode:
+    """
+    Represent a node in the trie of a persistent vector. array is a Python
+    list of child nodes or, at the leaves, items. edit is the token of the
+    transient vector allowed to change the node in place, if any.
+    """
+    __slots__ = ("array", "edit")
+
+    def __init__(self, array = None, edit = None):
+        """Instantiate a node holding array."""
+        self.array = array if array is not None else []
+        self.edit = edit
+
+    def __repr__(self):
+        return f"TrieNode({len(self.array)})"
+
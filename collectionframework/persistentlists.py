@@ -0,0 +1,393 @@
+"""
+Author:  Russell Gerhard
+Purpose: Provide an immutable list that shares structure between versions,
+         along with a mutable builder for filling one quickly.
+
+Exports:
+    TrieVector: Abstract class providing the accessors shared by persistent
+                and transient vectors.
+
+    PersistentVector: Immutable list whose append, set and pop return a new
+                      version in O(log32 n), sharing all untouched nodes with
+                      the old one.
+
+    TransientVector: Mutable, single-owner version of a PersistentVector for
+                     batches of changes, turned back into a persistent vector
+                     in O(1).
+"""
+
+from abstractclasses.abstractcollection import AbstractCollection
+from nodes import TrieNode
+
+# Each trie node holds up to branching children, indexed by bits bits
+bits = 5
+branching = 1 << bits
+mask = branching - 1
+
+def editable(node, edit):
+    """
+    Return node if the transient owning token edit may change it in place,
+    else a copy of node owned by edit. A persistent vector passes edit None
+    and so always gets a copy.
+    """
+    if edit is not None and node.edit is edit:
+        return node
+    return TrieNode(list(node.array), edit)
+
+def new_path(level, node, edit):
+    """Return a chain of single-child nodes from level down to node."""
+    if level == 0:
+        return node
+    return TrieNode([new_path(level - bits, node, edit)], edit)
+
+def assoc(level, node, index, item, edit):
+    """Return node, copied along the path to index, with item at index."""
+    out = editable(node, edit)
+    if level == 0:
+        out.array[index & mask] = item
+    else:
+        child = (index >> level) & mask
+        out.array[child] = assoc(level - bits, node.array[child], index, item,
+                                 edit)
+    return out
+
+def pop_tail(length, level, node, edit):
+    """
+    Return node, copied along the path to the last leaf, with that leaf
+    removed, or None if nothing is left below node.
+    """
+    child = ((length - 2) >> level) & mask
+    if level > bits:
+        new_child = pop_tail(length, level - bits, node.array[child], edit)
+        if new_child is None and child == 0:
+            return None
+        out = editable(node, edit)
+        if new_child is None:
+            del out.array[child:]
+        else:
+            out.array[child] = new_child
+        return out
+    elif child == 0:
+        return None
+    out = editable(node, edit)
+    del out.array[child:]
+    return out
+
+def push_tail(length, level, parent, tail_node, edit):
+    """
+    Return parent, copied along the path to the first free leaf slot, with
+    tail_node stored in that slot.
+    """
+    out = editable(parent, edit)
+    child = ((length - 1) >> level) & mask
+    if level == bits:
+        node = tail_node
+    elif child < len(parent.array):
+        node = push_tail(length, level - bits, parent.array[child], tail_node,
+                         edit)
+    else:
+        node = new_path(level - bits, tail_node, edit)
+    if child < len(out.array):
+        out.array[child] = node
+    else:
+        out.array.append(node)
+    return out
+
+
+class TrieVector(AbstractCollection):
+    """
+    Implement the accessors shared by persistent and transient vectors.
+
+    Items live in the leaves of a trie of TrieNodes with up to 32 children
+    each. The top shift bits of an index, 5 at a time, choose the child on
+    each level. The last 1 to 32 items are kept apart in a tail list, so
+    appends only touch the trie once every 32 items.
+    """
+
+    # Accessors
+    def array_for(self, index):
+        """
+        Return the leaf list, or the tail, holding index.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        if index < 0:
+            raise IndexError(f"{type(self).__name__} index cannot be negative.")
+        elif index >= len(self):
+            raise IndexError(f"{type(self).__name__} index out of range.")
+        if index >= self.tail_offset():
+            return self.tail
+        node = self.root
+        for level in range(self.shift, 0, -bits):
+            node = node.array[(index >> level) & mask]
+        return node.array
+
+    def __getitem__(self, index):
+        """
+        Return item at index in self in O(log32 n).
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        return self.array_for(index)[index & mask]
+
+    def index(self, item):
+        """Return first index of value in self, else return -1."""
+        for i, obj in enumerate(self):
+            if obj == item:
+                return i
+        return -1
+
+    def __iter__(self):
+        """Support iteration over all items in self, a leaf at a time."""
+        for start in range(0, len(self), branching):
+            yield from self.array_for(start)
+
+    def tail_offset(self):
+        """Return the index of the first item in the tail."""
+        if len(self) < branching:
+            return 0
+        return ((len(self) - 1) >> bits) << bits
+
+
+class PersistentVector(TrieVector):
+    """
+    Represent an immutable list. append, set and pop return a new vector
+    that copies only the O(log32 n) nodes on the path they change and shares
+    the rest with self, so keeping old versions around is cheap.
+    """
+
+    def __init__(self, source_collection = None):
+        """
+        Instantiate and initialize self, optionally holding each item in
+        source_collection, which is loaded through a transient vector.
+        """
+        self.length = 0
+        self.shift = bits
+        self.root = TrieNode()
+        self.tail = []
+        if source_collection:
+            builder = TransientVector(self)
+            builder.extend(source_collection)
+            self.length, self.shift, self.root, self.tail = builder.freeze()
+
+    @classmethod
+    def from_parts(cls, length, shift, root, tail):
+        """Return a vector made of an existing trie and tail."""
+        out = cls.__new__(cls)
+        out.length = length
+        out.shift = shift
+        out.root = root
+        out.tail = tail
+        return out
+
+    # Accessors
+    def __add__(self, other):
+        """
+        Return a vector holding the items of self followed by those of other.
+        Precondition: other must be same type as self
+        Raises: TypeError
+        """
+        if type(other) != type(self):
+            msg = f"cannot concatenate {type(self).__name__} with different type"
+            raise TypeError(msg)
+        return self.extend(other)
+
+    def append(self, item):
+        """Return a new vector with item appended to the items of self."""
+        length = len(self)
+        if length - self.tail_offset() < branching:
+            return PersistentVector.from_parts(length + 1, self.shift,
+                                               self.root, self.tail + [item])
+
+        # The tail is full, so push it into the trie as a leaf
+        tail_node = TrieNode(self.tail)
+        shift = self.shift
+        if (length >> bits) > (1 << shift):
+            root = TrieNode([self.root, new_path(shift, tail_node, None)])
+            shift += bits
+        else:
+            root = push_tail(length, shift, self.root, tail_node, None)
+        return PersistentVector.from_parts(length + 1, shift, root, [item])
+
+    def copy(self):
+        """Return self, which is immutable and so its own copy."""
+        return self
+
+    def extend(self, iterable):
+        """Return a new vector with each item in iterable appended."""
+        builder = self.transient()
+        builder.extend(iterable)
+        return builder.persistent()
+
+    def __hash__(self):
+        """Return a hash of the items of self, which never change."""
+        return hash(tuple(self))
+
+    def pop(self):
+        """
+        Return a new vector without the last item of self.
+        Precondition: self is not empty.
+        Raises: IndexError
+        """
+        length = len(self)
+        if length == 0:
+            raise IndexError("cannot pop from an empty vector")
+        elif length == 1:
+            return PersistentVector()
+        elif length - self.tail_offset() > 1:
+            return PersistentVector.from_parts(length - 1, self.shift,
+                                               self.root, self.tail[:-1])
+
+        # The tail empties, so the last leaf of the trie becomes the tail
+        tail = self.array_for(length - 2)
+        root = pop_tail(length, self.shift, self.root, None)
+        shift = self.shift
+        if root is None:
+            root = TrieNode()
+        if shift > bits and len(root.array) == 1:
+            root = root.array[0]
+            shift -= bits
+        return PersistentVector.from_parts(length - 1, shift, root, tail)
+
+    def set(self, index, item):
+        """
+        Return a new vector with item in place of the item at index.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        self.array_for(index)
+        if index >= self.tail_offset():
+            tail = list(self.tail)
+            tail[index & mask] = item
+            return PersistentVector.from_parts(len(self), self.shift,
+                                               self.root, tail)
+        root = assoc(self.shift, self.root, index, item, None)
+        return PersistentVector.from_parts(len(self), self.shift, root,
+                                           self.tail)
+
+    def transient(self):
+        """Return a TransientVector holding the items of self, in O(1)."""
+        return TransientVector(self)
+
+
+class TransientVector(TrieVector):
+    """
+    Represent a mutable vector for building or batch-editing a persistent
+    one. It shares the trie of the vector it started from and copies a node
+    the first time it changes it, after which it changes its own copy in
+    place. persistent() hands the result over in O(1) and ends the
+    transient, whose mutators then raise ValueError.
+    """
+
+    def __init__(self, source_collection = None):
+        """
+        Instantiate and initialize self, starting from source_collection in
+        O(1) if it is a PersistentVector and appending each of its items
+        otherwise.
+        """
+        # Nodes created by self carry this token and may be changed in place
+        self.edit = object()
+        if isinstance(source_collection, PersistentVector):
+            self.length = len(source_collection)
+            self.shift = source_collection.shift
+            self.root = source_collection.root
+            self.tail = list(source_collection.tail)
+        else:
+            self.shift = bits
+            self.root = TrieNode(edit = self.edit)
+            self.tail = []
+            AbstractCollection.__init__(self, source_collection)
+
+    # Accessors
+    def check_editable(self):
+        """
+        Raise ValueError if persistent() has already been called on self.
+        """
+        if self.edit is None:
+            raise ValueError("transient vector used after persistent()")
+
+    # Mutators
+    def add(self, item):
+        """Append item to self."""
+        self.append(item)
+
+    def append(self, item):
+        """Append item to self, increment length."""
+        self.check_editable()
+        length = len(self)
+        if length - self.tail_offset() < branching:
+            self.tail.append(item)
+            self.length += 1
+            return
+
+        # The tail is full, so push it into the trie as a leaf
+        tail_node = TrieNode(self.tail, self.edit)
+        if (length >> bits) > (1 << self.shift):
+            self.root = TrieNode([self.root, new_path(self.shift, tail_node,
+                                                      self.edit)], self.edit)
+            self.shift += bits
+        else:
+            self.root = push_tail(length, self.shift, self.root, tail_node,
+                                  self.edit)
+        self.tail = [item]
+        self.length += 1
+
+    def extend(self, iterable):
+        """Extend self by appending each item in iterable."""
+        for item in iterable:
+            self.append(item)
+
+    def freeze(self):
+        """
+        End self and return its length, shift, root and tail for a persistent
+        vector to take over.
+        """
+        self.check_editable()
+        self.edit = None
+        return self.length, self.shift, self.root, self.tail
+
+    def persistent(self):
+        """End self and return a PersistentVector of its items, in O(1)."""
+        return PersistentVector.from_parts(*self.freeze())
+
+    def pop(self):
+        """
+        Remove and return the last item of self, decrement length.
+        Precondition: self is not empty.
+        Raises: IndexError
+        """
+        self.check_editable()
+        length = len(self)
+        if length == 0:
+            raise IndexError("cannot pop from an empty vector")
+        out = self[length - 1]
+        if length == 1 or length - self.tail_offset() > 1:
+            self.tail.pop()
+            self.length -= 1
+            return out
+
+        # The tail empties, so the last leaf of the trie becomes the tail
+        tail = list(self.array_for(length - 2))
+        root = pop_tail(length, self.shift, self.root, self.edit)
+        if root is None:
+            root = TrieNode(edit = self.edit)
+        if self.shift > bits and len(root.array) == 1:
+            root = root.array[0]
+            self.shift -= bits
+        self.root = root
+        self.tail = tail
+        self.length -= 1
+        return out
+
+    def __setitem__(self, index, item):
+        """
+        Set item at index to item.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        self.check_editable()
+        self.array_for(index)
+        if index >= self.tail_offset():
+            self.tail[index & mask] = item
+        else:
+            self.root = assoc(self.shift, self.root, index, item, self.edit)
@@ -9,39 +9,28 @@ Exports:
 """
 
 from abstractclasses.abstractcollection import AbstractCollection
-from dynamicarray import Array
+from dynamicarray import CircularArray
 from lists import DoublyLinkedList
 
 class ArrayQueue(AbstractCollection):
     """Implement queue ADT using a circular array."""
 
     # Constructor
-    def __init__(self, source_collection = None):
+    def __init__(self, source_collection = None, typecode = None,
+                 policy = None):
         """
         Initialize self, optionally adding each item in source_collection to
-        self.
+        self. Pass typecode to store items in a typed, compact array and policy
+        to control how it resizes.
         """
-        # I should implement a CircularArray class with front and rear
-        # so that shrink actually works
-        self.items = Array()
-        self.front = 0
-        self.rear = 0
+        self.items = CircularArray(typecode = typecode, policy = policy)
         AbstractCollection.__init__(self, source_collection)
 
     # Accessors
     def __iter__(self):
         """Support iteration over every item in self from front to rear."""
-        if self.front < self.rear:
-            for i in range(self.front, self.rear + 1):
-                yield self.items[i]
-        elif self.rear < self.front:
-            for i in range(self.front, self.items.capacity):
-                yield self.items[i]
-            for i in range(0, self.rear + 1):
-                yield self.items[i]
-        else:
-            if not self.is_empty():
-                yield self.items[self.front]
+        for item in self.items:
+            yield item
         
     def peek(self):
         """
@@ -51,45 +40,27 @@ class ArrayQueue(AbstractCollection):
         """
         if self.is_empty():
             raise LookupError("Cannot peek at empty queue.")
-        return self.items[self.front]
+        return self.items[0]
 
     # Mutators
     def add(self, item):
         """Add item to rear of self, increment length."""
-        # Grow circular array if necessary
-        if len(self) == self.items.capacity:
-
-            # Copy items into array with double the capacity
-            temp = Array(len(self)*2)
-
-            for i, obj in enumerate(self):
-                temp[i] = obj
-            
-            self.items.capacity = len(self)*2
-            self.items = temp
-
-            # Reset array pointers
-            self.front = 0
-            self.rear = len(self) - 1
-             
-        # Update rear
-        if self.rear == self.items.capacity - 1:
-            self.rear = 0
-        elif self.is_empty():
-            pass
-        else:
-            self.rear += 1
-
-        # Add new item at rear and increment length
-        self.items[self.rear] = item  
+        # Circular array grows itself if necessary
+        self.items.push_back(item)
         self.length += 1
 
+    def add_all(self, iterable):
+        """
+        Add each item in iterable to rear of self, growing the circular array
+        at most once.
+        """
+        self.items.extend(iterable)
+        self.length = self.items.size()
+
     def clear(self):
         """Remove every item from self, set length to 0."""
-        self.items = Array()
+        self.items.clear()
         self.length = 0
-        self.front = 0
-        self.rear = 0
 
     def pop(self):
         """
@@ -99,15 +70,8 @@ class ArrayQueue(AbstractCollection):
         """
         if self.is_empty():
             raise LookupError("Cannot pop from empty queue.")
-        out = self.items[self.front]
-        self.items[self.front] = None
-
-        # Update front pointer
-        if self.front == self.items.capacity:
-            self.front = 0
-        else:
-            self.front +=1
-
+        # Circular array shrinks itself if necessary
+        out = self.items.pop_front()
         self.length -= 1
         return out
 
@@ -115,12 +79,13 @@ class DoublyLinkedQueue(AbstractCollection):
     """Implement queue ADT using a doubly linked list."""
 
     # Constructor
-    def __init__(self, source_collection = None):
+    def __init__(self, source_collection = None, pool = None):
         """
         Initialize self, optionally adding each item in source_collection to
-        self.
+        self. Pass a NodePool of TwoWayNodes to recycle nodes between adds and
+        pops.
         """
-        self.items = DoublyLinkedList()
+        self.items = DoublyLinkedList(pool = pool)
         AbstractCollection.__init__(self, source_collection)
 
     # Accessors
@@ -149,7 +114,7 @@ class DoublyLinkedQueue(AbstractCollection):
     
     def clear(self):
         """Remove every item from self, set length to 0."""
-        self.items = DoublyLinkedList()
+        self.items.clear()
         self.length = 0
 
     def pop(self):
@@ -7,11 +7,20 @@ Exports:
     ArraySet: Set ADT implementation using an array.
     
     ArraySortedSet: Sorted set ADT implementation using an array.
+
+    HashSet: Set ADT implementation using a hash table.
+
+    IntBitSet: Set ADT implementation for small non-negative integers using
+               an array of bit words.
     
     LinkedSet: Set ADT implementation using a linked list.
 """
 
-from bags import ArrayBag, ArraySortedBag, LinkedBag
+from itertools import chain, repeat, zip_longest
+from operator import index as as_index
+from bags import ArrayBag, ArraySortedBag, HashBag, LinkedBag
+from dynamicarray import Array
+from abstractclasses.abstractbag import AbstractBag
 from abstractclasses.abstractset import AbstractSet
          
 class ArraySet(AbstractSet, ArrayBag):
@@ -29,8 +38,52 @@ class ArraySet(AbstractSet, ArrayBag):
 class ArraySortedSet(AbstractSet, ArraySortedBag):
     """
     Implement sorted set ADT using an array, inheriting from ArraySortedBag.
+    The set operations use the sorted merges of ArraySortedBag rather than
+    the membership tests of AbstractSet; on items that are all distinct the
+    multiset operations are the set operations.
     """
 
+    # Accessors
+    def __and__(self, other):
+        """
+        Return the intersection of self and other by a sorted merge.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        return ArraySortedBag.__and__(self, other)
+
+    def is_subset(self, other):
+        """
+        Return True if self is a subset of other, by a sorted merge.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        return ArraySortedBag.is_subset(self, other)
+
+    def __or__(self, other):
+        """
+        Return the union of self and other by a sorted merge.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        return ArraySortedBag.__or__(self, other)
+
+    def __sub__(self, other):
+        """
+        Return set difference self - other by a sorted merge.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        return ArraySortedBag.__sub__(self, other)
+
+    def __xor__(self, other):
+        """
+        Return the symmetric difference of self and other by a sorted merge.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        return ArraySortedBag.__xor__(self, other)
+
     # Mutators
     def add(self, item):
         """
@@ -44,6 +97,297 @@ class ArraySortedSet(AbstractSet, ArraySortedBag):
         if item not in self:
             ArraySortedBag.add(self, item)
 
+    def add_all(self, iterable):
+        """
+        Add each item in iterable not already in self with one sort, then
+        drop the duplicates, which the sort has made neighbors.
+        Raises: TypeError if the items cannot be compared.
+        Postcondition: self is sorted.
+        """
+        ArraySortedBag.add_all(self, iterable)
+        items = self.items
+        kept = 0
+        for i in range(len(self)):
+            if kept == 0 or items[i] != items[kept - 1]:
+                items[kept] = items[i]
+                kept += 1
+        items.truncate(kept)
+        self.length = kept
+
+class HashSet(AbstractSet, HashBag):
+    """
+    Implement set ADT using a hash table, inheriting from HashBag, in which
+    every item has a count of 1. Membership, add and remove are O(1) on
+    average, so the AbstractSet operations run in O(n + m).
+    """
+
+    # Mutators
+    def add(self, item):
+        """If item not in self, add item to self and increment length."""
+        if item not in self.counts:
+            self.counts[item] = 1
+            self.length += 1
+
+    def add_all(self, iterable):
+        """
+        Add each item in iterable not already in self, after sizing the table
+        once for all of them.
+        """
+        items = list(iterable)
+        self.counts.reserve(len(self.counts) + len(items))
+        AbstractSet.add_all(self, items)
+
+    def set_count(self, item, count):
+        """Make self hold item if count is positive, else not at all."""
+        HashBag.set_count(self, item, min(count, 1))
+
+class IntBitSet(AbstractSet, AbstractBag):
+    """
+    Implement set ADT for non-negative integers using an array of 64-bit
+    words, where bit i % 64 of word i // 64 is set if i is in self.
+
+    add, remove and membership are O(1), and union, intersection,
+    difference and subset tests combine whole words at a time. Items are
+    iterated in increasing order. Memory is one bit per integer up to the
+    largest item, so the set suits dense, small universes such as vertex
+    ids. The word array never ends in a zero word, so equal sets have equal
+    arrays.
+    """
+    word_bits = 64
+    default_capacity = 1
+
+    def __init__(self, source_collection = None):
+        """Initialize self, optionally including items in source_collection."""
+        self.words = Array(IntBitSet.default_capacity, typecode = 'Q')
+        AbstractBag.__init__(self, source_collection)
+
+    # Accessors
+    def __and__(self, other):
+        """
+        Return the intersection of self and other, one word at a time.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take intersection of objects with different types."
+            raise TypeError(msg)
+        out = type(self)()
+        out.load_words([x & y for x, y in zip(self.words, other.words)])
+        return out
+
+    def check_item(self, item):
+        """
+        Raise TypeError unless item is an integer and ValueError if it is
+        negative.
+        """
+        if not isinstance(item, int):
+            msg = f"{type(self).__name__} must only contain integers."
+            raise TypeError(msg)
+        elif item < 0:
+            msg = f"{type(self).__name__} cannot contain negative integers."
+            raise ValueError(msg)
+
+    def __contains__(self, item):
+        """
+        Return True if item in self, else return False. An integral number
+        of another type, such as 3.0, is looked up as the integer it equals.
+        """
+        item = self.integral_value(item)
+        if item is None or item < 0:
+            return False
+        index = item // IntBitSet.word_bits
+        return (index < self.words.size() and
+                (self.words[index] >> (item % IntBitSet.word_bits)) & 1 == 1)
+
+    def copy(self):
+        """Return a copy of self, made from its words."""
+        out = type(self)()
+        out.load_words(self.words)
+        return out
+
+    def count(self, item):
+        """Return 1 if item in self, else return 0."""
+        return 1 if item in self else 0
+
+    def __eq__(self, other):
+        """Return True if self is equal to other, else return False."""
+        if self is other:
+            return True
+        elif type(self) != type(other):
+            return False
+        elif len(self) != len(other):
+            return False
+        else:
+            return list(self.words) == list(other.words)
+
+    def integral_value(self, item):
+        """
+        Return the integer equal to item, or None if no integer equals it.
+        """
+        try:
+            return as_index(item)
+        except TypeError:
+            pass
+        try:
+            value = int(item)
+        except (TypeError, ValueError, OverflowError):
+            return None
+        return value if value == item else None
+
+    def is_subset(self, other):
+        """
+        Return True if self is a subset of other, else return False.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot check if self is subset of object with different type."
+            raise TypeError(msg)
+        elif len(self) > len(other):
+            return False
+        for x, y in zip(self.words, chain(other.words, repeat(0))):
+            if x & ~y:
+                return False
+        return True
+
+    def __iter__(self):
+        """Support iteration over the items of self in increasing order."""
+        for index, word in enumerate(self.words):
+            base = index * IntBitSet.word_bits
+            while word:
+                # word & -word isolates the lowest set bit
+                low = word & -word
+                yield base + low.bit_length() - 1
+                word ^= low
+
+    def __or__(self, other):
+        """
+        Return the union of self and other, one word at a time.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take union of objects with different types."
+            raise TypeError(msg)
+        out = type(self)()
+        out.load_words([x | y for x, y in zip_longest(self.words, other.words,
+                                                      fillvalue = 0)])
+        return out
+
+    def __sub__(self, other):
+        """
+        Return set difference self - other, one word at a time.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take difference of objects with different types."
+            raise TypeError(msg)
+        out = type(self)()
+        out.load_words([x & ~y for x, y in zip(self.words,
+                                               chain(other.words, repeat(0)))])
+        return out
+
+    def __xor__(self, other):
+        """
+        Return the symmetric difference of self and other, one word at a time.
+        Precondition: other must be of same type as self.
+        Raises: TypeError
+        """
+        if type(self) != type(other):
+            msg = "Cannot take symmetric difference of objects with different types."
+            raise TypeError(msg)
+        out = type(self)()
+        out.load_words([x ^ y for x, y in zip_longest(self.words, other.words,
+                                                      fillvalue = 0)])
+        return out
+
+    # Mutators
+    def add(self, item):
+        """
+        If item not in self, add item to self and increment length, growing
+        the word array as needed.
+        Raises: TypeError if item is not an integer, ValueError if negative.
+        """
+        self.check_item(item)
+        self.set_bit(item)
+
+    def add_all(self, iterable):
+        """
+        Add each item in iterable to self. Another IntBitSet is merged a word
+        at a time; other items are all checked before self changes, and the
+        word array grows at most once.
+        Raises: TypeError if an item is not an integer, ValueError if one is
+                negative.
+        """
+        if type(iterable) == type(self):
+            self.load_words([x | y for x, y in
+                             zip_longest(self.words, iterable.words,
+                                         fillvalue = 0)])
+            return
+        items = list(iterable)
+        for item in items:
+            self.check_item(item)
+        if items:
+            self.words.reserve(max(items) // IntBitSet.word_bits + 1)
+        for item in items:
+            self.set_bit(item)
+
+    def clear(self):
+        """Remove all items from self, set length to 0."""
+        self.words.clear()
+        self.length = 0
+
+    def load_words(self, words):
+        """
+        Replace the contents of self with the bits of words, dropping any
+        zero words at the end, and count the items with one popcount per
+        word.
+        """
+        words = list(words)
+        while words and words[-1] == 0:
+            words.pop()
+        self.words.clear()
+        self.words.extend(words)
+        self.length = sum(word.bit_count() for word in words)
+
+    def remove(self, item):
+        """
+        Remove item from self, decrement length.
+        Precondition: Item is in self.
+        Raises: ValueError if item is not in self.
+        Postcondition: Item is not in self.
+        """
+        if item not in self:
+            raise ValueError("IntBitSet.remove(x): x not in IntBitSet")
+        item = self.integral_value(item)
+        index = item // IntBitSet.word_bits
+        self.words[index] &= ~(1 << (item % IntBitSet.word_bits))
+        self.length -= 1
+
+        # Keep the last word nonzero so that equal sets have equal arrays
+        size = self.words.size()
+        while size > 0 and self.words[size - 1] == 0:
+            size -= 1
+        if size < self.words.size():
+            self.words.truncate(size)
+
+    def set_bit(self, item):
+        """
+        Set the bit of item, growing the word array by the policy's factor if
+        it is too short, and increment length if the bit was clear.
+        Precondition: item is a non-negative integer.
+        """
+        index = item // IntBitSet.word_bits
+        if index >= len(self.words):
+            self.words.reserve(
+                self.words.policy.grown_capacity(len(self.words), index + 1))
+        mask = 1 << (item % IntBitSet.word_bits)
+        word = self.words[index]
+        if not word & mask:
+            self.words[index] = word | mask
+            self.length += 1
+
 class LinkedSet(AbstractSet, LinkedBag):
     """Implement set ADT using a linked list, inheriting from LinkedBag."""
 
@@ -0,0 +1,351 @@
+"""
+Author:  Russell Gerhard
+Purpose: Provide a list implementation based on an indexable skip list, which
+         gives O(log n) expected positional access, inserts and pops, and can
+         also keep its items sorted.
+
+Exports:
+    SkipList: List implementation based on a width-augmented skip list.
+"""
+
+from random import Random
+from nodes import SkipNode
+from abstractclasses.abstractlist import AbstractList
+from sorting import sort_sequence
+
+class SkipList(AbstractList):
+    """
+    Represent a list as a skip list whose links record how many positions
+    they skip.
+
+    Each node has a tower of links; a node reaches level i + 1 with
+    probability 1/2 once it reaches level i, so searches from the top level
+    down skip about half of the remaining nodes per level. Summing the widths
+    of the links taken gives a node's position, which makes indexing, insert
+    and pop O(log n) expected.
+
+    With keep_sorted True, self is a sorted list. add, __contains__, index
+    and remove then search by value in O(log n) and irange iterates over a
+    range of values, while mutators that would break the order raise
+    TypeError.
+
+    The head is a sentinel at position 0, so the item at index i is at
+    position i + 1 and a link to None ends at position len(self) + 1.
+    """
+    max_level = 32
+
+    def __init__(self, source_collection = None, keep_sorted = False,
+                 seed = None):
+        """
+        Instantiate and initialize self, optionally including each item in
+        source_collection, which is loaded in O(n) (O(n log n) if sorted).
+        Pass seed to make node heights reproducible.
+        """
+        self.keep_sorted = keep_sorted
+        self.random = Random(seed)
+        self.head = SkipNode(None, SkipList.max_level)
+        self.level = 1
+        self.head.width[0] = 1
+        AbstractList.__init__(self, source_collection)
+
+    # Accessors
+    def __add__(self, other):
+        """
+        Return a copy of self with each item in other added to it.
+        Precondition: other must be same type as self
+        Raises: TypeError
+        """
+        if type(other) != type(self):
+            msg = f"cannot concatenate {type(self).__name__} with different type"
+            raise TypeError(msg)
+        out = self.copy()
+        out.extend(other)
+        return out
+
+    def check_unsorted(self, operation):
+        """
+        Raise TypeError if self is sorted, naming the operation that would
+        break its order.
+        """
+        if self.keep_sorted:
+            msg = f"cannot {operation} a sorted {type(self).__name__}"
+            raise TypeError(msg)
+
+    def __contains__(self, item):
+        """Return True if item in self, else return False."""
+        return self.index(item) != -1
+
+    def copy(self):
+        """Return a copy of self, sorted if self is."""
+        return type(self)(self, self.keep_sorted)
+
+    def __getitem__(self, index):
+        """
+        Return item at index in self.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        return self.node_at(index).data
+
+    def index(self, item):
+        """Return first index of value in self, else return -1."""
+        if not self.keep_sorted:
+            return AbstractList.index(self, item)
+        update, positions = self.path_to_item(item)
+        node = update[0].next[0]
+        if node is not None and node.data == item:
+            return positions[0]
+        return -1
+
+    def irange(self, low = None, high = None):
+        """
+        Iterate in order over the items of sorted self that are at least low
+        and less than high. A bound of None leaves that end open. Finding the
+        first item takes O(log n).
+        Precondition: self is sorted.
+        Raises: TypeError
+        """
+        if not self.keep_sorted:
+            raise TypeError(f"cannot irange an unsorted {type(self).__name__}")
+        if low is None:
+            node = self.head.next[0]
+        else:
+            node = self.path_to_item(low)[0][0].next[0]
+        while node is not None and (high is None or node.data < high):
+            yield node.data
+            node = node.next[0]
+
+    def __iter__(self):
+        """Support iteration over all items in self."""
+        probe = self.head.next[0]
+        while probe is not None:
+            yield probe.data
+            probe = probe.next[0]
+
+    def node_at(self, index):
+        """
+        Return the node at index, descending from the top level.
+        Precondition: index in range(0, len(self)).
+        Raises: IndexError
+        """
+        if index < 0:
+            raise IndexError("SkipList index cannot be negative.")
+        elif index >= len(self):
+            raise IndexError("SkipList index out of range.")
+        target = index + 1
+        node = self.head
+        position = 0
+        for level in range(self.level - 1, -1, -1):
+            while (node.next[level] is not None and
+                   position + node.width[level] <= target):
+                position += node.width[level]
+                node = node.next[level]
+        return node
+
+    def path_to_index(self, index):
+        """
+        Return lists update and positions, where update[i] is the last node on
+        level i before the item at index and positions[i] its position.
+        """
+        update = [self.head] * self.level
+        positions = [0] * self.level
+        node = self.head
+        position = 0
+        for level in range(self.level - 1, -1, -1):
+            while (node.next[level] is not None and
+                   position + node.width[level] <= index):
+                position += node.width[level]
+                node = node.next[level]
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    def path_to_item(self, item, after_equal = False):
+        """
+        Return lists update and positions, where update[i] is the last node on
+        level i whose item is less than item, or not greater than item if
+        after_equal is True, and positions[i] its position.
+        """
+        update = [self.head] * self.level
+        positions = [0] * self.level
+        node = self.head
+        position = 0
+        for level in range(self.level - 1, -1, -1):
+            probe = node.next[level]
+            while probe is not None and (probe.data < item or
+                                         after_equal and not item < probe.data):
+                position += node.width[level]
+                node = probe
+                probe = node.next[level]
+            update[level] = node
+            positions[level] = position
+        return update, positions
+
+    # Mutators
+    def add(self, item):
+        """
+        Add item to self, after any equal items if self is sorted and at the
+        end otherwise. Increment length.
+        """
+        if self.keep_sorted:
+            level = self.random_level()
+            self.raise_level(level)
+            update, positions = self.path_to_item(item, after_equal = True)
+            self.link(update, positions, item, level)
+        else:
+            self.append(item)
+
+    def clear(self):
+        """Remove all items from self, set length to 0."""
+        self.head = SkipNode(None, SkipList.max_level)
+        self.level = 1
+        self.head.width[0] = 1
+        self.length = 0
+
+    def extend(self, iterable):
+        """
+        Add each item in iterable to self. A batch at least as large as self
+        is merged with the items of self and relinked in one O(n) pass (plus
+        a sort of the batch if self is sorted); a smaller one is added an item
+        at a time in O(k log n).
+        """
+        new_items = list(iterable)
+        if len(new_items) < len(self):
+            for item in new_items:
+                self.add(item)
+            return
+        if self.keep_sorted:
+            sort_sequence(new_items, len(new_items))
+            # The stable merge keeps each new item after equal old ones
+            items = list(self) + new_items
+            sort_sequence(items, len(items))
+        else:
+            items = list(self) + new_items
+        self.rebuild(items)
+
+    def insert(self, index, item):
+        """
+        Insert item in self before index, increment length.
+        Precondition: self is not sorted.
+        Raises: TypeError
+        """
+        self.check_unsorted("insert by index into")
+        index = max(0, min(index, len(self)))
+        level = self.random_level()
+        self.raise_level(level)
+        update, positions = self.path_to_index(index)
+        self.link(update, positions, item, level)
+
+    def link(self, update, positions, item, level):
+        """
+        Link a new node holding item with a tower level links high in just
+        after update[0], and fix the widths of the links it passes under.
+        Precondition: update and positions come from a path taken after
+        raising self to level.
+        """
+        target = positions[0] + 1
+        node = SkipNode(item, level)
+        for i in range(level):
+            before = update[i]
+            node.next[i] = before.next[i]
+            node.width[i] = positions[i] + before.width[i] + 1 - target
+            before.next[i] = node
+            before.width[i] = target - positions[i]
+        for i in range(level, self.level):
+            update[i].width[i] += 1
+        self.length += 1
+
+    def pop(self, index = 0):
+        """
+        Remove and return item at index, decrement length.
+        Precondition: self is not empty, index in range(0, len(self)).
+        Raises: IndexError
+        """
+        if self.is_empty():
+            raise IndexError("cannot pop from an empty list")
+        elif index < 0 or index >= len(self):
+            raise IndexError("pop index out of range")
+        update, positions = self.path_to_index(index)
+        node = update[0].next[0]
+        for i in range(self.level):
+            before = update[i]
+            if before.next[i] is node:
+                before.width[i] += node.width[i] - 1
+                before.next[i] = node.next[i]
+            else:
+                before.width[i] -= 1
+        # Drop levels that no longer hold any node
+        while self.level > 1 and self.head.next[self.level - 1] is None:
+            self.level -= 1
+        self.length -= 1
+        return node.data
+
+    def raise_level(self, level):
+        """Start using any levels of the head up to level not in use yet."""
+        for i in range(self.level, level):
+            self.head.next[i] = None
+            self.head.width[i] = len(self) + 1
+        self.level = max(self.level, level)
+
+    def random_level(self):
+        """Return a random node height, where P(height > h) is 1 / 2 ** h."""
+        bits = self.random.getrandbits(SkipList.max_level - 1)
+        level = 1
+        while bits & 1:
+            level += 1
+            bits >>= 1
+        return level
+
+    def rebuild(self, items):
+        """
+        Replace the contents of self with items in order, linking each level
+        left to right in a single O(n) pass.
+        """
+        self.clear()
+        last = [self.head] * SkipList.max_level
+        last_positions = [0] * SkipList.max_level
+        for position, item in enumerate(items, 1):
+            level = self.random_level()
+            self.level = max(self.level, level)
+            node = SkipNode(item, level)
+            for i in range(level):
+                last[i].next[i] = node
+                last[i].width[i] = position - last_positions[i]
+                last[i] = node
+                last_positions[i] = position
+        self.length = len(items)
+        for i in range(self.level):
+            last[i].next[i] = None
+            last[i].width[i] = self.length + 1 - last_positions[i]
+
+    def reverse(self):
+        """
+        Reverse contents of self in place.
+        Precondition: self is not sorted.
+        Raises: TypeError
+        """
+        self.check_unsorted("reverse")
+        self.rebuild(list(self)[::-1])
+
+    def __setitem__(self, index, value):
+        """
+        Set item at index to value.
+        Precondition: index in range(0, len(self)), self is not sorted.
+        Raises: IndexError, TypeError
+        """
+        self.check_unsorted("set an item of")
+        self.node_at(index).data = value
+
+    def sort(self, key = None, reverse = False):
+        """
+        Stably sort contents of self with the sort engine and relink it in
+        O(n). A sorted self is left as it is when called without arguments.
+        Precondition: self is not sorted, or key is None and reverse False.
+        Raises: TypeError
+        """
+        if key is None and not reverse and self.keep_sorted:
+            return
+        self.check_unsorted("reorder")
+        items = list(self)
+        sort_sequence(items, len(items), key, reverse)
+        self.rebuild(items)
@@ -0,0 +1,498 @@
+"""
+Author:  Russell Gerhard
+Purpose: Provide the sort engine shared by the list and sorted bag classes.
+         Array-based collections sort with an adaptive merge sort that finds
+         and merges natural runs, or with introsort when stability is not
+         needed. Node-based collections sort by relinking their nodes.
+
+Exports:
+    sort_sequence: Sort the first count items of an indexable sequence, such
+                   as an Array, in place.
+
+    merge_sort_nodes: Stably sort a chain of linked nodes by relinking them.
+
+    MergeState: Adaptive, stable merge sort over a Python list of records.
+
+    introsort: Unstable quicksort over a Python list of records that falls
+               back to heapsort when partitioning goes badly.
+
+    gallop_left, gallop_right: Exponential searches used when merging runs.
+"""
+
+from operator import lt as less_than
+from nodes import Node
+
+# Ranges shorter than this are sorted by insertion rather than split further
+insertion_cutoff = 16
+
+def sort_sequence(items, count, key = None, reverse = False, stable = True):
+    """
+    Sort items[0] through items[count - 1] in place and return None.
+
+    The items are copied out to a Python list, sorted there and written back,
+    so items only needs integer __getitem__ and __setitem__. When key is given
+    it is called once per item. reverse sorts in descending order without a
+    reversing pass, and equal items keep their order when stable is True.
+    Pass stable = False for introsort, which needs no merge buffer.
+    """
+    if key is None:
+        records = [items[i] for i in range(count)]
+        if reverse:
+            before = lambda a, b: b < a
+        else:
+            before = less_than
+    else:
+        records = [(key(items[i]), items[i]) for i in range(count)]
+        if reverse:
+            before = lambda a, b: b[0] < a[0]
+        else:
+            before = lambda a, b: a[0] < b[0]
+
+    if stable:
+        MergeState(records, before).sort()
+    else:
+        introsort(records, before)
+
+    if key is None:
+        for i, record in enumerate(records):
+            items[i] = record
+    else:
+        for i, record in enumerate(records):
+            items[i] = record[1]
+
+def gallop_left(key, records, lo, hi, before):
+    """
+    Return the first index in range(lo, hi) whose record does not come before
+    key, checking lo, lo + 1, lo + 3, lo + 7... and then bisecting. This
+    takes O(log d) comparisons for an answer d places past lo.
+    Precondition: records[lo:hi] is sorted.
+    """
+    left = lo
+    offset = 0
+    step = 1
+    while lo + offset < hi and before(records[lo + offset], key):
+        left = lo + offset + 1
+        offset += step
+        step *= 2
+    right = min(lo + offset, hi)
+    while left < right:
+        mid = (left + right) // 2
+        if before(records[mid], key):
+            left = mid + 1
+        else:
+            right = mid
+    return left
+
+def gallop_right(key, records, lo, hi, before):
+    """
+    Return the first index in range(lo, hi) whose record key comes before,
+    so that any records equal to key stay ahead of it. Searches the same
+    way as gallop_left.
+    Precondition: records[lo:hi] is sorted.
+    """
+    left = lo
+    offset = 0
+    step = 1
+    while lo + offset < hi and not before(key, records[lo + offset]):
+        left = lo + offset + 1
+        offset += step
+        step *= 2
+    right = min(lo + offset, hi)
+    while left < right:
+        mid = (left + right) // 2
+        if before(key, records[mid]):
+            right = mid
+        else:
+            left = mid + 1
+    return left
+
+def heapsort(records, left, right, before):
+    """Sort records[left] through records[right] in place with heapsort."""
+    count = right - left + 1
+    for start in range(count // 2 - 1, -1, -1):
+        sift_down(records, left, start, count, before)
+    for end in range(count - 1, 0, -1):
+        records[left], records[left + end] = records[left + end], records[left]
+        sift_down(records, left, 0, end, before)
+
+def insertion_sort(records, left, right, start, before):
+    """
+    Sort records[left] through records[right] in place, given that the
+    records before start are already sorted. Each record is placed by binary
+    search after any records equal to it, so the sort is stable.
+    """
+    for i in range(start, right + 1):
+        record = records[i]
+        position = gallop_right(record, records, left, i, before)
+        if position < i:
+            records[position + 1:i + 1] = records[position:i]
+            records[position] = record
+
+def introsort(records, before):
+    """
+    Sort records in place with quicksort, keeping pending ranges on an
+    explicit stack with the smaller range on top. A range that is still
+    being split after 2 log n levels is handed to heapsort, so the sort
+    takes O(n log n) time on every input. Not stable.
+    """
+    pending = [(0, len(records) - 1, 2 * max(len(records), 1).bit_length())]
+    while pending:
+        left, right, depth = pending.pop()
+        if right - left < insertion_cutoff:
+            insertion_sort(records, left, right, left + 1, before)
+            continue
+        elif depth == 0:
+            heapsort(records, left, right, before)
+            continue
+        border = partition(records, left, right, before)
+        if border - left < right - border:
+            pending.append((border + 1, right, depth - 1))
+            pending.append((left, border, depth - 1))
+        else:
+            pending.append((left, border, depth - 1))
+            pending.append((border + 1, right, depth - 1))
+
+def partition(records, left, right, before):
+    """
+    Partition records[left] through records[right] around the median of its
+    first, middle and last records, aka the pivot. Return a border such that
+    no record through the border comes after the pivot and no record after
+    it comes before. Records equal to the pivot may land on either side, so
+    runs of duplicates still split evenly.
+    """
+    # Order the first, middle and last records, leaving the median in middle
+    mid = (left + right) // 2
+    if before(records[mid], records[left]):
+        records[mid], records[left] = records[left], records[mid]
+    if before(records[right], records[mid]):
+        records[right], records[mid] = records[mid], records[right]
+        if before(records[mid], records[left]):
+            records[mid], records[left] = records[left], records[mid]
+    pivot = records[mid]
+
+    # Close in from both ends, swapping pairs on the wrong sides
+    i = left - 1
+    j = right + 1
+    while True:
+        i += 1
+        while before(records[i], pivot):
+            i += 1
+        j -= 1
+        while before(pivot, records[j]):
+            j -= 1
+        if i >= j:
+            return j
+        records[i], records[j] = records[j], records[i]
+
+def sift_down(records, base, root, count, before):
+    """Restore the max-heap of count records at base below root."""
+    while True:
+        child = 2 * root + 1
+        if child >= count:
+            return
+        if (child + 1 < count and
+                before(records[base + child], records[base + child + 1])):
+            child += 1
+        if not before(records[base + root], records[base + child]):
+            return
+        records[base + root], records[base + child] = (records[base + child],
+                                                       records[base + root])
+        root = child
+
+
+class MergeState:
+    """
+    Sort a Python list of records stably with an adaptive merge sort.
+
+    The list is scanned once for natural runs; strictly descending runs are
+    reversed and runs shorter than min_run are extended by binary insertion.
+    Runs are pushed on a stack and merged while their lengths break the
+    invariants that keep the stack O(log n) deep and the merges balanced.
+    Merging first gallops to skip the parts of each run already in place and
+    switches to galloping whenever one run keeps winning, so presorted and
+    partly sorted input sorts in close to linear time.
+    """
+    # Consecutive wins by one run before a merge starts galloping
+    min_gallop = 7
+
+    def __init__(self, records, before):
+        """
+        Prepare to sort records, where before(a, b) is True if a must be
+        placed ahead of b.
+        """
+        self.records = records
+        self.before = before
+        self.runs = []
+        self.min_gallop = MergeState.min_gallop
+
+    # Accessors
+    @staticmethod
+    def min_run(count):
+        """
+        Return the minimum run length for count records, chosen between 32
+        and 64 so that count / min_run is a power of two or just below one.
+        """
+        low_bits = 0
+        while count >= 64:
+            low_bits |= count & 1
+            count >>= 1
+        return count + low_bits
+
+    # Mutators
+    def count_run(self, lo, hi):
+        """
+        Return the length of the run starting at lo and ending before hi,
+        reversing it in place first if it is strictly descending.
+        """
+        records = self.records
+        before = self.before
+        end = lo + 1
+        if end == hi:
+            return 1
+        if before(records[end], records[lo]):
+            while end < hi and before(records[end], records[end - 1]):
+                end += 1
+            records[lo:end] = records[lo:end][::-1]
+        else:
+            while end < hi and not before(records[end], records[end - 1]):
+                end += 1
+        return end - lo
+
+    def merge_at(self, i):
+        """Merge the runs at i and i + 1 of the run stack into one run."""
+        records = self.records
+        before = self.before
+        base1, length1 = self.runs[i]
+        base2, length2 = self.runs[i + 1]
+        self.runs[i] = (base1, length1 + length2)
+        del self.runs[i + 1]
+
+        # Records of the first run before the second's head are in place
+        start = gallop_right(records[base2], records, base1, base1 + length1,
+                             before)
+        length1 -= start - base1
+        base1 = start
+        if length1 == 0:
+            return
+
+        # Records of the second run after the first's tail are in place
+        length2 = gallop_left(records[base1 + length1 - 1], records, base2,
+                              base2 + length2, before) - base2
+        if length2 == 0:
+            return
+        self.merge_low(base1, length1, base2, length2)
+
+    def merge_collapse(self):
+        """
+        Merge runs at the top of the stack until, for its top three runs
+        A, B and C, A is longer than B + C and B is longer than C.
+        """
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if ((n > 0 and runs[n - 1][1] <= runs[n][1] + runs[n + 1][1]) or
+                    (n > 1 and runs[n - 2][1] <= runs[n - 1][1] + runs[n][1])):
+                if runs[n - 1][1] < runs[n + 1][1]:
+                    n -= 1
+            elif runs[n][1] > runs[n + 1][1]:
+                break
+            self.merge_at(n)
+
+    def merge_force_collapse(self):
+        """Merge every run left on the stack into one."""
+        runs = self.runs
+        while len(runs) > 1:
+            n = len(runs) - 2
+            if n > 0 and runs[n - 1][1] < runs[n + 1][1]:
+                n -= 1
+            self.merge_at(n)
+
+    def merge_low(self, base1, length1, base2, length2):
+        """
+        Merge the adjacent sorted runs at base1 and base2 by copying the
+        first into a buffer and filling the space from the front. Ties go to
+        the first run, which keeps the merge stable.
+        Precondition: the first record of the second run comes before the
+        first run's head and its last record after the first run's tail.
+        """
+        records = self.records
+        before = self.before
+        buffer = records[base1:base1 + length1]
+        i = 0
+        j = base2
+        end2 = base2 + length2
+        dest = base1
+        min_gallop = self.min_gallop
+        while i < length1 and j < end2:
+            # Take one record at a time until one run wins min_gallop times
+            wins1 = wins2 = 0
+            while i < length1 and j < end2:
+                if before(records[j], buffer[i]):
+                    records[dest] = records[j]
+                    j += 1
+                    wins2 += 1
+                    wins1 = 0
+                else:
+                    records[dest] = buffer[i]
+                    i += 1
+                    wins1 += 1
+                    wins2 = 0
+                dest += 1
+                if wins1 >= min_gallop or wins2 >= min_gallop:
+                    break
+
+            # Gallop, copying whole stretches of a run, while that pays off
+            while i < length1 and j < end2:
+                min_gallop = max(min_gallop - 1, 1)
+                count1 = gallop_right(records[j], buffer, i, length1,
+                                      before) - i
+                records[dest:dest + count1] = buffer[i:i + count1]
+                dest += count1
+                i += count1
+                if i == length1:
+                    break
+                count2 = gallop_left(buffer[i], records, j, end2, before) - j
+                records[dest:dest + count2] = records[j:j + count2]
+                dest += count2
+                j += count2
+                if count1 < MergeState.min_gallop and count2 < MergeState.min_gallop:
+                    min_gallop += 2
+                    break
+
+        # Whatever remains of the second run is already in place
+        records[dest:dest + length1 - i] = buffer[i:]
+        self.min_gallop = min_gallop
+
+    def sort(self):
+        """Sort self.records in place."""
+        records = self.records
+        count = len(records)
+        if count < 2:
+            return
+        min_run = MergeState.min_run(count)
+        lo = 0
+        while lo < count:
+            length = self.count_run(lo, count)
+            # Extend short runs to min_run records
+            if length < min_run:
+                forced = min(min_run, count - lo)
+                insertion_sort(records, lo, lo + forced - 1, lo + length,
+                               self.before)
+                length = forced
+            self.runs.append((lo, length))
+            self.merge_collapse()
+            lo += length
+        self.merge_force_collapse()
+
+
+def merge_sort_nodes(head, key = None, reverse = False):
+    """
+    Sort the chain of nodes starting at head by relinking their next
+    pointers, and return the new (head, tail). Only next pointers are
+    rewritten; callers with prev pointers must repair them.
+
+    This is a natural, bottom-up merge sort. Each pass finds the chain's
+    maximal ordered runs, reversing strictly descending ones, and merges
+    them pairwise, so it takes O(n log r) time for a chain of r runs. Runs
+    are reversed and merged by splicing nodes one at a time, each splice
+    made only after the comparison that decides it, so the nodes always
+    form one chain. Equal items keep their order, also when reverse is True.
+
+    Without a key the sort takes O(1) extra memory. With one, key is called
+    once per item before any node changes, and each node holds a (key,
+    item) pair while the runs are merged, which takes O(n) extra memory.
+
+    If key or a comparison raises, every node is still linked into one
+    chain starting at head, in no particular order, holding its own item.
+    """
+    if head is None:
+        return None, None
+    if key is None:
+        before = (lambda a, b: b < a) if reverse else less_than
+    else:
+        keys = []
+        node = head
+        while node is not None:
+            keys.append(key(node.data))
+            node = node.next
+        node = head
+        for item_key in keys:
+            node.data = (item_key, node.data)
+            node = node.next
+        if reverse:
+            before = lambda a, b: b[0] < a[0]
+        else:
+            before = lambda a, b: a[0] < b[0]
+
+    # The sentinel links to the first node, whichever node that becomes
+    sentinel = Node(None, head)
+    try:
+        first_end = take_run(sentinel, before)
+        while first_end.next is not None:
+            # Merge runs pairwise, one pass over the chain at a time
+            prev = sentinel
+            while first_end.next is not None:
+                second_end = take_run(first_end, before)
+                prev = merge_runs(prev, first_end, second_end, before)
+                if prev.next is None:
+                    break
+                first_end = take_run(prev, before)
+            first_end = take_run(sentinel, before)
+        tail = first_end
+    except BaseException:
+        # Move the old head back to the front, where the caller expects it
+        if sentinel.next is not head:
+            probe = sentinel
+            while probe.next is not head:
+                probe = probe.next
+            probe.next = head.next
+            head.next = sentinel.next
+            sentinel.next = head
+        raise
+    finally:
+        if key is not None:
+            node = sentinel.next
+            while node is not None:
+                node.data = node.data[1]
+                node = node.next
+    return sentinel.next, tail
+
+def merge_runs(prev, first_end, second_end, before):
+    """
+    Merge the sorted run from prev.next to first_end with the sorted run
+    that follows it up to second_end, splicing each node of the second run
+    in front of the first node of the first run that it strictly comes
+    before. Return the last node of the merged run.
+    """
+    stop = second_end.next
+    while True:
+        first = prev.next
+        second = first_end.next
+        if first is second:
+            return second_end
+        elif second is stop:
+            return first_end
+        elif before(second.data, first.data):
+            first_end.next = second.next
+            second.next = first
+            prev.next = second
+        prev = prev.next
+
+def take_run(prev, before):
+    """
+    Make the longest ordered run of nodes starting at prev.next ascending
+    and return its last node. A strictly descending run is reversed by
+    moving each of its nodes to the front, which keeps equal items in order.
+    """
+    start = prev.next
+    last = start
+    if last.next is not None and before(last.next.data, start.data):
+        while last.next is not None and before(last.next.data, prev.next.data):
+            node = last.next
+            last.next = node.next
+            node.next = prev.next
+            prev.next = node
+        return last
+    while last.next is not None and not before(last.next.data, last.data):
+        last = last.next
+    return last
@@ -24,9 +24,15 @@ class ArrayStack(AbstractStack):
     default_capacity = 10
 
     # Constructor
-    def __init__(self, source_collection = None):
-        """Initialize self, optionally pushing items from source_collection."""
-        self.items = Array(ArrayStack.default_capacity)
+    def __init__(self, source_collection = None, typecode = None,
+                 policy = None):
+        """
+        Initialize self, optionally pushing items from source_collection.
+        Pass typecode to store items in a typed, compact array and policy to
+        control how it resizes.
+        """
+        self.items = Array(ArrayStack.default_capacity, typecode = typecode,
+                           policy = policy)
         AbstractStack.__init__(self, source_collection)
 
     # Accessors
@@ -47,7 +53,7 @@ class ArrayStack(AbstractStack):
     # Mutators
     def clear(self):
         """Remove all items from self, set length to 0."""
-        self.items = Array(ArrayStack.default_capacity)
+        self.items.clear()
         self.length = 0
 
     def pop(self):
@@ -68,6 +74,14 @@ class ArrayStack(AbstractStack):
         return out
         
 
+    def add_all(self, iterable):
+        """
+        Push each item in iterable onto self with one bulk fill of the
+        underlying array, which grows at most once.
+        """
+        self.items.extend(iterable)
+        self.length = self.items.size()
+
     def push(self, item):
         """Put item on top of stack."""
         # Grow underlying array if necessary
@@ -75,14 +89,25 @@ class ArrayStack(AbstractStack):
         self.items[self.items.size()] = item
         self.length += 1
 
+    def reserve(self, capacity):
+        """Reserve room for capacity items, as in Array.reserve."""
+        self.items.reserve(capacity)
+
+    def shrink_to_fit(self):
+        """Release unused capacity, as in Array.shrink_to_fit."""
+        self.items.shrink_to_fit()
+
         
 class DoublyLinkedStack(AbstractStack):
     """Implement stack ADT using a doubly linked list."""
 
     # Constructor
-    def __init__(self, source_collection = None):
-        """Initialize self, optionally pushing items from source_collection."""
-        self.items = DoublyLinkedList()
+    def __init__(self, source_collection = None, pool = None):
+        """
+        Initialize self, optionally pushing items from source_collection.
+        Pass a NodePool of TwoWayNodes to recycle nodes between pushes and pops.
+        """
+        self.items = DoublyLinkedList(pool = pool)
         AbstractStack.__init__(self, source_collection)
 
     # Accessors
@@ -102,7 +127,7 @@ class DoublyLinkedStack(AbstractStack):
     # Mutators
     def clear(self):
         """Remove all items from self, set length to 0."""
-        self.items = DoublyLinkedList()
+        self.items.clear()
         self.length = 0
 
     def pop(self):
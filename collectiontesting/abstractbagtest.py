@@ -21,6 +21,37 @@ class TestAbstractBag(TestAbstractCollection):
         b = self.class_type([5,4,3,2,1])
         self.assertTrue(a == b)
 
+    # Mutator tests
+    def test_discard_many(self):
+        a = self.class_type([4,1,3,6,2])
+        self.assertTrue(a.discard_many([3,3,5,4]) == 2)
+        self.assertTrue(a == self.class_type([1,6,2]))
+        self.assertTrue(a.discard_many([]) == 0)
+        self.assertTrue(a.discard_many(a.copy()) == 3)
+        self.assertTrue(a.is_empty())
+
+    def test_remove_if_raises(self):
+        # A failing pred leaves self as it was
+        def pred(item):
+            if item == 6:
+                raise ValueError("bad item")
+            return item % 2 == 0
+        a = self.class_type([4,1,3,6,2,8])
+        with self.assertRaises(ValueError):
+            a.remove_if(pred)
+        self.assertTrue(a == self.class_type([4,1,3,6,2,8]))
+        self.assertTrue(len(a) == 6)
+
+    def test_remove_if(self):
+        a = self.class_type([4,1,3,6,2])
+        self.assertTrue(a.remove_if(lambda item: item % 2 == 0) == 3)
+        self.assertTrue(a == self.class_type([1,3]))
+        self.assertTrue(a.retain_if(lambda item: item > 1) == 1)
+        self.assertTrue(a == self.class_type([3]))
+        a.add(5)
+        self.assertTrue(5 in a)
+        self.assertTrue(len(a) == 2)
+
     def test_str(self):
         # Empty
         a = self.class_type()
@@ -12,6 +12,12 @@ Exports:
 """
 
 class TestAbstractCollection():
+
+    # Constructor tests
+    def test_from_iterable(self):
+        a = self.class_type.from_iterable(iter([3,1,2]))
+        self.assertTrue(a == self.class_type([3,1,2]))
+        self.assertTrue(self.class_type.from_iterable([]).is_empty())
     
     # Accessor tests
     def test_concatentation(self):
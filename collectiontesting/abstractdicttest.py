@@ -11,6 +11,12 @@ from abstractcollectiontest import TestAbstractCollection
 
 class TestAbstractDict(TestAbstractCollection):
 
+    # Constructor tests
+    def test_from_iterable(self):
+        a = self.class_type.from_iterable(iter([('a', 1), ('b', 2)]))
+        self.assertTrue(a == self.class_type(['a', 'b'], [1, 2]))
+        self.assertTrue(self.class_type.from_iterable([]).is_empty())
+
     # Accessor tests
     def test_concatenation(self):
         a = self.class_type()
@@ -140,6 +146,34 @@ class TestAbstractDict(TestAbstractCollection):
         self.assertTrue("'c': 3" in str_str)
         self.assertTrue(str_str.endswith('}'))
 
+    # Mutator tests
+    def test_remove_if_raises(self):
+        # A failing pred leaves self as it was
+        def pred(key, value):
+            if key == 20:
+                raise ValueError("bad key")
+            return value == 0
+        a = self.class_type(list(range(30)), [i % 4 for i in range(30)])
+        with self.assertRaises(ValueError):
+            a.remove_if(pred)
+        self.assertTrue(len(a) == 30)
+        self.assertTrue(sorted(a) == list(range(30)))
+        self.assertTrue(all(a[key] == key % 4 for key in range(30)))
+        a[30] = 2
+        self.assertTrue(len(a) == 31 and a[30] == 2)
+
+    def test_remove_if(self):
+        a = self.class_type(list(range(30)), [i % 4 for i in range(30)])
+        self.assertTrue(a.remove_if(lambda key, value: value == 0) == 8)
+        self.assertTrue(len(a) == 22)
+        self.assertTrue(0 not in a and 28 not in a and 29 in a)
+        self.assertTrue(a.retain_if(lambda key, value: key < 10) == 15)
+        self.assertTrue(sorted(a) == [1, 2, 3, 5, 6, 7, 9])
+        self.assertTrue(a[9] == 1)
+        a[0] = 'x'
+        self.assertTrue(a[0] == 'x')
+        self.assertTrue(len(a) == 8)
+
     def test_values(self):
         a = self.class_type(['a', 'b', 1, 43], ['red', 'blue', 'green', 'pink'])
         value_list = ['red', 'blue', 'green', 'pink']
@@ -64,3 +64,35 @@ class TestAbstractList(TestAbstractCollection):
         a.remove(4)
         b = self.class_type([1,3])
         self.assertTrue(a == b)
+
+    def test_remove_if_raises(self):
+        # A failing pred leaves self as it was
+        def pred(item):
+            if item == 6:
+                raise ValueError("bad item")
+            return item % 2 == 0
+        a = self.class_type([4,1,3,6,2,8])
+        with self.assertRaises(ValueError):
+            a.remove_if(pred)
+        self.assertTrue(list(a) == [4,1,3,6,2,8])
+        self.assertTrue(len(a) == 6)
+        a.append(5)
+        self.assertTrue(a[6] == 5 and len(a) == 7)
+
+    def test_remove_if(self):
+        a = self.class_type(range(20))
+        self.assertTrue(a.remove_if(lambda item: item % 3 == 0) == 7)
+        self.assertTrue(list(a) == [i for i in range(20) if i % 3 != 0])
+        self.assertTrue(len(a) == 13)
+        self.assertTrue(a.retain_if(lambda item: item < 10) == 7)
+        self.assertTrue(list(a) == [1, 2, 4, 5, 7, 8])
+        self.assertTrue(a.remove_if(lambda item: False) == 0)
+        self.assertTrue(a.retain_if(lambda item: False) == 6)
+        self.assertTrue(a.is_empty())
+
+        # Self stays usable at both ends
+        a = self.class_type([1, 2, 3])
+        a.remove_if(lambda item: item != 2)
+        a.append(4)
+        a.prepend(0)
+        self.assertTrue(list(a) == [0, 2, 4])
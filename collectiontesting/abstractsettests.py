@@ -41,6 +41,18 @@ class TestAbstractSet:
         self.assertTrue(a.is_subset(b))
         self.assertFalse(b.is_subset(a))
 
+    def test_symmetric_difference(self):
+        a = self.class_type()
+        b = self.class_type()
+        self.assertTrue(a ^ b == a)
+        a = self.class_type([1,2,3,4])
+        b = self.class_type([3,4,5])
+        c = self.class_type([1,2,5])
+        self.assertTrue(a ^ b == c)
+        self.assertTrue(b ^ a == c)
+        with self.assertRaises(TypeError):
+            a ^ [1]
+
     def test_union(self):
         a = self.class_type()
         b = self.class_type()
@@ -0,0 +1,255 @@
+"""
+Author:  Russell Gerhard
+Purpose: This script measures the memory and time costs of the collections.
+         Run it from this directory the same way as test_all.py.
+
+Exports:
+    bytes_per_element: Measure the memory a collection spends per element.
+
+    memory_benchmark: Report bytes per element for the linked collections and
+                      the hash dictionary.
+
+    seconds: Time a single call of an operation on a freshly built collection.
+
+    array_list_benchmark: Report how ArrayList reverse and sort scale with n.
+
+    positional_benchmark: Report the cost of indexing into a doubly linked
+                          list in sequential and random order.
+
+    construction_benchmark: Report the cost of building each collection from
+                            a list through its constructor and through one add
+                            per item.
+
+    set_algebra_benchmark: Report the cost of union, intersection, difference,
+                           subset and equality tests of hash, sorted, bit
+                           and array sets.
+
+    churn_benchmark: Report the cost of removing the oldest item from a bag
+                     and adding a new one, with and without ordered removal.
+"""
+
+import tracemalloc
+from math import log2
+from random import Random
+from time import perf_counter
+
+from binarysearchtrees import LinkedBST
+from bags import ArrayBag, ArraySortedBag, HashBag, LinkedBag
+from dicts import ArrayDict, HashDict
+from graphs import ALDirectedGraph
+from heaps import ArrayHeap
+from lists import (ArrayList, LinkedList, DoublyLinkedList, CursorLinkedList,
+                   UnrolledLinkedList)
+from queues import ArrayQueue
+from sets import ArraySet, ArraySortedSet, HashSet, IntBitSet, LinkedSet
+from skiplists import SkipList
+from stacks import ArrayStack
+
+def bytes_per_element(build, n):
+    """
+    Return the bytes allocated by build(items) per element, where items is a
+    list of n distinct integers created before measuring starts.
+    """
+    items = list(range(n))
+    Random(n).shuffle(items)
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    collection = build(items)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (after - before) / n
+
+def build_linked_list(items):
+    """Build a LinkedList by prepending, which is O(1) per item."""
+    out = LinkedList()
+    for item in items:
+        out.prepend(item)
+    return out
+
+def build_graph(items):
+    """Build a graph whose every vertex has an edge to the next vertex."""
+    n = len(items)
+    graph = ALDirectedGraph(range(n))
+    for vertex in range(n):
+        graph.add_edge(vertex, (vertex + 1) % n)
+    return graph
+
+def memory_benchmark(n = 5000):
+    """Print bytes per element for each linked collection and HashDict."""
+    builders = [("LinkedList", build_linked_list),
+                ("DoublyLinkedList", DoublyLinkedList),
+                ("UnrolledLinkedList", UnrolledLinkedList),
+                ("LinkedBag", LinkedBag),
+                ("LinkedBST", LinkedBST),
+                ("ALDirectedGraph edges", build_graph),
+                ("HashDict", lambda items: HashDict(items, items))]
+    print(f"Bytes per element, n = {n}")
+    for name, build in builders:
+        print(f"    {name:<24}{bytes_per_element(build, n):>8.1f}")
+
+def seconds(build, operation, n):
+    """
+    Return the seconds taken by operation(collection), where collection is
+    build(items) for a shuffled list of n distinct integers. Building is not
+    timed.
+    """
+    items = list(range(n))
+    Random(n).shuffle(items)
+    collection = build(items)
+    start = perf_counter()
+    operation(collection)
+    return perf_counter() - start
+
+def array_list_benchmark(sizes = (10 ** 4, 10 ** 5, 10 ** 6)):
+    """
+    Print ArrayList reverse time per element and sort time per n log n
+    element. Flat columns as n grows show reverse is linear and sort is
+    O(n log n).
+    """
+    print("ArrayList scaling, nanoseconds")
+    print(f"    {'n':>8}{'reverse / n':>16}{'sort / n log n':>16}")
+    for n in sizes:
+        reverse = seconds(ArrayList, ArrayList.reverse, n)
+        sort = seconds(ArrayList, ArrayList.sort, n)
+        print(f"    {n:>8}{reverse / n * 1e9:>16.1f}"
+              f"{sort / (n * log2(n)) * 1e9:>16.1f}")
+
+def read_positions(positions):
+    """Return an operation that reads collection[i] for each i in positions."""
+    def operation(collection):
+        for i in positions:
+            collection[i]
+    return operation
+
+def positional_benchmark(sizes = (10 ** 3, 10 ** 4, 3 * 10 ** 4)):
+    """
+    Print the time per index of reading every index of a DoublyLinkedList in
+    order and n random indices, with ArrayList as the O(1) baseline. The
+    sequential column stays flat as n grows because each read starts at the
+    finger left by the one before.
+    """
+    print("Positional reads, nanoseconds per read")
+    print(f"    {'n':>8}{'list':>20}{'sequential':>12}{'random':>12}")
+    for n in sizes:
+        sequential = read_positions(range(n))
+        generator = Random(n)
+        shuffled = read_positions([generator.randrange(n) for _ in range(n)])
+        for build in (ArrayList, DoublyLinkedList):
+            print(f"    {n:>8}{build.__name__:>20}"
+                  f"{seconds(build, sequential, n) / n * 1e9:>12.1f}"
+                  f"{seconds(build, shuffled, n) / n * 1e9:>12.1f}")
+
+def add_each(collection_type):
+    """
+    Return a function that builds an empty collection_type and adds each
+    item in its argument one at a time.
+    """
+    def build(items):
+        collection = collection_type()
+        for item in items:
+            collection.add(item)
+        return collection
+    return build
+
+def set_each(dict_type):
+    """
+    Return a function that builds an empty dict_type and maps each item in
+    its argument to itself one key at a time.
+    """
+    def build(items):
+        dictionary = dict_type()
+        for item in items:
+            dictionary[item] = item
+        return dictionary
+    return build
+
+def construction_benchmark(n = 5000):
+    """
+    Print the time per element of building each collection from n shuffled
+    integers with its constructor, which goes through the bulk add_all, and
+    with one add per item. Dictionaries map each integer to itself, through
+    the constructor and through one assignment per key. The gap is widest
+    for ArraySortedBag, whose adds shift O(n) items each, and ArrayHeap,
+    whose heapify is O(n) overall.
+    """
+    collection_types = (ArrayList, LinkedList, DoublyLinkedList,
+                        CursorLinkedList, UnrolledLinkedList, SkipList,
+                        ArrayBag, ArraySortedBag, LinkedBag, HashBag,
+                        ArraySet, ArraySortedSet, LinkedSet, HashSet,
+                        IntBitSet, ArrayStack, ArrayQueue, ArrayHeap,
+                        LinkedBST)
+    print(f"Construction, nanoseconds per element, n = {n}")
+    print(f"    {'collection':<20}{'constructor':>12}{'add each':>12}")
+    for collection_type in collection_types:
+        bulk = seconds(lambda items: items, collection_type, n)
+        single = seconds(lambda items: items, add_each(collection_type), n)
+        print(f"    {collection_type.__name__:<20}{bulk / n * 1e9:>12.1f}"
+              f"{single / n * 1e9:>12.1f}")
+    for dict_type in (ArrayDict, HashDict):
+        bulk = seconds(lambda items: items,
+                       lambda items: dict_type(items, items), n)
+        single = seconds(lambda items: items, set_each(dict_type), n)
+        print(f"    {dict_type.__name__:<20}{bulk / n * 1e9:>12.1f}"
+              f"{single / n * 1e9:>12.1f}")
+
+def set_algebra_benchmark(n = 10 ** 6, baseline_n = 2000):
+    """
+    Print the time per element of the set operations on two HashSets of n
+    integers that overlap by half, which grows linearly, and on two
+    ArraySortedSets of n integers, which merge their sorted arrays, and two
+    IntBitSets of n integers, which combine 64 items per word, next to
+    the same operations on ArraySets of baseline_n integers, whose linear
+    membership test makes each operation quadratic. The subset test checks the half of
+    the first set that the second shares with it, and equality compares
+    the first set with a copy, which is included in the time.
+    """
+    operations = (("union", lambda a, b, half: a | b),
+                  ("intersection", lambda a, b, half: a & b),
+                  ("difference", lambda a, b, half: a - b),
+                  ("is_subset", lambda a, b, half: half.is_subset(a)),
+                  ("equality", lambda a, b, half: a == a.copy()))
+    print("Set algebra, nanoseconds per element")
+    print(f"    {'operation':<20}{'HashSet':>12}{'SortedSet':>12}"
+          f"{'IntBitSet':>12}{'ArraySet':>12}")
+    print(f"    {'n':<20}{n:>12}{n:>12}{n:>12}{baseline_n:>12}")
+    pairs = []
+    for set_type, size in ((HashSet, n), (ArraySortedSet, n), (IntBitSet, n),
+                           (ArraySet, baseline_n)):
+        pairs.append((set_type(range(size)),
+                      set_type(range(size // 2, size + size // 2)),
+                      set_type(range(size // 2, size)), size))
+    for name, operation in operations:
+        row = f"    {name:<20}"
+        for a, b, half, size in pairs:
+            start = perf_counter()
+            operation(a, b, half)
+            row += f"{(perf_counter() - start) / size * 1e9:>12.1f}"
+        print(row)
+
+def churn_benchmark(n = 5000, rounds = 2000):
+    """
+    Print the time per round of removing the oldest item from a bag of n
+    integers and adding a new one. An ordered ArrayBag shifts nearly every
+    item on each removal, while an unordered one moves only its last item.
+    """
+    builds = (("ArrayBag", lambda items: ArrayBag(items)),
+              ("ArrayBag unordered", lambda items: ArrayBag(items,
+                                                            ordered = False)),
+              ("LinkedBag", LinkedBag),
+              ("HashBag", HashBag))
+    print(f"Churn, nanoseconds per remove and add, n = {n}")
+    for name, build in builds:
+        bag = build(range(n))
+        start = perf_counter()
+        for item in range(n, n + rounds):
+            bag.remove(item - n)
+            bag.add(item)
+        print(f"    {name:<20}{(perf_counter() - start) / rounds * 1e9:>12.1f}")
+
+if __name__ == "__main__":
+    memory_benchmark()
+    array_list_benchmark()
+    positional_benchmark()
+    construction_benchmark()
+    set_algebra_benchmark()
+    churn_benchmark()
@@ -12,6 +12,7 @@ Exports:
 """
 
 from binarysearchtrees import LinkedBST
+from nodes import BSTNode, NodePool
 from abstractcollectiontest import TestAbstractCollection
 import unittest
 
@@ -32,6 +33,35 @@ class TestConcreteBST(TestAbstractCollection):
         self.assertTrue(a.root.right.right.data == 7)
         self.assertTrue(len(a) == 7)
 
+    def test_balanced_build(self):
+        # Sorted input no longer degrades into a linked list
+        a = self.class_type(range(1023))
+        self.assertTrue(a.get_height(a.root) == 10)
+        self.assertTrue(a.is_balanced(a.root))
+        self.assertTrue(list(a.inorder()) == list(range(1023)))
+
+        # Bulk adds merge with self, dropping duplicates
+        a = self.class_type([5,1,3,3])
+        a.add_all([4,2,5,0])
+        self.assertTrue(len(a) == 6)
+        self.assertTrue(list(a.inorder()) == [0,1,2,3,4,5])
+        self.assertTrue(a.is_balanced(a.root))
+        with self.assertRaises(TypeError):
+            a.add_all([6,'a'])
+        self.assertTrue(len(a) == 6)
+
+        # A batch smaller than self is added in place, not rebuilt
+        a = self.class_type(range(0, 200, 2))
+        root = a.root
+        a.add_all([9,3,7,5,1,3])
+        self.assertTrue(a.root is root)
+        self.assertTrue(len(a) == 105)
+        self.assertTrue(list(a.inorder())[:8] == [0,1,2,3,4,5,6,7])
+        # Middle items first keep a sorted batch from forming a chain
+        a.add_all(range(201, 290, 2))
+        self.assertTrue(a.root is root)
+        self.assertTrue(a.get_height(a.root) <= 14)
+
     # Accessor tests
     def test_find(self):
         a = self.class_type([4,2,6,1,3])
@@ -53,7 +83,9 @@ class TestConcreteBST(TestAbstractCollection):
     def test_is_balanced(self):
         a = self.class_type()
         self.assertTrue(a.is_balanced(a.root))
-        a = self.class_type([2,4,5])
+        # Added one at a time, unlike the balanced build of the constructor
+        for item in [2,4,5]:
+            a.add(item)
         self.assertFalse(a.is_balanced(a.root))
         a.add(1)
         self.assertTrue(a.is_balanced(a.root))
@@ -80,7 +112,9 @@ class TestConcreteBST(TestAbstractCollection):
 
     def test_str(self):
         tree_str = "               8                \n\n       4               12       \n\n   2               10      13   \n\n 1   3           9   11      15 \n\n                                "
-        a = self.class_type([8,4,2,1,3,12,10,9,11,13,15])
+        a = self.class_type()
+        for item in [8,4,2,1,3,12,10,9,11,13,15]:
+            a.add(item)
         self.assertTrue(str(a) == tree_str)
 
     # Iterator Accessor tests
@@ -222,6 +256,31 @@ class TestConcreteBST(TestAbstractCollection):
         self.assertTrue(a.root is None)
         self.assertTrue(a.is_empty())
 
+    def test_remove_if(self):
+        a = self.class_type()
+        for item in range(15):
+            a.add(item)
+        self.assertFalse(a.is_balanced(a.root))
+        self.assertTrue(a.remove_if(lambda item: item % 2 == 1) == 7)
+        self.assertTrue(list(a.inorder()) == list(range(0, 15, 2)))
+        self.assertTrue(a.is_balanced(a.root))
+        self.assertTrue(a.retain_if(lambda item: item > 100) == 8)
+        self.assertTrue(a.root is None and a.is_empty())
+
+    def test_pool(self):
+        pool = NodePool(BSTNode)
+        a = self.class_type([4,2,6,1,3,5,7], pool = pool)
+        a.remove(4)
+        a.remove(1)
+        self.assertTrue(len(pool) == 2)
+        self.assertTrue(pool.free[0].data is None)
+        a.add(8)
+        a.add(9)
+        self.assertTrue(pool.hits == 2)
+        self.assertTrue(sorted(a) == [2,3,5,6,7,8,9])
+        a.clear()
+        self.assertTrue(len(pool) == 7)
+
 class TestLinkedBST(TestConcreteBST, unittest.TestCase):
     class_type = LinkedBST
         
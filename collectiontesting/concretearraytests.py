@@ -0,0 +1,555 @@
+"""
+Author:  Russell Gerhard
+Purpose: Create a unit testing framework for the array classes that back the
+         array-based collections.
+
+Exports:
+    TestArray: Test all methods of the Array class, both untyped and typed.
+
+    TestGrowthPolicy: Test the resizing rules used by arrays.
+
+    TestArrayView: Test zero-copy views returned by slicing arrays.
+
+    TestMappedArray: Test file-backed arrays and collections stored in them.
+
+    TestCircularArray: Test the ring buffer used by array queues.
+
+    TestSegmentedArray: Test chunked arrays and collections stored in them.
+"""
+
+from dynamicarray import (Array, ArrayView, CircularArray, GrowthPolicy,
+                          MappedArray, SegmentedArray)
+from bags import ArrayBag
+from lists import ArrayList
+from heaps import ArrayHeap
+from queues import ArrayQueue
+from dicts import HashDict
+import os
+import tempfile
+import unittest
+
+class TestArray(unittest.TestCase):
+
+    # Constructor tests
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            Array(0)
+        a = Array(4)
+        self.assertTrue(len(a) == 4)
+        self.assertTrue(a.size() == 0)
+        self.assertTrue(str(a) == "[]")
+
+    def test_typed_constructor(self):
+        a = Array(4, typecode = 'd')
+        self.assertTrue(a.fill_value == 0.0)
+        self.assertTrue(a.items.typecode == 'd')
+        with self.assertRaises(ValueError):
+            Array(4, typecode = 'Z')
+
+    # Accessor tests
+    def test_getitem(self):
+        a = Array(2)
+        a[0] = 'a'
+        self.assertTrue(a[0] == 'a')
+        with self.assertRaises(IndexError):
+            a[2]
+        with self.assertRaises(IndexError):
+            a[-1]
+
+    def test_iterate(self):
+        a = Array(5, typecode = 'i')
+        for i in range(3):
+            a[i] = i * 10
+        self.assertTrue(list(a) == [0, 10, 20])
+        self.assertTrue(repr(a) == "[0, 10, 20]")
+
+    def test_records(self):
+        a = Array(2, typecode = 'id')
+        self.assertTrue(a.fill_value == (0, 0.0))
+        a[0] = (1, 1.5)
+        a[1] = (2, 2.5)
+        a.grow()
+        a[2] = (3, 3.5)
+        self.assertTrue(list(a) == [(1, 1.5), (2, 2.5), (3, 3.5)])
+        self.assertTrue(len(a.items.buffer) == 4 * a.items.record.size)
+
+    # Mutator tests
+    def test_grow(self):
+        a = Array(2, typecode = 'q')
+        a[0] = 5
+        a.grow()
+        self.assertTrue(len(a) == 2)
+        a[1] = 6
+        a.grow()
+        self.assertTrue(len(a) == 4)
+        self.assertTrue(len(a.items) == 4)
+        self.assertTrue(list(a) == [5, 6])
+
+    def test_shrink(self):
+        a = Array(2, typecode = 'q')
+        for i in range(8):
+            a.grow()
+            a[i] = i
+        self.assertTrue(len(a) == 8)
+        a.logical_size = 2
+        a.shrink()
+        self.assertTrue(len(a) == 4)
+        self.assertTrue(len(a.items) == 4)
+        self.assertTrue(list(a) == [0, 1])
+
+    def test_extend(self):
+        a = Array(2, typecode = 'i')
+        a[0] = 7
+        a.extend(range(50))
+        self.assertTrue(a.size() == 51)
+        self.assertTrue(len(a) == 51)
+        self.assertTrue(list(a) == [7] + list(range(50)))
+
+    def test_reserve(self):
+        a = Array(2)
+        a.reserve(100)
+        self.assertTrue(len(a) == 100)
+        a.reserve(10)
+        self.assertTrue(len(a) == 100)
+
+    def test_truncate(self):
+        a = Array(4)
+        a.extend(range(100))
+        a.truncate(3)
+        self.assertTrue(list(a) == [0, 1, 2])
+        self.assertTrue(a.items[3] is None)
+        self.assertTrue(len(a) < 100)
+        with self.assertRaises(ValueError):
+            a.truncate(4)
+
+    def test_shrink_to_fit(self):
+        a = Array(10)
+        a[0] = 'a'
+        a[1] = 'b'
+        a.shrink_to_fit()
+        self.assertTrue(len(a) == 2)
+        self.assertTrue(len(a.items) == 2)
+        self.assertTrue(str(a) == "['a', 'b']")
+        with self.assertRaises(ValueError):
+            a.resize(1)
+
+    def test_clear(self):
+        a = Array(2, typecode = 'i')
+        for i in range(5):
+            a.grow()
+            a[i] = i
+        a.clear()
+        self.assertTrue(len(a) == 2)
+        self.assertTrue(a.size() == 0)
+        self.assertTrue(a.items.typecode == 'i')
+
+    # Typed collection tests
+    def test_typed_collections(self):
+        a = ArrayList([3, 1, 2], typecode = 'i')
+        a.sort()
+        self.assertTrue(str(a) == "[1, 2, 3]")
+        a.clear()
+        self.assertTrue(a.items.typecode == 'i')
+        with self.assertRaises(TypeError):
+            a.append('a')
+        b = ArrayHeap([2.5, 1.5, 3.5], typecode = 'd')
+        self.assertTrue(b.pop() == 1.5)
+        self.assertTrue(b.items.items.typecode == 'd')
+
+
+class TestGrowthPolicy(unittest.TestCase):
+
+    # Constructor tests
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            GrowthPolicy(factor = 1)
+        with self.assertRaises(ValueError):
+            GrowthPolicy(factor = 2, shrink_load = 0.5)
+        with self.assertRaises(ValueError):
+            GrowthPolicy(min_capacity = 0)
+
+    # Accessor tests
+    def test_grown_capacity(self):
+        policy = GrowthPolicy(factor = 1.5)
+        self.assertTrue(policy.grown_capacity(10, 11) == 15)
+        self.assertTrue(policy.grown_capacity(1, 2) == 2)
+        self.assertTrue(policy.grown_capacity(10, 30) == 33)
+
+    def test_shrunk_capacity(self):
+        policy = GrowthPolicy()
+        self.assertTrue(policy.shrunk_capacity(40, 10, 10) == 20)
+        self.assertTrue(policy.shrunk_capacity(40, 11, 10) == 40)
+        self.assertTrue(policy.shrunk_capacity(20, 5, 10) == 10)
+        self.assertTrue(policy.shrunk_capacity(10, 0, 10) == 10)
+        policy = GrowthPolicy(min_capacity = 2)
+        self.assertTrue(policy.shrunk_capacity(8, 1, 10) == 4)
+
+    # Collection tests
+    def test_array_uses_policy(self):
+        a = Array(4, policy = GrowthPolicy(factor = 3, shrink_load = 0.1))
+        for i in range(5):
+            a.grow()
+            a[i] = i
+        self.assertTrue(len(a) == 12)
+        a.logical_size = 2
+        a.shrink()
+        self.assertTrue(len(a) == 12)
+        a.logical_size = 1
+        a.shrink()
+        self.assertTrue(len(a) == 4)
+
+    def test_no_thrashing(self):
+        a = ArrayList(policy = GrowthPolicy(shrink_load = 0.2))
+        for i in range(10):
+            a.append(i)
+        a.append(10)
+        capacity = len(a.items)
+        for _ in range(5):
+            a.pop(len(a) - 1)
+            a.append(10)
+        self.assertTrue(len(a.items) == capacity)
+
+    def test_collection_reserve(self):
+        a = ArrayList()
+        a.reserve(1000)
+        self.assertTrue(len(a.items) == 1000)
+        a.extend(range(3))
+        a.shrink_to_fit()
+        self.assertTrue(len(a.items) == 3)
+        self.assertTrue(str(a) == "[0, 1, 2]")
+
+    def test_hashdict_reserve(self):
+        a = HashDict()
+        a.reserve(100)
+        capacity = a.capacity
+        self.assertTrue(capacity * HashDict.load_factor >= 100)
+        for i in range(100):
+            a[i] = str(i)
+        self.assertTrue(a.capacity == capacity)
+        for i in range(95):
+            a.pop(i)
+        a.shrink_to_fit()
+        self.assertTrue(a.capacity < capacity)
+        self.assertTrue(len(a.items) == a.capacity)
+        self.assertTrue(a[99] == "99")
+        self.assertTrue(len(a) == 5)
+
+
+class TestArrayView(unittest.TestCase):
+
+    def make_array(self, typecode = None):
+        a = Array(10, typecode = typecode)
+        for i in range(6):
+            a[i] = i
+        return a
+
+    # Accessor tests
+    def test_slice(self):
+        a = self.make_array()
+        v = a[1:5]
+        self.assertTrue(isinstance(v, ArrayView))
+        self.assertTrue(len(v) == 4)
+        self.assertTrue(str(v) == "[1, 2, 3, 4]")
+        self.assertTrue(str(a[::2]) == "[0, 2, 4]")
+        self.assertTrue(str(a[::-1]) == "[5, 4, 3, 2, 1, 0]")
+        # Slices stop at the logical size, not the capacity
+        self.assertTrue(len(a[:]) == 6)
+
+    def test_getitem(self):
+        v = self.make_array()[1:6:2]
+        self.assertTrue(v[0] == 1)
+        self.assertTrue(v[2] == 5)
+        self.assertTrue(str(v[1:]) == "[3, 5]")
+        with self.assertRaises(IndexError):
+            v[3]
+
+    def test_shares_storage(self):
+        a = self.make_array()
+        v = a[2:4]
+        v[0] = 'a'
+        self.assertTrue(a[2] == 'a')
+        a[3] = 'b'
+        self.assertTrue(v[1] == 'b')
+
+    def test_equality(self):
+        a = self.make_array()
+        self.assertTrue(a[0:2] == a[:2])
+        self.assertFalse(a[0:2] == a[1:3])
+
+    def test_memoryview(self):
+        a = self.make_array('i')
+        m = a[1:5:2].memoryview()
+        self.assertTrue(m.tolist() == [1, 3])
+        self.assertTrue(a[::-1].memoryview().tolist() == [5, 4, 3, 2, 1, 0])
+        m.release()
+        with self.assertRaises(TypeError):
+            self.make_array()[0:2].memoryview()
+
+    def test_record_memoryview(self):
+        a = Array(4, typecode = '<hd')
+        a[0] = (1, 1.0)
+        a[1] = (2, 2.0)
+        m = a[1:2].memoryview()
+        self.assertTrue(bytes(m) == a.items.record.pack(2, 2.0))
+        with self.assertRaises(ValueError):
+            a[::2].memoryview()
+
+
+class TestMappedArray(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.file_path = os.path.join(self.directory.name, "items.arr")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    # Constructor tests
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            MappedArray(self.file_path)
+        with self.assertRaises(ValueError):
+            MappedArray(self.file_path, readonly = True)
+        with MappedArray(self.file_path, 'q', 4) as a:
+            self.assertTrue(len(a) == 4)
+            self.assertTrue(a.size() == 0)
+        with self.assertRaises(ValueError):
+            MappedArray(self.file_path, 'd')
+
+    # Accessor tests
+    def test_reopen(self):
+        with MappedArray(self.file_path, 'd', 2) as a:
+            for i in range(5):
+                a.grow()
+                a[i] = i / 2
+        with MappedArray(self.file_path) as a:
+            self.assertTrue(a.typecode == 'd')
+            self.assertTrue(a.size() == 5)
+            self.assertTrue(str(a) == "[0.0, 0.5, 1.0, 1.5, 2.0]")
+        # Reopening keeps the file's capacity, not the constructor default
+        with MappedArray(self.file_path, 'd', 40) as a:
+            self.assertTrue(a.default_capacity == len(a))
+            capacity = len(a)
+            a.clear()
+            self.assertTrue(len(a) == capacity and a.size() == 0)
+
+    def test_readonly(self):
+        with MappedArray(self.file_path, 'i', 4) as a:
+            a[0] = 7
+            with MappedArray(self.file_path, readonly = True) as b:
+                self.assertTrue(b[0] == 7)
+                a[1] = 8
+                self.assertTrue(b.size() == 2)
+                self.assertTrue(b[1] == 8)
+                with self.assertRaises(TypeError):
+                    b[0] = 1
+                with self.assertRaises(TypeError):
+                    b.resize(8)
+
+    def test_records(self):
+        with MappedArray(self.file_path, '<qd', 1) as a:
+            a[0] = (1, 0.5)
+            a.grow()
+            a[1] = (2, 1.5)
+        with MappedArray(self.file_path) as a:
+            self.assertTrue(list(a) == [(1, 0.5), (2, 1.5)])
+
+    # Mutator tests
+    def test_resize_file(self):
+        with MappedArray(self.file_path, 'q', 4) as a:
+            a.reserve(100)
+            self.assertTrue(os.path.getsize(self.file_path) ==
+                            MappedArray.header.size + 100 * 8)
+            a[0] = 3
+            a.shrink_to_fit()
+            self.assertTrue(os.path.getsize(self.file_path) ==
+                            MappedArray.header.size + 8)
+            a.clear()
+            self.assertTrue(a.size() == 0)
+            self.assertTrue(len(a) == 4)
+
+    # Collection tests
+    def test_mapped_collections(self):
+        a = ArrayList([5, 6], storage = MappedArray(self.file_path, 'q'))
+        a.insert(0, 4)
+        a.items.close()
+        a = ArrayList(storage = MappedArray(self.file_path))
+        self.assertTrue(str(a) == "[4, 5, 6]")
+        a.append(7)
+        self.assertTrue(len(a) == 4)
+        a.items.close()
+
+        heap_path = os.path.join(self.directory.name, "heap.arr")
+        b = ArrayHeap([3.0, 1.0, 2.0], storage = MappedArray(heap_path, 'd'))
+        b.items.close()
+        b = ArrayHeap(storage = MappedArray(heap_path))
+        self.assertTrue(b.pop() == 1.0)
+        self.assertTrue(b.pop() == 2.0)
+        self.assertTrue(len(b) == 1)
+        b.items.close()
+
+
+class TestCircularArray(unittest.TestCase):
+
+    def make_wrapped(self, typecode = None, wrap = lambda i: i):
+        # Leaves items 2 through 5 wrapped around the end of a 4-slot buffer
+        a = CircularArray(4, typecode = typecode)
+        for i in range(4):
+            a.push_back(wrap(i))
+        a.pop_front()
+        a.pop_front()
+        a.push_back(wrap(4))
+        a.push_back(wrap(5))
+        return a
+
+    # Accessor tests
+    def test_getitem(self):
+        a = self.make_wrapped()
+        self.assertTrue(a.front == 2)
+        self.assertTrue(a[0] == 2)
+        self.assertTrue(a[3] == 5)
+        with self.assertRaises(IndexError):
+            a[4]
+        with self.assertRaises(TypeError):
+            a[0:2]
+
+    def test_iterate(self):
+        a = self.make_wrapped()
+        self.assertTrue(list(a) == [2, 3, 4, 5])
+        self.assertTrue(str(a) == "[2, 3, 4, 5]")
+
+    def test_equality(self):
+        a = self.make_wrapped()
+        b = CircularArray(8)
+        for i in range(2, 6):
+            b.push_back(i)
+        self.assertTrue(a == b)
+        b.pop_back()
+        self.assertFalse(a == b)
+
+    # Mutator tests
+    def test_push_pop(self):
+        a = CircularArray(4)
+        a.push_back(1)
+        a.push_front(0)
+        a.push_back(2)
+        self.assertTrue(list(a) == [0, 1, 2])
+        self.assertTrue(a.pop_back() == 2)
+        self.assertTrue(a.pop_front() == 0)
+        self.assertTrue(a.pop_front() == 1)
+        with self.assertRaises(IndexError):
+            a.pop_front()
+        with self.assertRaises(IndexError):
+            a.pop_back()
+
+    def test_extend(self):
+        a = CircularArray(4)
+        a.push_back(1)
+        a.pop_front()
+        a.extend(range(10))
+        self.assertTrue(list(a) == list(range(10)))
+        self.assertTrue(len(a) == 10)
+
+    def test_grow_unwraps(self):
+        for typecode, wrap in ((None, lambda i: i), ('i', lambda i: i),
+                               ('<ii', lambda i: (i, -i))):
+            a = self.make_wrapped(typecode, wrap)
+            a.push_back(wrap(6))
+            self.assertTrue(len(a) == 8)
+            self.assertTrue(a.front == 0)
+            self.assertTrue(list(a) == [wrap(i) for i in range(2, 7)])
+
+    def test_shrink(self):
+        a = CircularArray(4)
+        for i in range(64):
+            a.push_back(i)
+        for i in range(62):
+            a.pop_front()
+        self.assertTrue(len(a) == 4)
+        self.assertTrue(list(a) == [62, 63])
+
+    def test_queue_releases_memory(self):
+        a = ArrayQueue()
+        for i in range(1000):
+            a.add(i)
+        for i in range(995):
+            a.pop()
+        self.assertTrue(len(a.items) < 40)
+        self.assertTrue(str(a) == "[995, 996, 997, 998, 999]")
+
+
+class TestSegmentedArray(unittest.TestCase):
+
+    # Constructor tests
+    def test_constructor(self):
+        with self.assertRaises(ValueError):
+            SegmentedArray(6)
+        a = SegmentedArray(4)
+        self.assertTrue(len(a) == 4)
+        self.assertTrue(len(a.items) == 1)
+
+    # Accessor tests
+    def test_getitem(self):
+        a = SegmentedArray(4)
+        for i in range(10):
+            a.grow()
+            a[i] = i
+        self.assertTrue(a[0] == 0)
+        self.assertTrue(a[9] == 9)
+        self.assertTrue(str(a[3:7]) == "[3, 4, 5, 6]")
+        with self.assertRaises(IndexError):
+            a[12]
+        with self.assertRaises(TypeError):
+            SegmentedArray(4, typecode = 'i')[0:2].memoryview()
+
+    def test_iterate(self):
+        a = SegmentedArray(2, typecode = 'i')
+        for i in range(5):
+            a.grow()
+            a[i] = i
+        self.assertTrue(list(a) == [0, 1, 2, 3, 4])
+        self.assertTrue(a == a[:].source)
+
+    # Mutator tests
+    def test_grow_keeps_chunks(self):
+        a = SegmentedArray(4)
+        for i in range(4):
+            a[i] = i
+        first_chunk = a.items[0]
+        a.grow()
+        self.assertTrue(len(a) == 8)
+        self.assertTrue(a.items[0] is first_chunk)
+
+    def test_shrink(self):
+        a = SegmentedArray(4)
+        for i in range(16):
+            a.grow()
+            a[i] = i
+        a.logical_size = 5
+        a.shrink()
+        self.assertTrue(len(a) == 12)
+        # One spare chunk is kept
+        a.shrink()
+        self.assertTrue(len(a) == 12)
+        a.reserve(17)
+        self.assertTrue(len(a) == 20)
+        a.shrink_to_fit()
+        self.assertTrue(len(a) == 8)
+        a.clear()
+        self.assertTrue(len(a) == 4)
+        self.assertTrue(a.size() == 0)
+
+    # Collection tests
+    def test_segmented_collections(self):
+        a = ArrayList(range(100), storage = SegmentedArray(8))
+        self.assertTrue(len(a.items.items) == 13)
+        a.insert(50, 'a')
+        self.assertTrue(a[50] == 'a')
+        self.assertTrue(a.pop(50) == 'a')
+        self.assertTrue(list(a) == list(range(100)))
+        b = ArrayBag(range(20), storage = SegmentedArray(4))
+        b.remove(3)
+        self.assertTrue(len(b) == 19)
+        self.assertTrue(3 not in b)
+        with self.assertRaises(ValueError):
+            ArrayBag(storage = b.items)
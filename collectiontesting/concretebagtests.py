@@ -16,9 +16,12 @@ Exports:
 
     TestLinkedBag: Test all methods in and inherited by the LinkedBag
                    implementation of the bag ADT.
+
+    TestHashBag: Test all methods in and inherited by the HashBag
+                 implementation of the bag ADT.
 """
 
-from bags import ArrayBag, ArraySortedBag, LinkedBag
+from bags import ArrayBag, ArraySortedBag, HashBag, LinkedBag
 from abstractbagtest import TestAbstractBag
 import unittest
 
@@ -67,6 +70,34 @@ class TestConcreteBag(TestAbstractBag):
 class TestArrayBag(TestConcreteBag, unittest.TestCase):
     class_type = ArrayBag
 
+    # Mutator tests
+    def test_discard_many_order(self):
+        a = self.class_type([5,1,4,2,3])
+        self.assertTrue(a.discard_many([4,1,7]) == 2)
+        self.assertTrue(str(a) == "{5, 2, 3}")
+        self.assertTrue(a.discard_many([[5]]) == 0)
+        self.assertTrue(len(a) == 3)
+
+    def test_discard_many_unhashable(self):
+        # Unhashable items fall back to one removal per item, intact
+        a = self.class_type([2,3,[1]])
+        self.assertTrue(a.discard_many([2]) == 1)
+        self.assertTrue(str(a) == "{3, [1]}")
+        self.assertTrue(len(a) == 2)
+        self.assertTrue(a.discard_many([[1],4]) == 1)
+        self.assertTrue(str(a) == "{3}")
+
+    def test_unordered_remove(self):
+        # The last item fills the gap left by a removal
+        a = self.class_type([1,2,3,4,5], ordered = False)
+        a.remove(2)
+        self.assertTrue(str(a) == "{1, 5, 3, 4}")
+        a.remove(4)
+        self.assertTrue(str(a) == "{1, 5, 3}")
+        with self.assertRaises(ValueError):
+            a.remove(2)
+        self.assertTrue(len(a) == 3)
+
 
 class TestLinkedBag(TestConcreteBag, unittest.TestCase):
     class_type = LinkedBag
@@ -89,6 +120,37 @@ class TestArraySortedBag(TestConcreteBag, unittest.TestCase):
         for i,item in enumerate(a):
             self.assertTrue(l[i] == item)
 
+    def test_multiset_operations(self):
+        a = self.class_type([3,1,1,3,1,2])
+        b = self.class_type([4,1,2,2])
+        self.assertTrue(str(a | b) == "{1, 1, 1, 2, 2, 3, 3, 4}")
+        self.assertTrue(str(a & b) == "{1, 2}")
+        self.assertTrue(str(a - b) == "{1, 1, 3, 3}")
+        self.assertTrue(str(b - a) == "{2, 4}")
+        self.assertTrue(str(a ^ b) == "{1, 1, 2, 3, 3, 4}")
+        self.assertTrue(self.class_type([1,2,2]).is_subset(b))
+        self.assertFalse(self.class_type([1,1]).is_subset(b))
+        with self.assertRaises(TypeError):
+            a | [1]
+        with self.assertRaises(TypeError):
+            a & ArrayBag([1])
+        with self.assertRaises(TypeError):
+            a ^ [1]
+
+    def test_unequal_operations(self):
+        # Galloping skips the long stretches of b between items of a
+        a = self.class_type([-1,500,500,1500,2500])
+        b = self.class_type(range(2000))
+        self.assertTrue(list(a & b) == [500,1500])
+        self.assertTrue(list(a - b) == [-1,500,2500])
+        self.assertTrue(list(b & a) == [500,1500])
+        self.assertTrue(len(a | b) == 2003)
+        self.assertTrue(list(a | b)[:3] == [-1,0,1])
+        self.assertTrue(len(b - a) == 1998)
+        self.assertTrue(len(a ^ b) == 2001)
+        self.assertTrue(self.class_type([0,999,1999]).is_subset(b))
+        self.assertFalse(a.is_subset(b))
+
     def test_repr(self):
         a = self.class_type([6,1,4,2,3,5])
         self.assertTrue(repr(a) == f"{self.class_type.__name__}(1, 2, 3, 4, 5, 6)")
@@ -110,4 +172,119 @@ class TestArraySortedBag(TestConcreteBag, unittest.TestCase):
         a.add(1)
         a.add(9)
         self.assertTrue(str(a) == "{1, 2, 4, 9, 9}")
+
+    def test_add_all(self):
+        a = self.class_type([5,1])
+        a.add_all([3,1,7])
+        self.assertTrue(str(a) == "{1, 1, 3, 5, 7}")
+        with self.assertRaises(TypeError):
+            a.add_all([2,'a'])
+        with self.assertRaises(TypeError):
+            a.add_all(['a'])
+        self.assertTrue(len(a) == 5)
         
+
+
+class TestHashBag(TestConcreteBag, unittest.TestCase):
+    class_type = HashBag
+
+    # Copies of an item iterate together, in no particular order
+    def items_of(self, bag):
+        return sorted(map(str, bag))
+
+    # Constructor tests
+    def test_constructor(self):
+        a = self.class_type([1,4,2,'a','b',3,2,1,'b'])
+        self.assertTrue(self.items_of(a) == sorted("142ab321b"))
+        self.assertTrue(len(a) == 9)
+        self.assertTrue(len(a.counts) == 6)
+        a = self.class_type()
+        self.assertTrue(str(a) == "{}")
+
+    # Accessor tests
+    def test_count(self):
+        a = self.class_type([3,1,3,'a',3])
+        self.assertTrue(a.count(3) == 3)
+        self.assertTrue(a.count('a') == 1)
+        self.assertTrue(a.count(2) == 0)
+
+    def test_iterate(self):
+        a = self.class_type([1,'c','c',2,5,4,2,5,'b'])
+        self.assertTrue(self.items_of(a) == sorted("1cc25425b"))
+        items = list(a)
+        self.assertTrue(items[items.index('c') + 1] == 'c')
+
+    def test_most_common(self):
+        a = self.class_type("abracadabra")
+        self.assertTrue(a.most_common(1) == [('a', 5)])
+        top = a.most_common(3)
+        self.assertTrue(top[0] == ('a', 5))
+        self.assertTrue(sorted(top[1:]) == [('b', 2), ('r', 2)])
+        self.assertTrue([count for _, count in a.most_common()] ==
+                        [5, 2, 2, 1, 1])
+        self.assertTrue(a.most_common(0) == [])
+        # Items need not be comparable with each other
+        a = self.class_type([1, 'a', 'a', (2,)])
+        self.assertTrue(a.most_common(1) == [('a', 2)])
+
+    def test_multiset_operations(self):
+        a = self.class_type([1,1,1,2,3,3])
+        b = self.class_type([1,2,2,4])
+        self.assertTrue(a | b == self.class_type([1,1,1,2,2,3,3,4]))
+        self.assertTrue(a & b == self.class_type([1,2]))
+        self.assertTrue(a - b == self.class_type([1,1,3,3]))
+        self.assertTrue(b - a == self.class_type([2,4]))
+        self.assertTrue(len(a - b) == 4)
+        with self.assertRaises(TypeError):
+            a | [1]
+        with self.assertRaises(TypeError):
+            a & ArrayBag([1])
+        with self.assertRaises(TypeError):
+            a - [1]
+
+    def test_repr(self):
+        a = self.class_type([5])
+        self.assertTrue(repr(a) == f"{self.class_type.__name__}(5)")
+
+    def test_str(self):
+        a = self.class_type([1,5,2])
+        self.assertTrue(str(a).startswith('{') and str(a).endswith('}'))
+        self.assertTrue(sorted(str(a)[1:-1].split(", ")) == ['1', '2', '5'])
+
+    # Mutator tests
+    def test_add(self):
+        a = self.class_type()
+        a.add(1)
+        a.add(2)
+        a.add(1)
+        a.add('a')
+        self.assertTrue(len(a) == 4)
+        self.assertTrue(self.items_of(a) == ['1', '1', '2', 'a'])
+
+    def test_clear(self):
+        a = self.class_type([1,1,4,4,4])
+        a.clear()
+        self.assertTrue(a.is_empty())
+        self.assertTrue(len(a.counts) == 0)
+        self.assertTrue(a == self.class_type())
+
+    def test_remove(self):
+        a = self.class_type([1,1,6,7])
+        a.remove(1)
+        self.assertTrue(self.items_of(a) == ['1', '6', '7'])
+        a.remove(1)
+        self.assertTrue(1 not in a)
+        self.assertTrue(len(a.counts) == 2)
+        with self.assertRaises(ValueError):
+            a.remove(1)
+        self.assertTrue(len(a) == 2)
+
+    def test_set_count(self):
+        a = self.class_type(['x'])
+        a.set_count('x', 4)
+        a.set_count('y', 2)
+        self.assertTrue(len(a) == 6)
+        a.set_count('x', 0)
+        a.set_count('z', -1)
+        self.assertTrue('x' not in a and 'z' not in a)
+        self.assertTrue(len(a) == 2)
@@ -14,7 +14,7 @@ Exports:
                   by the HashDict class.
 """
 
-from dicts import ArrayDict, HashDict
+from dicts import ArrayDict, HashDict, HashEntry
 from abstractdicttest import TestAbstractDict
 import unittest
 
@@ -80,5 +80,25 @@ class TestArrayDict(TestConcreteDict, unittest.TestCase):
 
 class TestHashDict(TestConcreteDict, unittest.TestCase):
     class_type = HashDict
+
+    def test_entries(self):
+        a = self.class_type(['a', 'b'], [1, 2])
+        self.assertTrue('a' in a)
+        entry = a.items[a.position]
+        self.assertTrue(isinstance(entry, HashEntry))
+        self.assertTrue(entry.probe_length >= 0)
+        self.assertFalse(hasattr(entry, "__dict__"))
+        self.assertFalse(hasattr(next(a.entries()), "probe_length"))
+
+    def test_pop_shifts_back(self):
+        # Keys 0, 13 and 26 share a home slot in the default table
+        a = self.class_type([0, 13, 26, 1], ['a', 'b', 'c', 'd'])
+        self.assertTrue(a.pop(13) == 'b')
+        self.assertTrue("_del_" not in list(a.items))
+        self.assertTrue(a[26] == 'c' and a[1] == 'd' and a[0] == 'a')
+        self.assertTrue(a.items[a.position].probe_length <= 1)
+        self.assertFalse(13 in a)
+        self.assertFalse(39 in a)
+        self.assertTrue(len(a) == 3)
         
         
@@ -80,6 +80,23 @@ class TestConcreteHeap(TestAbstractCollection):
         a.add(10)
         self.assertTrue(repr(a) == "ArrayHeap(1, 5, 3, 10, 5, 5, 12, 11, 10)")
 
+    def test_add_all(self):
+        # A large batch is heapified, a small one sifted up item by item
+        a = self.class_type()
+        a.add_all(range(100, 0, -1))
+        a.add_all([50, 0])
+        self.assertTrue(len(a) == 102)
+        for i in range(1, len(a)):
+            self.assertTrue(a.items[(i - 1) // 2] <= a.items[i])
+        self.assertTrue([a.pop() for _ in range(4)] == [0, 1, 2, 3])
+
+        # Incomparable items leave self unchanged
+        with self.assertRaises(TypeError):
+            a.add_all(['a'] * 200)
+        with self.assertRaises(TypeError):
+            self.class_type([{}])
+        self.assertTrue(len(a) == 98)
+
     def test_clear(self):
         a = self.class_type()
         a.clear()
@@ -7,6 +7,9 @@ Exports:
     TestConreteList: Test all methods provided by any concrete class
                      implementing a list. Meant to be inherited.
 
+    TestConcreteLinkedList: Test behavior shared by the node-based lists.
+                            Meant to be inherited.
+
     TestArrayList: Test all methods in and inherited by the ArrayList
                    implementation.
 
@@ -15,10 +18,23 @@ Exports:
 
     TestDoublyLinkedList: Test all methods in and inherited by the
                           DoublyLinkedList implementation.
+
+    TestCursorLinkedList: Test all methods in and inherited by the
+                          CursorLinkedList implementation.
+
+    TestSkipList: Test all methods in and inherited by the SkipList
+                  implementation, in both unsorted and sorted modes.
+
+    TestUnrolledLinkedList: Test all methods in and inherited by the
+                            UnrolledLinkedList implementation.
 """
 
-from lists import ArrayList, LinkedList, DoublyLinkedList
+from lists import (ArrayList, LinkedList, DoublyLinkedList, CursorLinkedList,
+                   UnrolledLinkedList)
+from skiplists import SkipList
 from abstractlisttest import TestAbstractList
+from nodes import NodePool
+import pickle
 import unittest
 
 class TestConcreteList(TestAbstractList):
@@ -49,6 +65,11 @@ class TestConcreteList(TestAbstractList):
         a.extend([1,4,5,6])
         b = self.class_type([6,4,'a',1,4,5,6])
         self.assertTrue(a == b)
+        # Extending by self appends one copy of the items
+        a = self.class_type([1,2])
+        a.extend(a)
+        self.assertTrue(list(a) == [1,2,1,2])
+        self.assertTrue(len(a) == 4)
 
     def test_insert(self):
         a = self.class_type([1,'b'])
@@ -88,14 +109,286 @@ class TestConcreteList(TestAbstractList):
         b = self.class_type([1,2,3,4,5,6])
         self.assertTrue(a == b)
 
+    def test_sort_key(self):
+        pairs = [(2,'a'), (1,'b'), (2,'c'), (0,'d'), (1,'e')]
+        a = self.class_type(pairs)
+        a.sort(key = lambda pair: pair[0])
+        self.assertTrue(list(a) == sorted(pairs, key = lambda pair: pair[0]))
+        a.sort(key = lambda pair: pair[0], reverse = True)
+        self.assertTrue(list(a) == [(2,'a'), (2,'c'), (1,'b'), (1,'e'), (0,'d')])
+        a = self.class_type(range(3000, 0, -1))
+        a.sort()
+        self.assertTrue(list(a) == list(range(1, 3001)))
+        a.append(0)
+        self.assertTrue(a[0] == 1 and a[3000] == 0)
+
+    def test_sort_failure(self):
+        # A failed sort keeps every item, in some order
+        for items, key in (([3,1,2,'a',5,0], None),
+                           ([3,1,2,None,5,0], lambda item: item)):
+            a = self.class_type(items)
+            with self.assertRaises(TypeError):
+                a.sort(key = key)
+            self.assertTrue(len(a) == 6)
+            self.assertTrue(sorted(map(str, a)) == sorted(map(str, items)))
+            a.append(9)
+            self.assertTrue(a[6] == 9 and len(a) == 7)
+
+
+class TestConcreteLinkedList(TestConcreteList):
+
+    def test_cursor(self):
+        a = self.class_type([1,2,3,4])
+        c = a.cursor()
+        self.assertFalse(c.has_prev())
+        with self.assertRaises(LookupError):
+            c.remove()
+        self.assertTrue(c.next() == 1)
+        c.insert_before(0)
+        c.insert_after(1.5)
+        self.assertTrue(c.next() == 1.5)
+        self.assertTrue(c.next() == 2)
+        self.assertTrue(c.remove() == 2)
+        c.insert_after(2.5)
+        self.assertTrue(c.next() == 2.5)
+        c.replace(2)
+        self.assertTrue(c.prev() == 1.5)
+        self.assertTrue(str(a) == "[0, 1, 1.5, 2, 3, 4]")
+        self.assertTrue(list(c) == [2, 3, 4])
+        self.assertFalse(c.has_next())
+        self.assertTrue(c.remove() == 4)
+        c.insert_after(5)
+        self.assertTrue(str(a) == "[0, 1, 1.5, 2, 3, 5]" and len(a) == 6)
+        self.assertTrue(a[5] == 5)
+        c = a.cursor()
+        c.next()
+        c.remove()
+        c.insert_before(-1)
+        self.assertTrue(str(a) == "[-1, 1, 1.5, 2, 3, 5]" and a[0] == -1)
+
+    def test_node_slots(self):
+        a = self.class_type([1,2])
+        self.assertFalse(hasattr(a.head, "__dict__"))
+
+    def test_pool(self):
+        pool = NodePool(self.class_type.node_type, 2)
+        a = self.class_type([1,2,3,4], pool = pool)
+        a.pop(3)
+        a.pop(0)
+        a.pop(0)
+        self.assertTrue(len(pool) == 2)
+        a.insert(1, 5)
+        a.insert(0, 6)
+        a.insert(0, 7)
+        self.assertTrue(pool.hits == 2)
+        self.assertTrue(pool.misses == 5)
+        self.assertTrue(str(a) == "[7, 6, 3, 5]")
+
 
 class TestArrayList(TestConcreteList, unittest.TestCase):
     class_type = ArrayList
 
+    # Accessor tests
+    def test_slice(self):
+        a = self.class_type([1,2,3,4,5])
+        b = a[1:4]
+        self.assertTrue(str(b) == "[2, 3, 4]")
+        b[0] = 20
+        self.assertTrue(a[1] == 20)
+        self.assertTrue(str(a[::-2]) == "[5, 3, 1]")
+        a = self.class_type([1,2,3], typecode = 'i')
+        self.assertTrue(a[1:].memoryview().tolist() == [2, 3])
 
-class TestLinkedList(TestConcreteList, unittest.TestCase):
+    # Mutator tests
+    def test_sort_large(self):
+        a = self.class_type(range(5000))
+        a.sort(reverse = True)
+        self.assertTrue(list(a) == list(range(4999, -1, -1)))
+        a = self.class_type([3,1,2] * 1000, typecode = 'i')
+        a.sort()
+        self.assertTrue(list(a) == [1] * 1000 + [2] * 1000 + [3] * 1000)
+
+
+class TestLinkedList(TestConcreteLinkedList, unittest.TestCase):
     class_type = LinkedList
 
+    # Mutator tests
+    def test_splice(self):
+        a = self.class_type([1,2])
+        b = self.class_type([3,4])
+        a.splice(b)
+        self.assertTrue(str(a) == "[1, 2, 3, 4]" and len(a) == 4)
+        self.assertTrue(b.is_empty() and b.head is None and b.tail is None)
+        a.append(5)
+        b.splice(a)
+        self.assertTrue(str(b) == "[1, 2, 3, 4, 5]" and b.tail.data == 5)
+        with self.assertRaises(TypeError):
+            b.splice([6])
+
+    def test_tail(self):
+        a = self.class_type()
+        a.extend(range(3))
+        self.assertTrue(a.tail.data == 2)
+        a.pop(2)
+        self.assertTrue(a.tail.data == 1)
+        a.reverse()
+        self.assertTrue(a.tail.data == 0)
+        a.sort()
+        a.append(5)
+        self.assertTrue(str(a) == "[0, 1, 5]" and a.tail.data == 5)
+        a.pop(0)
+        a.pop(0)
+        a.pop(0)
+        self.assertTrue(a.tail is None)
+
 
-class TestDoublyLinkedList(TestConcreteList, unittest.TestCase):
+class TestDoublyLinkedList(TestConcreteLinkedList, unittest.TestCase):
     class_type = DoublyLinkedList
+
+    # Accessor tests
+    def test_finger(self):
+        a = self.class_type(range(10))
+        self.assertTrue(a[6] == 6)
+        self.assertTrue(a.finger.data == 6 and a.finger_index == 6)
+        a.insert(5, 'x')
+        self.assertTrue(a.finger.data == 'x' and a[7] == 6)
+        a.prepend('y')
+        self.assertTrue(a.finger_index == 8 and a[9] == 7)
+        self.assertTrue(a.pop(9) == 7)
+        self.assertTrue(a.finger.data == 8 and a[9] == 8)
+        a.pop(10)
+        self.assertTrue(a.finger is None)
+        a.reverse()
+        self.assertTrue(str(a) == "[8, 6, 5, x, 4, 3, 2, 1, 0, y]")
+        self.assertTrue(a.tail.prev.data == 0)
+
+    # Mutator tests
+    def test_reverse_links(self):
+        a = self.class_type([1,2])
+        a.reverse()
+        self.assertTrue(a.head.data == 2 and a.tail.prev.data == 2)
+        self.assertTrue(a.head.prev is None and a.tail.next is None)
+
+
+class TestCursorLinkedList(TestConcreteList, unittest.TestCase):
+    class_type = CursorLinkedList
+
+    # Accessor tests
+    def test_getitem_from_tail(self):
+        a = self.class_type(range(10))
+        self.assertTrue(a[8] == 8)
+        self.assertTrue(a[2] == 2)
+        with self.assertRaises(IndexError):
+            a[10]
+
+    # Mutator tests
+    def test_compact(self):
+        a = self.class_type([1,2,3,4,5])
+        a.pop(0)
+        a.pop(2)
+        a.insert(1, 6)
+        a.compact()
+        self.assertTrue(str(a) == "[2, 6, 3, 5]")
+        self.assertTrue(a.free == -1)
+        self.assertTrue(a.head == 0 and a.tail == 3)
+        self.assertTrue(list(a.next_index) == [1, 2, 3, -1])
+
+    def test_free_list(self):
+        a = self.class_type([1,2,3])
+        a.pop(1)
+        a.pop(0)
+        a.append(4)
+        a.append(5)
+        self.assertTrue(a.data.size() == 3)
+        self.assertTrue(str(a) == "[3, 4, 5]")
+
+    def test_pickle(self):
+        a = self.class_type(range(20000), typecode = 'q')
+        a.reverse()
+        b = pickle.loads(pickle.dumps(a))
+        self.assertTrue(a == b)
+        self.assertTrue(b[0] == 19999)
+
+    def test_typecode(self):
+        a = self.class_type([3,1,2], typecode = 'i')
+        a.sort()
+        self.assertTrue(str(a) == "[1, 2, 3]")
+        with self.assertRaises(TypeError):
+            a.append('a')
+
+
+class TestSkipList(TestConcreteList, unittest.TestCase):
+    class_type = SkipList
+
+    # Accessor tests
+    def test_getitem_large(self):
+        a = self.class_type(seed = 1)
+        for i in range(1000):
+            a.insert(i // 2, i)
+        expected = []
+        for i in range(1000):
+            expected.insert(i // 2, i)
+        self.assertTrue([a[i] for i in range(1000)] == expected)
+        self.assertTrue(a.pop(500) == expected.pop(500))
+        self.assertTrue(list(a) == expected)
+
+    def test_irange(self):
+        a = self.class_type([5,1,4,2,3,4], keep_sorted = True)
+        self.assertTrue(list(a.irange(2, 4)) == [2, 3])
+        self.assertTrue(list(a.irange(4)) == [4, 4, 5])
+        self.assertTrue(list(a.irange(high = 2)) == [1])
+        with self.assertRaises(TypeError):
+            list(self.class_type([1]).irange(0, 1))
+
+    # Mutator tests
+    def test_sorted_mode(self):
+        a = self.class_type([5,1,3], keep_sorted = True)
+        a.add(2)
+        a.add(5)
+        self.assertTrue(str(a) == "[1, 2, 3, 5, 5]")
+        self.assertTrue(3 in a and 4 not in a)
+        self.assertTrue(a.index(5) == 3 and a.index(4) == -1)
+        a.remove(5)
+        self.assertTrue(str(a) == "[1, 2, 3, 5]" and a[3] == 5)
+        self.assertTrue(a.copy().keep_sorted)
+        self.assertTrue(str(a + self.class_type([4], True)) == "[1, 2, 3, 4, 5]")
+        with self.assertRaises(TypeError):
+            a.insert(0, 9)
+        with self.assertRaises(TypeError):
+            a[0] = 9
+        with self.assertRaises(TypeError):
+            a.reverse()
+
+
+class TestUnrolledLinkedList(TestConcreteList, unittest.TestCase):
+    class_type = UnrolledLinkedList
+
+    # Constructor test
+    def test_block_size(self):
+        with self.assertRaises(ValueError):
+            self.class_type(block_size = 1)
+        a = self.class_type(range(10), block_size = 4)
+        self.assertTrue(a.head.items.size() == 4 and a.tail.items.size() == 2)
+
+    # Mutator tests
+    def test_split_and_merge(self):
+        a = self.class_type(range(8), block_size = 4)
+        a.insert(1, 'a')
+        self.assertTrue(str(a.head) == "[0, 'a', 1]")
+        self.assertTrue(str(a.head.next) == "[2, 3]")
+        a.pop(3)
+        self.assertTrue(str(a.head.next) == "[3]")
+        a.pop(0)
+        a.pop(0)
+        a.pop(0)
+        a.pop(0)
+        self.assertTrue(str(a) == "[4, 5, 6, 7]" and a.head is a.tail)
+        self.assertTrue(a[3] == 7)
+
+    def test_typecode(self):
+        a = self.class_type([3,1,2], block_size = 2, typecode = 'i')
+        a.sort(reverse = True)
+        self.assertTrue(str(a) == "[3, 2, 1]")
+        with self.assertRaises(TypeError):
+            a.append('a')
+
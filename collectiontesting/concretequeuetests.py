@@ -16,6 +16,7 @@ Exports:
 
 from abstractcollectiontest import TestAbstractCollection
 from queues import ArrayQueue, DoublyLinkedQueue
+from nodes import NodePool, TwoWayNode
 import unittest
 
 class TestConcreteQueue(TestAbstractCollection):
@@ -72,3 +73,16 @@ class TestArrayQueue(TestConcreteQueue, unittest.TestCase):
 
 class TestDoublyLinkedQueue(TestConcreteQueue, unittest.TestCase):
     class_type = DoublyLinkedQueue
+
+    def test_pool(self):
+        pool = NodePool(TwoWayNode)
+        a = self.class_type(pool = pool)
+        a.add('a')
+        for i in range(10):
+            a.add(i)
+            a.pop()
+        self.assertTrue(pool.misses == 2)
+        self.assertTrue(pool.hits == 9)
+        self.assertTrue(str(a) == "[9]")
+        with self.assertRaises(TypeError):
+            self.class_type(pool = NodePool())
@@ -13,11 +13,19 @@ Exports:
 
     TestLinkedSet: Test all methods in and inherited by the LinkedSet
                    implementation of the set ADT.
+
+    TestHashSet: Test all methods in and inherited by the HashSet
+                 implementation of the set ADT.
+
+    TestIntBitSet: Test all methods in and inherited by the IntBitSet
+                   implementation of the set ADT.
 """
 
+from abstractbagtest import TestAbstractBag
 from abstractsettests import TestAbstractSet
-from concretebagtests import TestArrayBag, TestArraySortedBag, TestLinkedBag
-from sets import ArraySet, ArraySortedSet, LinkedSet
+from concretebagtests import (TestArrayBag, TestArraySortedBag, TestHashBag,
+                              TestLinkedBag)
+from sets import ArraySet, ArraySortedSet, HashSet, IntBitSet, LinkedSet
 import unittest
 
 class TestArraySet(TestAbstractSet, TestArrayBag):
@@ -94,6 +102,36 @@ class TestArraySortedSet(TestAbstractSet, TestArraySortedBag):
         self.assertTrue(len(a) == 5)
         self.assertTrue(str(a) == "{0, 1, 2, 2.5, 3}")
 
+    def test_multiset_operations(self):
+        # Sets hold one copy of each item, whatever the operation
+        a = self.class_type([3,1,1,3,1,2])
+        b = self.class_type([4,1,2,2])
+        self.assertTrue(str(a | b) == "{1, 2, 3, 4}")
+        self.assertTrue(str(a & b) == "{1, 2}")
+        self.assertTrue(str(a - b) == "{3}")
+        self.assertTrue(str(a ^ b) == "{3, 4}")
+        self.assertTrue(self.class_type([2,1]).is_subset(b))
+        self.assertFalse(a.is_subset(b))
+
+    def test_unequal_operations(self):
+        a = self.class_type([-1,500,1500,2500])
+        b = self.class_type(range(2000))
+        self.assertTrue(list(a & b) == [500,1500])
+        self.assertTrue(list(a - b) == [-1,2500])
+        self.assertTrue(len(a | b) == 2002)
+        self.assertTrue(len(a ^ b) == 2000)
+        self.assertTrue((a & b).is_subset(b))
+        self.assertFalse(a.is_subset(b))
+
+    def test_add_all(self):
+        a = self.class_type([5,1])
+        a.add_all([3,1,7,3])
+        self.assertTrue(str(a) == "{1, 3, 5, 7}")
+        self.assertTrue(a.items.size() == 4)
+        with self.assertRaises(TypeError):
+            a.add_all([2,'a'])
+        self.assertTrue(len(a) == 4)
+
     def test_remove(self):
         a = self.class_type([1,1,6,7])
         a.remove(1)
@@ -139,3 +177,177 @@ class TestLinkedSet(TestAbstractSet, TestLinkedBag):
         self.assertTrue(str(a) == "{6, 7}")
         a.remove(7)
         self.assertTrue(str(a) == "{6}")
+
+
+class TestHashSet(TestAbstractSet, TestHashBag):
+    class_type = HashSet
+
+    # Constructor tests
+    def test_constructor(self):
+        a = self.class_type([1,4,5,1,2,3,'a','a','b',6,6,'c'])
+        self.assertTrue(self.items_of(a) == sorted("145236abc"))
+        self.assertTrue(len(a) == 9)
+        a = self.class_type()
+        self.assertTrue(str(a) == "{}")
+
+    # Accessor tests
+    def test_count(self):
+        a = self.class_type([3,1,3,'a',3])
+        self.assertTrue(a.count(3) == 1)
+        self.assertTrue(a.count(2) == 0)
+
+    def test_iterate(self):
+        a = self.class_type([1,'c','c',2,5,4,2,5,'b'])
+        self.assertTrue(self.items_of(a) == sorted("1c254b"))
+
+    def test_large_operations(self):
+        a = self.class_type(range(0, 3000, 2))
+        b = self.class_type(range(0, 3000, 3))
+        self.assertTrue(len(a | b) == 2000)
+        self.assertTrue(sorted(a & b) == list(range(0, 3000, 6)))
+        self.assertTrue(len(a - b) == 1000)
+        self.assertTrue((a & b).is_subset(b))
+        self.assertFalse(a.is_subset(a & b))
+
+    def test_most_common(self):
+        a = self.class_type("abracadabra")
+        self.assertTrue(len(a.most_common(2)) == 2)
+        self.assertTrue({count for _, count in a.most_common()} == {1})
+
+    def test_multiset_operations(self):
+        # Sets hold one copy of each item, whatever the operation
+        a = self.class_type([1,1,1,2,3,3])
+        b = self.class_type([1,2,2,4])
+        self.assertTrue(len(a | b) == 4)
+        self.assertTrue(len(a & b) == 2)
+        self.assertTrue(a - b == self.class_type([3]))
+
+    # Mutator tests
+    def test_add(self):
+        a = self.class_type()
+        for item in [1,2,1,'a','b','a',3,2]:
+            a.add(item)
+        self.assertTrue(len(a) == 5)
+        self.assertTrue(len(a.counts) == 5)
+        self.assertTrue(self.items_of(a) == ['1', '2', '3', 'a', 'b'])
+
+    def test_set_count(self):
+        a = self.class_type(['x'])
+        a.set_count('x', 4)
+        a.set_count('y', 2)
+        self.assertTrue(len(a) == 2)
+        self.assertTrue(list(a).count('x') == 1)
+        a.set_count('x', 0)
+        self.assertTrue('x' not in a)
+        self.assertTrue(len(a) == 1)
+
+    def test_remove(self):
+        a = self.class_type([1,1,6,7])
+        a.remove(1)
+        self.assertTrue(self.items_of(a) == ['6', '7'])
+        with self.assertRaises(ValueError):
+            a.remove(1)
+        self.assertTrue(len(a) == 2)
+
+
+class TestIntBitSet(TestAbstractSet, TestAbstractBag, unittest.TestCase):
+    class_type = IntBitSet
+
+    # Constructor tests
+    def test_constructor(self):
+        a = self.class_type([70,4,0,64,4,63])
+        self.assertTrue(str(a) == "{0, 4, 63, 64, 70}")
+        self.assertTrue(len(a) == 5)
+        self.assertTrue(a.words.size() == 2)
+        with self.assertRaises(TypeError):
+            self.class_type([1,'a'])
+        with self.assertRaises(ValueError):
+            self.class_type([1,-1])
+
+    # Accessor tests
+    def test_concatentation(self):
+        a = self.class_type([1,3])
+        with self.assertRaises(TypeError):
+            a + [2]
+        self.assertTrue(a + self.class_type([2,3]) == self.class_type([1,2,3]))
+
+    def test_contains(self):
+        a = self.class_type([1,3,200])
+        self.assertTrue(200 in a)
+        self.assertFalse(2 in a)
+        self.assertFalse(1000 in a)
+        self.assertFalse(-1 in a)
+        self.assertFalse('a' in a)
+        # Integral numbers of other types match, as in HashSet
+        self.assertTrue(3.0 in a and True in a)
+        self.assertFalse(3.5 in a or float('nan') in a or float('inf') in a)
+        self.assertFalse('3' in a)
+        self.assertTrue(a.count(200.0) == 1)
+        a.remove(3.0)
+        self.assertTrue(list(a) == [1,200])
+
+    def test_count(self):
+        a = self.class_type([3,1,2,3])
+        self.assertTrue(a.count(3) == 1)
+        self.assertTrue(a.count(4) == 0)
+
+    def test_iterate(self):
+        a = self.class_type([130,5,64,0,5,63])
+        self.assertTrue(list(a) == [0,5,63,64,130])
+
+    def test_word_operations(self):
+        a = self.class_type(range(0, 300, 2))
+        b = self.class_type(range(0, 150, 3))
+        self.assertTrue(list(a & b) == list(range(0, 150, 6)))
+        self.assertTrue(len(a | b) == 175)
+        self.assertTrue(list(b - a) == list(range(3, 150, 6)))
+        self.assertTrue(len(a ^ b) == 150)
+        self.assertTrue((a & b).is_subset(b))
+        self.assertFalse(b.is_subset(a))
+        # Results drop the zero words at the end
+        self.assertTrue((a - self.class_type(range(64, 300))).words.size() == 1)
+
+    def test_repr(self):
+        a = self.class_type()
+        self.assertTrue(repr(a) == "IntBitSet()")
+        a = self.class_type([5,2,3])
+        self.assertTrue(repr(a) == "IntBitSet(2, 3, 5)")
+
+    def test_str(self):
+        a = self.class_type()
+        self.assertTrue(str(a) == "{}")
+        a = self.class_type([5,1,2,3])
+        self.assertTrue(str(a) == "{1, 2, 3, 5}")
+
+    # Mutator tests
+    def test_add(self):
+        a = self.class_type()
+        a.add(129)
+        a.add(1)
+        a.add(129)
+        self.assertTrue(len(a) == 2)
+        self.assertTrue(list(a) == [1,129])
+        with self.assertRaises(TypeError):
+            a.add(1.0)
+        with self.assertRaises(ValueError):
+            a.add(-3)
+        self.assertTrue(len(a) == 2)
+
+    def test_clear(self):
+        a = self.class_type([1,100])
+        a.clear()
+        self.assertTrue(a.is_empty())
+        self.assertTrue(a == self.class_type())
+
+    def test_remove(self):
+        a = self.class_type([1,6,200])
+        a.remove(200)
+        self.assertTrue(str(a) == "{1, 6}")
+        self.assertTrue(a.words.size() == 1)
+        self.assertTrue(a == self.class_type([6,1]))
+        with self.assertRaises(ValueError):
+            a.remove(200)
+        a.remove(1)
+        a.remove(6)
+        self.assertTrue(a.is_empty())
+        self.assertTrue(a.words.size() == 0)
@@ -15,6 +15,7 @@ Exports:
 """
 
 from stacks import ArrayStack, DoublyLinkedStack
+from nodes import NodePool, TwoWayNode
 from abstractstacktest import TestAbstractStack
 import unittest
 
@@ -72,4 +73,18 @@ class TestArrayStack(TestConcreteStack, unittest.TestCase):
 
 class TestDoublyLinkedStack(TestConcreteStack, unittest.TestCase):
     class_type = DoublyLinkedStack
+
+    def test_pool(self):
+        pool = NodePool(TwoWayNode, 8)
+        a = self.class_type(pool = pool)
+        for _ in range(3):
+            a.push(1)
+            a.push(2)
+            self.assertTrue(a.pop() == 2)
+            self.assertTrue(a.pop() == 1)
+        self.assertTrue(pool.misses == 2)
+        self.assertTrue(pool.hits == 4)
+        a.push(3)
+        a.clear()
+        self.assertTrue(len(pool) == 2)
         
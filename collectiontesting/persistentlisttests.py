@@ -0,0 +1,97 @@
+"""
+Author:  Russell Gerhard
+Purpose: Create a unit testing framework for the persistent and transient
+         vectors.
+
+Exports:
+    TestPersistentVector: Test all methods in and inherited by the
+                          PersistentVector implementation.
+
+    TestTransientVector: Test all methods in and inherited by the
+                         TransientVector implementation.
+"""
+
+from persistentlists import PersistentVector, TransientVector
+import unittest
+
+class TestPersistentVector(unittest.TestCase):
+
+    # Constructor test
+    def test_constructor(self):
+        a = PersistentVector()
+        self.assertTrue(str(a) == "[]" and a.is_empty())
+        a = PersistentVector([5,1,'a'])
+        self.assertTrue(repr(a) == "PersistentVector(5, 1, a)")
+        a = PersistentVector(range(2000))
+        self.assertTrue(list(a) == list(range(2000)) and a.shift == 10)
+
+    # Accessor tests
+    def test_getitem(self):
+        a = PersistentVector(range(1100))
+        self.assertTrue(all(a[i] == i for i in range(1100)))
+        with self.assertRaises(IndexError):
+            a[1100]
+        with self.assertRaises(IndexError):
+            a[-1]
+
+    def test_hash(self):
+        a = PersistentVector([1,2,3])
+        self.assertTrue(hash(a) == hash(PersistentVector([1,2,3])))
+        self.assertTrue(a.copy() is a)
+        self.assertTrue(a + PersistentVector([4]) == PersistentVector([1,2,3,4]))
+        self.assertTrue(a.index(3) == 2 and a.index(4) == -1)
+
+    # Versioning tests
+    def test_append(self):
+        versions = [PersistentVector()]
+        for i in range(1100):
+            versions.append(versions[-1].append(i))
+        for n in (0, 32, 33, 1024, 1025, 1100):
+            self.assertTrue(list(versions[n]) == list(range(n)))
+
+    def test_pop(self):
+        a = PersistentVector(range(1057))
+        b = a
+        for n in range(1056, 990, -1):
+            b = b.pop()
+            self.assertTrue(len(b) == n and b[n - 1] == n - 1)
+        self.assertTrue(list(a) == list(range(1057)))
+        self.assertTrue(len(PersistentVector([1]).pop()) == 0)
+        with self.assertRaises(IndexError):
+            PersistentVector().pop()
+
+    def test_set(self):
+        a = PersistentVector(range(100))
+        b = a.set(5, 'a').set(99, 'b')
+        self.assertTrue(a[5] == 5 and a[99] == 99)
+        self.assertTrue(b[5] == 'a' and b[99] == 'b')
+        # Untouched leaves are shared
+        self.assertTrue(a.root.array[1] is b.root.array[1])
+        with self.assertRaises(IndexError):
+            a.set(100, 0)
+
+
+class TestTransientVector(unittest.TestCase):
+
+    def test_build(self):
+        a = TransientVector(range(70))
+        a.append(70)
+        a[3] = 'x'
+        self.assertTrue(a.pop() == 70 and len(a) == 70)
+        b = a.persistent()
+        self.assertTrue(b[3] == 'x' and list(b)[4:] == list(range(4, 70)))
+        with self.assertRaises(ValueError):
+            a.append(1)
+        with self.assertRaises(ValueError):
+            a.persistent()
+
+    def test_edit_persistent(self):
+        a = PersistentVector(range(100))
+        t = a.transient()
+        t[0] = 'a'
+        t[1] = 'b'
+        t.append(100)
+        b = t.persistent()
+        self.assertTrue(list(a) == list(range(100)))
+        self.assertTrue(list(b) == ['a', 'b'] + list(range(2, 101)))
+        self.assertTrue(a.root.array[1] is b.root.array[1])
@@ -0,0 +1,99 @@
+"""
+Author:  Russell Gerhard
+Purpose: Create a unit testing framework for the sort engine shared by the
+         list and sorted bag classes.
+
+Exports:
+    TestSorting: Test the array and linked node sorts in sorting.
+"""
+
+from random import Random
+from dynamicarray import Array
+from nodes import Node
+from sorting import (gallop_left, gallop_right, introsort, merge_sort_nodes,
+                     sort_sequence)
+import unittest
+
+class TestSorting(unittest.TestCase):
+
+    def shuffled(self, n, seed = 0):
+        items = list(range(n))
+        Random(seed).shuffle(items)
+        return items
+
+    # Accessor tests
+    def test_gallop(self):
+        items = [1,2,2,2,3,5,8]
+        less = lambda a, b: a < b
+        self.assertTrue(gallop_left(2, items, 0, 7, less) == 1)
+        self.assertTrue(gallop_right(2, items, 0, 7, less) == 4)
+        self.assertTrue(gallop_left(9, items, 0, 7, less) == 7)
+        self.assertTrue(gallop_right(0, items, 2, 7, less) == 2)
+
+    # Mutator tests
+    def test_introsort(self):
+        items = self.shuffled(1000) + [7] * 500
+        introsort(items, lambda a, b: a < b)
+        self.assertTrue(items == sorted(items))
+
+    def test_merge_sort_nodes(self):
+        head = None
+        for item in [3,1,2,5,4]:
+            head = Node(item, head)
+        head, tail = merge_sort_nodes(head, reverse = True)
+        out = []
+        while head is not None:
+            out.append(head.data)
+            head = head.next
+        self.assertTrue(out == [5,4,3,2,1])
+        self.assertTrue(tail.data == 1 and tail.next is None)
+
+    def test_merge_sort_nodes_key(self):
+        head = None
+        for item in reversed(self.shuffled(300)):
+            head = Node(item, head)
+        calls = []
+        def key(item):
+            calls.append(item)
+            return item // 10
+        head, tail = merge_sort_nodes(head, key)
+        out = []
+        while head is not None:
+            out.append(head.data)
+            head = head.next
+        # One key call per item, and equal keys keep their order
+        self.assertTrue(len(calls) == 300)
+        self.assertTrue(out == sorted(calls, key = key))
+        self.assertTrue(tail.data == out[-1])
+
+        # A failing key leaves the nodes untouched
+        head = Node(1, Node('a'))
+        with self.assertRaises(TypeError):
+            merge_sort_nodes(head, lambda item: item + 1)
+        self.assertTrue(head.data == 1 and head.next.data == 'a')
+
+    def test_sort_sequence(self):
+        for items in [[], [1], self.shuffled(2000), list(range(500, 0, -1)),
+                      list(range(300)) * 3]:
+            expected = sorted(items)
+            sort_sequence(items, len(items))
+            self.assertTrue(items == expected)
+
+    def test_sort_sequence_array(self):
+        a = Array(typecode = 'l')
+        for item in self.shuffled(100):
+            a.grow()
+            a[a.size()] = item
+        sort_sequence(a, a.size(), reverse = True, stable = False)
+        self.assertTrue(list(a) == list(range(99, -1, -1)))
+
+    def test_stable_key(self):
+        pairs = [(item % 10, item) for item in self.shuffled(1000)]
+        items = list(pairs)
+        sort_sequence(items, len(items), key = lambda pair: pair[0])
+        self.assertTrue(items == sorted(pairs, key = lambda pair: pair[0]))
+        items = list(pairs)
+        sort_sequence(items, len(items), key = lambda pair: pair[0],
+                      reverse = True)
+        self.assertTrue(items == sorted(pairs, key = lambda pair: pair[0],
+                                        reverse = True))
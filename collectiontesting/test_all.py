@@ -4,6 +4,7 @@ Purpose: This script will import all tests for all collections and run them.
 """
 
 import unittest
+import concretearraytests
 import concretelisttests
 import concretebagtests
 import concretesettests
@@ -12,6 +13,8 @@ import concretequeuetests
 import concreteBSTtests
 import concreteheaptests
 import concretedicttest
+import sortingtests
+import persistentlisttests
 
 # Initialize test suite
 loader = unittest.TestLoader()
@@ -19,6 +22,7 @@ suite = unittest.TestSuite()
 
 # Add tests to test suite
 # Sets inherit from bags, so their tests run bag tests beforehand
+suite.addTests(loader.loadTestsFromModule(concretearraytests))
 suite.addTests(loader.loadTestsFromModule(concretelisttests))
 suite.addTests(loader.loadTestsFromModule(concretebagtests))
 suite.addTests(loader.loadTestsFromModule(concretesettests))
@@ -27,6 +31,8 @@ suite.addTests(loader.loadTestsFromModule(concretequeuetests))
 suite.addTests(loader.loadTestsFromModule(concreteBSTtests))
 suite.addTests(loader.loadTestsFromModule(concreteheaptests))
 suite.addTests(loader.loadTestsFromModule(concretedicttest))
+suite.addTests(loader.loadTestsFromModule(sortingtests))
+suite.addTests(loader.loadTestsFromModule(persistentlisttests))
 
 # Initialize test runner, pass in suite and run
 runner = unittest.TextTestRunner(verbosity = 1)